@@ -11,10 +11,12 @@ See: docs/spec/HARDWARE_DETECTION.md Sections 2-5
 See: docs/spec/MIGRATION_PROTOCOL.md Section 3
 """
 
-from dataclasses import dataclass, field
+from bisect import bisect_right
+from dataclasses import dataclass
 from enum import Enum
+from functools import total_ordering
 from pathlib import Path
-from typing import Optional, List, TYPE_CHECKING
+from typing import Optional, Iterable, List, FrozenSet, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.services.hardware.storage import StorageType
@@ -31,11 +33,14 @@ class PlatformType(Enum):
     UNKNOWN = "unknown"
 
 
+@total_ordering
 class HardwareTier(Enum):
     """
     Hardware capability tiers per SPEC_v3 Section 4.5.
 
-    Determines recommended models and capabilities.
+    Determines recommended models and capabilities. Values stay strings
+    (they are persisted in hardware snapshots); tiers compare by rank, so
+    threshold checks can be written as ``tier >= HardwareTier.PROFESSIONAL``.
     """
     WORKSTATION = "workstation"   # 48GB+ - All FP16, training, multi-model
     PROFESSIONAL = "professional" # 16-24GB - All FP8, HunyuanVideo
@@ -44,6 +49,69 @@ class HardwareTier(Enum):
     ENTRY = "entry"               # 4-6GB - SD1.5, SDXL Q4
     MINIMAL = "minimal"           # <4GB or CPU only
 
+    @property
+    def rank(self) -> int:
+        """Ordinal position, 0 for MINIMAL up to 5 for WORKSTATION."""
+        return _HARDWARE_TIER_RANK[self]
+
+    def __lt__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return _HARDWARE_TIER_RANK[self] < _HARDWARE_TIER_RANK[other]
+
+
+# Minimum effective VRAM (GB) for each tier above MINIMAL, ascending.
+# _TIERS_BY_VRAM[i] covers VRAM from _TIER_VRAM_BOUNDS[i - 1] upwards.
+_TIER_VRAM_BOUNDS = (4.0, 8.0, 12.0, 16.0, 48.0)
+_TIERS_BY_VRAM = (
+    HardwareTier.MINIMAL,
+    HardwareTier.ENTRY,
+    HardwareTier.CONSUMER,
+    HardwareTier.PROSUMER,
+    HardwareTier.PROFESSIONAL,
+    HardwareTier.WORKSTATION,
+)
+_HARDWARE_TIER_RANK = {tier: rank for rank, tier in enumerate(_TIERS_BY_VRAM)}
+
+
+def classify_tiers(vram_gb: Iterable[float]) -> List[HardwareTier]:
+    """
+    Classify many effective VRAM values at once.
+
+    Uses the same thresholds as HardwareProfile.tier without constructing a
+    profile (and applying platform constraints) per candidate.
+    """
+    return [_TIERS_BY_VRAM[bisect_right(_TIER_VRAM_BOUNDS, vram)] for vram in vram_gb]
+
+
+# GGUF quantizations usable per platform. K-quants crash on MPS, so Apple
+# Silicon is limited to the legacy formats; NVIDIA/AMD allow everything.
+_ALL_GGUF_QUANTS = frozenset({"Q4_0", "Q4_K_M", "Q5_0", "Q5_K_M", "Q6_K", "Q8_0"})
+_GGUF_QUANTS_BY_PLATFORM = {
+    PlatformType.APPLE_SILICON: frozenset({"Q4_0", "Q5_0", "Q8_0"}),
+}
+
+
+# Fixed constraints per platform per SPEC_v3 Section 4.2-4.4; conditional
+# extras (small Apple Silicon, unofficial RDNA2) are appended per profile
+_PLATFORM_CONSTRAINTS = {
+    PlatformType.APPLE_SILICON: (
+        "GGUF K-quants not supported (use Q4_0, Q5_0, Q8_0)",
+        "FP8 quantization not available",
+        "Flash Attention not available",
+        "BF16 not hardware-accelerated",
+    ),
+    PlatformType.LINUX_ROCM: (
+        "Marked as experimental",
+        "Some CUDA-specific ComfyUI nodes unavailable",
+    ),
+}
+# NVIDIA GPUs below compute capability 8.0
+_PRE_AMPERE_CONSTRAINTS = (
+    "Flash Attention unavailable (Turing architecture)",
+    "BF16 not supported - using FP16",
+)
+
 
 class ThermalState(Enum):
     """GPU thermal state classification."""
@@ -65,6 +133,19 @@ class CPUTier(Enum):
     MINIMAL = "minimal"   # <4 physical cores - offload not viable
 
 
+# _CPU_TIERS_BY_CORES[i] covers core counts from _CPU_TIER_CORE_BOUNDS[i - 1] up.
+_CPU_TIER_CORE_BOUNDS = (4, 8, 16)
+_CPU_TIERS_BY_CORES = (CPUTier.MINIMAL, CPUTier.LOW, CPUTier.MEDIUM, CPUTier.HIGH)
+
+
+def classify_cpu_tier(physical_cores: int) -> CPUTier:
+    """
+    Map a physical core count to its CPUTier.
+    Per HARDWARE_DETECTION.md Section 3.3.
+    """
+    return _CPU_TIERS_BY_CORES[bisect_right(_CPU_TIER_CORE_BOUNDS, physical_cores)]
+
+
 class StorageTier(Enum):
     """
     Storage speed tiers per HARDWARE_DETECTION.md Section 4.3.
@@ -76,7 +157,7 @@ class StorageTier(Enum):
     SLOW = "slow"         # HDD - significant performance impact
 
 
-@dataclass
+@dataclass(slots=True)
 class CPUProfile:
     """
     CPU detection profile per HARDWARE_DETECTION.md Section 3.
@@ -105,15 +186,7 @@ class CPUProfile:
         Calculate CPU tier based on physical core count.
         Per HARDWARE_DETECTION.md Section 3.3.
         """
-        cores = self.physical_cores
-        if cores >= 16:
-            return CPUTier.HIGH
-        elif cores >= 8:
-            return CPUTier.MEDIUM
-        elif cores >= 4:
-            return CPUTier.LOW
-        else:
-            return CPUTier.MINIMAL
+        return classify_cpu_tier(self.physical_cores)
 
     @property
     def can_offload(self) -> bool:
@@ -129,7 +202,7 @@ class CPUProfile:
         return self.supports_avx2
 
 
-@dataclass
+@dataclass(slots=True)
 class StorageProfile:
     """
     Storage detection profile per HARDWARE_DETECTION.md Section 4.
@@ -190,7 +263,7 @@ class StorageProfile:
         return size_mb / self.estimated_read_mbps
 
 
-@dataclass
+@dataclass(slots=True)
 class RAMProfile:
     """
     RAM detection profile per HARDWARE_DETECTION.md Section 5.
@@ -220,7 +293,7 @@ class RAMProfile:
         return self.usable_for_offload_gb >= model_ram_requirement_gb
 
 
-@dataclass
+@dataclass(slots=True)
 class FormFactorProfile:
     """
     Form factor profile per HARDWARE_DETECTION.md Section 2.
@@ -252,7 +325,7 @@ class FormFactorProfile:
         return None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HardwareProfile:
     """
     Comprehensive hardware profile per SPEC_v3 Section 4.5.
@@ -260,6 +333,9 @@ class HardwareProfile:
     Generated by platform-specific detectors. Used by recommendation
     engine for constraint satisfaction and model filtering.
 
+    Immutable: detect_hardware() shares one instance per process, so use
+    dataclasses.replace() to derive a modified profile.
+
     Phase 1 Week 2a: Extended with nested profiles for CPU, Storage, RAM,
     and FormFactor detection per HARDWARE_DETECTION.md.
     """
@@ -307,14 +383,16 @@ class HardwareProfile:
     tier: HardwareTier = HardwareTier.MINIMAL
     thermal_state: ThermalState = ThermalState.UNKNOWN
 
-    # Warnings/constraints for UI display
-    warnings: List[str] = field(default_factory=list)
-    platform_constraints: List[str] = field(default_factory=list)
+    # Warnings/constraints for UI display (detectors may pass a list)
+    warnings: Tuple[str, ...] = ()
+    platform_constraints: Tuple[str, ...] = ()
 
     def __post_init__(self):
-        """Auto-calculate tier if not set."""
+        """Freeze warnings and auto-calculate tier if not set."""
+        if not isinstance(self.warnings, tuple):
+            object.__setattr__(self, "warnings", tuple(self.warnings))
         if self.tier == HardwareTier.MINIMAL:
-            self.tier = self._calculate_tier()
+            object.__setattr__(self, "tier", self._calculate_tier())
         self._apply_platform_constraints()
 
     def _calculate_tier(self) -> HardwareTier:
@@ -322,50 +400,25 @@ class HardwareProfile:
         Calculate hardware tier based on effective VRAM.
         Per SPEC_v3 Section 4.5.
         """
-        vram = self.vram_gb
-
-        if vram >= 48:
-            return HardwareTier.WORKSTATION
-        elif vram >= 16:
-            return HardwareTier.PROFESSIONAL
-        elif vram >= 12:
-            return HardwareTier.PROSUMER
-        elif vram >= 8:
-            return HardwareTier.CONSUMER
-        elif vram >= 4:
-            return HardwareTier.ENTRY
-        else:
-            return HardwareTier.MINIMAL
+        return _TIERS_BY_VRAM[bisect_right(_TIER_VRAM_BOUNDS, self.vram_gb)]
 
     def _apply_platform_constraints(self):
         """Apply platform-specific constraints per SPEC_v3 Section 4.2-4.4."""
-        if self.platform == PlatformType.APPLE_SILICON:
-            self.platform_constraints = [
-                "GGUF K-quants not supported (use Q4_0, Q5_0, Q8_0)",
-                "FP8 quantization not available",
-                "Flash Attention not available",
-                "BF16 not hardware-accelerated",
-            ]
+        constraints = _PLATFORM_CONSTRAINTS.get(self.platform)
+
+        if constraints is None:
+            if not (self.compute_capability and self.compute_capability < 8.0):
+                return
+            constraints = _PRE_AMPERE_CONSTRAINTS
+
+        elif self.platform == PlatformType.APPLE_SILICON:
             if self.vram_gb < 12:
-                self.platform_constraints.append(
-                    "HunyuanVideo excluded (~16 min/clip impractical)"
-                )
-
-        elif self.platform == PlatformType.LINUX_ROCM:
-            self.platform_constraints = [
-                "Marked as experimental",
-                "Some CUDA-specific ComfyUI nodes unavailable",
-            ]
-            if not self.officially_supported:
-                self.platform_constraints.append(
-                    f"RDNA2 workaround required: {self.hsa_override_required}"
-                )
-
-        elif self.compute_capability and self.compute_capability < 8.0:
-            self.platform_constraints = [
-                "Flash Attention unavailable (Turing architecture)",
-                "BF16 not supported - using FP16",
-            ]
+                constraints += ("HunyuanVideo excluded (~16 min/clip impractical)",)
+
+        elif not self.officially_supported:
+            constraints += (f"RDNA2 workaround required: {self.hsa_override_required}",)
+
+        object.__setattr__(self, "platform_constraints", constraints)
 
     @property
     def can_run_fp8(self) -> bool:
@@ -377,18 +430,14 @@ class HardwareProfile:
         """Check if HunyuanVideo is practical on this hardware."""
         # Excluded for Apple Silicon < Professional tier
         if self.platform == PlatformType.APPLE_SILICON:
-            return self.tier in (HardwareTier.WORKSTATION, HardwareTier.PROFESSIONAL)
+            return self.tier >= HardwareTier.PROFESSIONAL
         # NVIDIA/AMD: Need at least 12GB
         return self.vram_gb >= 12
 
     @property
-    def allowed_gguf_quants(self) -> List[str]:
+    def allowed_gguf_quants(self) -> FrozenSet[str]:
         """Return allowed GGUF quantization types for this platform."""
-        if self.platform == PlatformType.APPLE_SILICON:
-            # K-quants crash on MPS
-            return ["Q4_0", "Q5_0", "Q8_0"]
-        # All quantizations available on NVIDIA/AMD
-        return ["Q4_0", "Q4_K_M", "Q5_0", "Q5_K_M", "Q6_K", "Q8_0"]
+        return _GGUF_QUANTS_BY_PLATFORM.get(self.platform, _ALL_GGUF_QUANTS)
 
     @property
     def ram_gb(self) -> float:
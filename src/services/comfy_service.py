@@ -8,6 +8,37 @@ from src.schemas.installation import InstallationItem
 from src.config.manager import config_manager
 from src.utils.logger import log
 
+# Model weight file extensions listed by get_installed_models()
+_MODEL_EXTENSIONS = frozenset({'.safetensors', '.ckpt', '.gguf', '.pth'})
+
+
+def _scan_model_files(directory: str) -> List[str]:
+    """
+    Recursively list model file names under directory.
+
+    Walks with os.scandir so file/dir checks use the cached directory entry
+    type instead of a stat() per path. Symlinked directories are not
+    descended into (matching Path.glob("**")), so link cycles cannot loop.
+    """
+    names = []
+    pending = [directory]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file() and os.path.splitext(entry.name)[1] in _MODEL_EXTENSIONS:
+                        names.append(entry.name)
+                except OSError:
+                    continue  # e.g. a broken or looping symlink
+    return names
+
+
 class ComfyService:
     
     @staticmethod
@@ -194,13 +225,9 @@ class ComfyService:
             return result
             
         for category in ["checkpoints", "unet", "loras", "vae", "controlnet"]:
-            cat_dir = models_dir / category
-            if cat_dir.exists():
-                # List files recursively or just top level? Comfy supports subfolders.
-                files = [f.name for f in cat_dir.glob("**/*") if f.is_file() and f.suffix in {'.safetensors', '.ckpt', '.gguf', '.pth'}]
-                result[category] = files
-            else:
-                result[category] = []
+            # Comfy supports subfolders, so list recursively; a missing
+            # category directory simply yields no files
+            result[category] = _scan_model_files(str(models_dir / category))
                 
         return result
     
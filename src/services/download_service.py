@@ -7,11 +7,19 @@ Per SPEC_v3 Section 11.4: Handle model downloads with retry, progress, and verif
 import os
 import time
 import hashlib
+import heapq
+import itertools
+import mmap
+import threading
+from collections import OrderedDict
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
-from typing import Optional, Callable, List
+from typing import Optional, Callable, Dict, List, Tuple
 from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait
 from src.utils.logger import log
 from src.config.manager import config_manager
 from src.services.database.engine import db_manager
@@ -33,7 +41,7 @@ class DownloadTimeoutError(DownloadError):
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DownloadTask:
     """Represents a download task for queue processing."""
     url: str
@@ -42,7 +50,7 @@ class DownloadTask:
     priority: int = 0  # Lower = higher priority
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DownloadResult:
     """Result of a download operation."""
     url: str
@@ -52,15 +60,61 @@ class DownloadResult:
     bytes_downloaded: int = 0
 
 
+# Model hashes are published as SHA256, so the digest algorithm is fixed.
+# hashlib delegates to OpenSSL, which uses SHA-NI/ARMv8 crypto extensions
+# where the CPU supports them.
+HASH_ALGORITHM = "sha256"
+
+# Read size for hashing; large blocks keep OpenSSL's accelerated compression
+# busy instead of paying Python call overhead every 8 KB
+HASH_BLOCK_SIZE = 1024 * 1024
+
+# Files larger than this are hashed through a read-only memory map in a
+# single update() call (hashlib releases the GIL for the whole buffer)
+MMAP_HASH_THRESHOLD = 64 * 1024 * 1024
+
+
+def _new_hasher():
+    """Create a fresh hasher for HASH_ALGORITHM."""
+    return hashlib.new(HASH_ALGORITHM)
+
+
+def _update_hash_from_file(hasher, file_path: str) -> None:
+    """
+    Feed the contents of file_path into hasher.
+
+    Large files are memory-mapped and hashed in one call, letting the
+    kernel handle readahead. Smaller files (or filesystems that cannot be
+    mapped) read into one reusable buffer (unbuffered, so no intermediate
+    copy) rather than allocating a new bytes object per block.
+    """
+    with open(file_path, "rb", buffering=0) as f:
+        if os.fstat(f.fileno()).st_size > MMAP_HASH_THRESHOLD:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    if hasattr(mapped, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                        mapped.madvise(mmap.MADV_SEQUENTIAL)
+                    hasher.update(mapped)
+                return
+            except (OSError, ValueError):
+                pass  # Fall back to buffered reads
+
+        buffer = bytearray(HASH_BLOCK_SIZE)
+        view = memoryview(buffer)
+        while True:
+            n = f.readinto(buffer)
+            if not n:
+                break
+            hasher.update(view[:n])
+
+
 def _verify_hash_worker(file_path: str, expected_hash: str) -> bool:
     """
     Standalone worker function for multiprocess hash verification.
     """
-    sha256 = hashlib.sha256()
+    sha256 = _new_hasher()
     try:
-        with open(file_path, "rb") as f:
-            for block in iter(lambda: f.read(8192), b""):
-                sha256.update(block)
+        _update_hash_from_file(sha256, file_path)
 
         actual_hash = sha256.hexdigest().lower()
         return actual_hash == expected_hash.lower()
@@ -68,6 +122,88 @@ def _verify_hash_worker(file_path: str, expected_hash: str) -> bool:
         return False
 
 
+def _preallocate_file(path: str, size: int) -> None:
+    """
+    Create (or truncate) path and size it to exactly size bytes.
+
+    Uses posix_fallocate where available so the filesystem reserves the
+    blocks up front (fewer extents, early out-of-space failure); elsewhere
+    the file is extended sparsely with truncate().
+    """
+    with open(path, "wb") as f:
+        if size > 0 and hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(f.fileno(), 0, size)
+                return
+            except OSError as e:
+                # e.g. filesystems without fallocate support
+                log.debug(f"posix_fallocate unavailable for {path}: {e}")
+        f.truncate(size)
+
+
+def _parse_content_range(value: str) -> Tuple[int, int]:
+    """Parse a 'bytes start-end/total' Content-Range value into (start, end)."""
+    span = value.strip().split(" ", 1)[1].split("/", 1)[0]
+    start, end = span.split("-", 1)
+    return int(start), int(end)
+
+
+def _split_byteranges(body: bytes, boundary: str) -> Dict[Tuple[int, int], bytes]:
+    """
+    Split a multipart/byteranges body into {(start, end): data}.
+
+    Per RFC 9110 each part carries its own Content-Range header.
+    """
+    parts = {}
+    delimiter = b"--" + boundary.encode("latin-1")
+    for section in body.split(delimiter)[1:]:
+        if section.startswith(b"--"):
+            break  # Closing delimiter
+        head, _, data = section.partition(b"\r\n\r\n")
+        content_range = None
+        for line in head.split(b"\r\n"):
+            name, _, value = line.partition(b":")
+            if name.strip().lower() == b"content-range":
+                content_range = value.decode("latin-1")
+        if content_range is None:
+            raise DownloadError("multipart/byteranges part without Content-Range")
+        # The CRLF before the next delimiter belongs to the delimiter
+        if data.endswith(b"\r\n"):
+            data = data[:-2]
+        parts[_parse_content_range(content_range)] = data
+    return parts
+
+
+class _QueueRun:
+    """Scheduling state for one download_queue call."""
+
+    __slots__ = ("pending", "lock", "counter", "active_workers", "results", "unsynced")
+
+    def __init__(self) -> None:
+        # Priority heap of (priority, sequence, task) shared by the run's workers
+        self.pending: List[Tuple[int, int, DownloadTask]] = []
+        self.lock = threading.Lock()
+        self.counter = itertools.count()
+        self.active_workers = 0
+        self.results: List[DownloadResult] = []
+        self.unsynced: List[str] = []  # Completed files awaiting a batch sync
+
+    def push(self, task: DownloadTask) -> None:
+        """Add a task to the heap; caller holds lock."""
+        heapq.heappush(self.pending, (task.priority, next(self.counter), task))
+
+
+def _sync_file(path: str) -> None:
+    """Flush a file's data to disk (fdatasync where available)."""
+    sync = getattr(os, "fdatasync", os.fsync)
+    # Write access is required for FlushFileBuffers on Windows
+    fd = os.open(path, os.O_RDWR | getattr(os, "O_BINARY", 0))
+    try:
+        sync(fd)
+    finally:
+        os.close(fd)
+
+
 class DownloadService:
     """
     Handles file downloads with progress tracking, retry logic, and validation.
@@ -84,22 +220,387 @@ class DownloadService:
 
     MAX_RETRIES = 3
     RETRY_DELAY_BASE = 2  # Exponential backoff base (2^attempt seconds)
-    CHUNK_SIZE = 1024 * 1024  # 1MB chunks
+    RETRY_BACKOFF_FACTOR = 0.5  # Session-level retry backoff (0.5s, 1s, 2s, ...)
+    RETRY_STATUS_CODES = (500, 502, 503, 504)  # Retried by the adapter for HEAD only
+    MAX_RETRY_AFTER = 60  # Cap on a server's Retry-After wait, in seconds
+    CHUNK_SIZE = 1024 * 1024  # 1MB chunks (initial size, before any measurement)
+    MIN_CHUNK_SIZE = 64 * 1024  # Adaptive chunk size bounds
+    MAX_CHUNK_SIZE = 16 * 1024 * 1024
+    TARGET_CHUNKS_PER_SECOND = 10  # Keeps progress updates ~10/s
+    MIN_MEASURE_SECONDS = 1.0  # Shorter streams are too noisy to measure
+    PROBE_CACHE_TTL = 300  # seconds to reuse a HEAD probe's size/range info
+    PROBE_CACHE_SIZE = 256  # URLs remembered; least recently used drop first
     DEFAULT_TIMEOUT = 30  # seconds per request
+    PREWARM_TIMEOUT = 3  # seconds to spend warming connections before a queue
     MAX_CONCURRENT = 3  # Max concurrent downloads
+    MAX_PARTS = 8  # Max parallel byte-range streams for a single file
+    MULTIPART_MIN_SIZE = 64 * 1024 * 1024  # Smaller files use one stream
+    MULTIPART_PART_SIZE = 8 * 1024 * 1024  # Minimum bytes per range part
+    RANGE_FALLBACK_MAX = 64 * 1024 * 1024  # Max prefix read when ranges are ignored
+
+    _session: Optional[requests.Session] = None
+    _session_lock = threading.Lock()
+    _measured_bps: Optional[float] = None  # Throughput of the last long stream
+    # url -> (content length, accepts byte ranges, probe time), LRU order
+    _probe_cache: "OrderedDict[str, Tuple[Optional[int], bool, float]]" = OrderedDict()
+    _probe_lock = threading.Lock()
+
+    # Durability modes for files completed by download_queue:
+    # "off" leaves flushing to the OS, "per_file" syncs each file before it
+    # is marked completed, "batch" syncs all of a run's files once at the end
+    SYNC_MODES = ("off", "per_file", "batch")
+
+    def __init__(self, sync_mode: str = "off"):
+        """
+        Initialize download service and persistent queue.
 
-    def __init__(self):
-        """Initialize download service and persistent queue."""
+        Args:
+            sync_mode: One of SYNC_MODES; controls how completed queue
+                downloads are flushed to disk.
+        """
+        if sync_mode not in self.SYNC_MODES:
+            raise ValueError(
+                f"Invalid sync_mode {sync_mode!r}; expected one of {self.SYNC_MODES}"
+            )
+        self.sync_mode = sync_mode
         self._executor = None
+        # Active download_queue runs, oldest first; each has its own heap
+        self._runs: List[_QueueRun] = []
+        self._runs_lock = threading.Lock()
         db_manager.init_db()
 
+    @staticmethod
+    def _retry_policy() -> Retry:
+        """
+        Build the urllib3 retry policy for the shared session.
+
+        Only HEAD probes are retried here, on transient 5xx statuses with
+        exponential backoff (plus jitter where urllib3 supports it). GETs
+        get no adapter retries: fetch_file's own loop is their single retry
+        layer, since only it can resume a partly written file and cap a
+        server's Retry-After. Connection retries are disabled because
+        urllib3 applies them to every method.
+        """
+        options = dict(
+            total=DownloadService.MAX_RETRIES,
+            connect=0,
+            backoff_factor=DownloadService.RETRY_BACKOFF_FACTOR,
+            status_forcelist=DownloadService.RETRY_STATUS_CODES,
+            allowed_methods=frozenset({"HEAD"}),
+            # urllib3 does not cap Retry-After; fetch_file handles 429s
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        )
+        try:
+            return Retry(backoff_jitter=DownloadService.RETRY_BACKOFF_FACTOR, **options)
+        except TypeError:
+            # urllib3 < 2.0 has no backoff_jitter
+            return Retry(**options)
+
+    @staticmethod
+    def _get_session() -> requests.Session:
+        """
+        Get the shared HTTP session, creating it on first use.
+
+        Every download, range part and probe goes through this session, so
+        requests to the same host (queue tasks, range parts) reuse pooled
+        keep-alive TCP/TLS connections instead of handshaking per request.
+        Transient HEAD failures are retried by the adapter's urllib3 Retry
+        policy; downloads retry in fetch_file.
+        """
+        if DownloadService._session is None:
+            with DownloadService._session_lock:
+                if DownloadService._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=DownloadService.MAX_CONCURRENT,
+                        # Enough per-host connections for a full queue of
+                        # concurrent multi-part downloads
+                        pool_maxsize=DownloadService.MAX_CONCURRENT * DownloadService.MAX_PARTS,
+                        max_retries=DownloadService._retry_policy(),
+                    )
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    DownloadService._session = session
+        return DownloadService._session
+
+    @staticmethod
+    def _chunk_size_for_rate(bytes_per_second: Optional[float]) -> int:
+        """
+        Pick a streaming chunk size for the given throughput.
+
+        Aims for TARGET_CHUNKS_PER_SECOND chunks: fast links get large
+        chunks (less per-chunk Python work), slow links get small ones (a
+        chunk never stalls progress updates), clamped to the size bounds.
+        """
+        if not bytes_per_second:
+            return DownloadService.CHUNK_SIZE
+        chunk_size = int(bytes_per_second / DownloadService.TARGET_CHUNKS_PER_SECOND)
+        return max(
+            DownloadService.MIN_CHUNK_SIZE,
+            min(chunk_size, DownloadService.MAX_CHUNK_SIZE),
+        )
+
+    @staticmethod
+    def _record_throughput(num_bytes: int, elapsed: float) -> None:
+        """Remember stream throughput to size the next download's chunks."""
+        if elapsed >= DownloadService.MIN_MEASURE_SECONDS:
+            DownloadService._measured_bps = num_bytes / elapsed
+
+    @staticmethod
+    def _auth_headers(url: str) -> dict:
+        """Build request headers carrying credentials for the URL's host."""
+        headers = {}
+
+        # Hugging Face Auth
+        if "huggingface.co" in url:
+            token = config_manager.get_secure("HF_TOKEN")
+            if token:
+                headers["Authorization"] = f"Bearer {token}"
+
+        return headers
+
+    @staticmethod
+    def _probe(url: str, timeout: int) -> Tuple[Optional[int], bool]:
+        """
+        HEAD the URL for its size and byte-range support.
+
+        Successful probes are cached for PROBE_CACHE_TTL seconds, so sizing
+        a batch and then downloading it does not repeat the round-trip.
+        Expired entries are dropped when looked up, and at most
+        PROBE_CACHE_SIZE URLs are kept.
+
+        Returns:
+            (content length or None, whether byte ranges are accepted)
+
+        Raises:
+            requests.exceptions.RequestException: On network/HTTP failure
+        """
+        cache = DownloadService._probe_cache
+        with DownloadService._probe_lock:
+            cached = cache.get(url)
+            if cached is not None:
+                if time.monotonic() - cached[2] < DownloadService.PROBE_CACHE_TTL:
+                    cache.move_to_end(url)
+                    return cached[0], cached[1]
+                del cache[url]
+
+        response = DownloadService._get_session().head(
+            url,
+            headers=DownloadService._auth_headers(url),
+            allow_redirects=True,
+            timeout=timeout
+        )
+        response.raise_for_status()
+
+        content_length = response.headers.get("content-length")
+        size = int(content_length) if content_length else None
+        accepts_ranges = response.headers.get("accept-ranges", "").lower() == "bytes"
+        with DownloadService._probe_lock:
+            cache[url] = (size, accepts_ranges, time.monotonic())
+            cache.move_to_end(url)
+            while len(cache) > DownloadService.PROBE_CACHE_SIZE:
+                cache.popitem(last=False)
+        return size, accepts_ranges
+
+    @staticmethod
+    def clear_probe_cache() -> None:
+        """Forget cached HEAD probe results."""
+        with DownloadService._probe_lock:
+            DownloadService._probe_cache.clear()
+
+    @staticmethod
+    def _probe_range_support(url: str, timeout: int) -> Optional[int]:
+        """
+        Return the file size if the server accepts byte-range requests.
+
+        Returns None when the size is unknown or ranges are not supported.
+        """
+        try:
+            size, accepts_ranges = DownloadService._probe(url, timeout)
+        except requests.exceptions.RequestException as e:
+            log.debug(f"Range probe failed for {url}: {e}")
+            return None
+
+        return size if accepts_ranges else None
+
+    @staticmethod
+    def _download_parts(
+        url: str,
+        temp_path: str,
+        total_size: int,
+        headers: dict,
+        parts: int,
+        progress_callback: Optional[Callable[[int, int], None]],
+        timeout: int,
+    ) -> None:
+        """
+        Fetch a file as concurrent byte ranges written at their offsets.
+
+        Each part writes through its own file handle positioned at the
+        part's start offset, so parts never contend on a shared position.
+        A part must come back with the requested Content-Range and exactly
+        that many bytes; the first failing part stops the others.
+
+        Raises:
+            DownloadError: If the server does not honour a range request
+                or a part is short
+            requests.exceptions.RequestException: On network failure
+        """
+        part_size = max(
+            -(-total_size // parts), DownloadService.MULTIPART_PART_SIZE
+        )
+        ranges = [
+            (start, min(start + part_size, total_size) - 1)
+            for start in range(0, total_size, part_size)
+        ]
+
+        # Size the file up front so every part can seek to its offset
+        _preallocate_file(temp_path, total_size)
+
+        lock = threading.Lock()
+        cancel = threading.Event()
+        downloaded = 0
+        chunk_size = DownloadService._chunk_size_for_rate(DownloadService._measured_bps)
+
+        def fetch_part(start: int, end: int) -> None:
+            nonlocal downloaded
+            if cancel.is_set():
+                return
+            expected = end - start + 1
+            part_headers = dict(headers, Range=f"bytes={start}-{end}")
+            with DownloadService._get_session().get(
+                url, headers=part_headers, stream=True, timeout=timeout
+            ) as response:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    raise DownloadError(f"Server ignored range request for {url}")
+                try:
+                    served = _parse_content_range(response.headers["content-range"])
+                except (KeyError, IndexError, ValueError):
+                    served = None
+                if served != (start, end):
+                    raise DownloadError(
+                        f"Server returned range {served} for bytes {start}-{end} of {url}"
+                    )
+
+                written = 0
+                with open(temp_path, "r+b") as f:
+                    f.seek(start)
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        if cancel.is_set():
+                            return
+                        if not chunk:
+                            continue
+                        written += len(chunk)
+                        if written > expected:
+                            raise DownloadError(f"Part {start}-{end} of {url} overran its range")
+                        f.write(chunk)
+                        if progress_callback:
+                            with lock:
+                                downloaded += len(chunk)
+                                progress_callback(downloaded, total_size)
+
+                if written != expected:
+                    raise DownloadError(
+                        f"Part {start}-{end} of {url} truncated at {written}/{expected} bytes"
+                    )
+
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = [executor.submit(fetch_part, start, end) for start, end in ranges]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                # Stop the remaining parts before the executor waits on them
+                cancel.set()
+                for future in futures:
+                    future.cancel()
+                raise
+
+    @staticmethod
+    def _try_parallel_download(
+        url: str,
+        temp_path: str,
+        parallel_parts: int,
+        progress_callback: Optional[Callable[[int, int], None]],
+        timeout: int,
+    ) -> Optional[int]:
+        """
+        Attempt a multi-part range download into temp_path.
+
+        Returns the file size on success, or None (leaving no temp file)
+        when the server or file size does not suit a parallel download, so
+        the caller falls back to a single resumable stream.
+        """
+        headers = DownloadService._auth_headers(url)
+        total_size = DownloadService._probe_range_support(url, timeout)
+        if not total_size or total_size < DownloadService.MULTIPART_MIN_SIZE:
+            return None
+
+        parts = min(parallel_parts, DownloadService.MAX_PARTS)
+        try:
+            DownloadService._download_parts(
+                url, temp_path, total_size, headers, parts,
+                progress_callback, timeout
+            )
+            return total_size
+        except (DownloadError, requests.exceptions.RequestException, OSError) as e:
+            log.warning(f"Parallel download failed for {url}, using single stream: {e}")
+            # A partially filled, pre-sized file cannot be resumed by offset
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return None
+
+    @staticmethod
+    def _finalize_download(
+        url: str,
+        temp_path: str,
+        dest_path: str,
+        expected_hash: Optional[str],
+        actual_hash: Optional[str] = None,
+    ) -> None:
+        """
+        Verify the temp file (if a hash is given) and move it into place.
+
+        Args:
+            actual_hash: Digest already computed while streaming. When
+                given, it is compared directly instead of re-reading the
+                file through verify_hash.
+
+        Raises:
+            HashMismatchError: If hash verification fails
+        """
+        if expected_hash:
+            if actual_hash is not None:
+                hash_ok = actual_hash.lower() == expected_hash.lower()
+            else:
+                hash_ok = DownloadService.verify_hash(temp_path, expected_hash)
+
+            if not hash_ok:
+                # Remove corrupt file
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+                raise HashMismatchError(
+                    f"Hash mismatch for {url}: expected {expected_hash}"
+                )
+
+        # Move temp file to final destination
+        os.replace(temp_path, dest_path)
+        log.info(f"Downloaded successfully: {dest_path}")
+
     @staticmethod
     def download_file(
         url: str,
         dest_path: str,
         progress_callback: Optional[Callable[[int, int], None]] = None,
         expected_hash: Optional[str] = None,
-        timeout: int = DEFAULT_TIMEOUT
+        timeout: int = DEFAULT_TIMEOUT,
+        parallel_parts: int = 1
     ) -> bool:
         """
         Download a file with retry logic and optional hash verification.
@@ -110,10 +611,54 @@ class DownloadService:
             progress_callback: Called with (bytes_downloaded, total_bytes)
             expected_hash: SHA256 hash to verify (optional)
             timeout: Request timeout in seconds
+            parallel_parts: Number of concurrent byte-range streams to use
+                for large files on servers that accept ranges (1 = single
+                stream). Falls back to a single stream when unsupported.
 
         Returns:
             True if successful, False otherwise
 
+        Raises:
+            HashMismatchError: If hash verification fails
+            DownloadError: If download fails after all retries
+        """
+        return DownloadService.fetch_file(
+            url,
+            dest_path,
+            progress_callback=progress_callback,
+            expected_hash=expected_hash,
+            timeout=timeout,
+            parallel_parts=parallel_parts,
+        ) is not None
+
+    @staticmethod
+    def fetch_file(
+        url: str,
+        dest_path: str,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        expected_hash: Optional[str] = None,
+        timeout: int = DEFAULT_TIMEOUT,
+        parallel_parts: int = 1
+    ) -> Optional[int]:
+        """
+        Download a file and report its size.
+
+        Same behaviour as download_file, but returns the number of bytes in
+        the completed file so callers do not need to stat it afterwards.
+
+        Args:
+            url: Source URL
+            dest_path: Destination file path
+            progress_callback: Called with (bytes_downloaded, total_bytes)
+            expected_hash: SHA256 hash to verify (optional)
+            timeout: Request timeout in seconds
+            parallel_parts: Number of concurrent byte-range streams to use
+                for large files on servers that accept ranges (1 = single
+                stream). Falls back to a single stream when unsupported.
+
+        Returns:
+            Size of the downloaded file in bytes, or None on failure
+
         Raises:
             HashMismatchError: If hash verification fails
             DownloadError: If download fails after all retries
@@ -125,15 +670,19 @@ class DownloadService:
         temp_path = str(dest) + ".tmp"
         last_error = None
 
+        if parallel_parts > 1 and not os.path.exists(temp_path):
+            total_size = DownloadService._try_parallel_download(
+                url, temp_path, parallel_parts, progress_callback, timeout
+            )
+            if total_size is not None:
+                DownloadService._finalize_download(
+                    url, temp_path, dest_path, expected_hash
+                )
+                return total_size
+
         for attempt in range(DownloadService.MAX_RETRIES):
             try:
-                headers = {}
-                
-                # Hugging Face Auth
-                if "huggingface.co" in url:
-                    token = config_manager.get_secure("HF_TOKEN")
-                    if token:
-                        headers["Authorization"] = f"Bearer {token}"
+                headers = DownloadService._auth_headers(url)
 
                 # Resume support if temp file exists
                 if os.path.exists(temp_path):
@@ -143,7 +692,7 @@ class DownloadService:
                 else:
                     current_size = 0
 
-                with requests.get(
+                with DownloadService._get_session().get(
                     url,
                     headers=headers,
                     stream=True,
@@ -151,8 +700,11 @@ class DownloadService:
                 ) as response:
                     # Handle 429 Rate Limit specifically
                     if response.status_code == 429:
-                        retry_after = int(response.headers.get("Retry-After", 5))
-                        retry_after = min(retry_after, 60) # Cap wait at 60s
+                        try:
+                            retry_after = int(response.headers.get("Retry-After", 5))
+                        except ValueError:
+                            retry_after = 5  # HTTP-date form; use the default
+                        retry_after = min(max(retry_after, 0), DownloadService.MAX_RETRY_AFTER)
                         log.warning(f"Rate limited. Waiting {retry_after}s...")
                         time.sleep(retry_after)
                         continue # Retry loop
@@ -160,7 +712,7 @@ class DownloadService:
                     # Handle 401 Unauthorized
                     if response.status_code == 401:
                         log.error(f"Authentication failed for {url}. Please check your HF_TOKEN.")
-                        return False
+                        return None
 
                     response.raise_for_status()
 
@@ -168,33 +720,42 @@ class DownloadService:
                     content_length = response.headers.get('content-length', 0)
                     total_size = int(content_length) + current_size
 
+                    # Hash while streaming so verification needs no second
+                    # full read; a resumed download hashes its prefix first
+                    hasher = None
+                    if expected_hash:
+                        hasher = _new_hasher()
+                        if current_size > 0:
+                            _update_hash_from_file(hasher, temp_path)
+
+                    # iter_content fixes the chunk size per stream, so it is
+                    # chosen from the throughput of earlier downloads
+                    chunk_size = DownloadService._chunk_size_for_rate(
+                        DownloadService._measured_bps
+                    )
+                    start_size = current_size
+                    started = time.monotonic()
+
                     mode = "ab" if current_size > 0 else "wb"
                     with open(temp_path, mode) as f:
-                        for chunk in response.iter_content(
-                            chunk_size=DownloadService.CHUNK_SIZE
-                        ):
+                        for chunk in response.iter_content(chunk_size=chunk_size):
                             if chunk:
                                 f.write(chunk)
+                                if hasher:
+                                    hasher.update(chunk)
                                 current_size += len(chunk)
                                 if progress_callback:
                                     progress_callback(current_size, total_size)
 
-                # Hash verification
-                if expected_hash:
-                    if not DownloadService.verify_hash(temp_path, expected_hash):
-                        # Remove corrupt file
-                        try:
-                            os.remove(temp_path)
-                        except OSError:
-                            pass
-                        raise HashMismatchError(
-                            f"Hash mismatch for {url}: expected {expected_hash}"
-                        )
-
-                # Move temp file to final destination
-                os.replace(temp_path, dest_path)
-                log.info(f"Downloaded successfully: {dest_path}")
-                return True
+                    DownloadService._record_throughput(
+                        current_size - start_size, time.monotonic() - started
+                    )
+
+                DownloadService._finalize_download(
+                    url, temp_path, dest_path, expected_hash,
+                    actual_hash=hasher.hexdigest() if hasher else None
+                )
+                return current_size
 
             except HashMismatchError:
                 # Don't retry hash mismatches - file is corrupt
@@ -227,7 +788,7 @@ class DownloadService:
 
         # All retries exhausted
         log.error(f"Download failed after {DownloadService.MAX_RETRIES} attempts: {url}")
-        return False
+        return None
 
     @staticmethod
     def verify_hash(file_path: str, expected_hash: str) -> bool:
@@ -256,6 +817,80 @@ class DownloadService:
             # Fallback to local check if multiprocess fails (rare)
             return _verify_hash_worker(file_path, expected_hash)
 
+    @staticmethod
+    def fetch_ranges(
+        url: str,
+        ranges: List[Tuple[int, int]],
+        timeout: int = DEFAULT_TIMEOUT
+    ) -> List[bytes]:
+        """
+        Fetch several byte ranges of a remote file in one request.
+
+        Sends a single multi-range Range header and splits the
+        multipart/byteranges reply, instead of one round-trip per range.
+        Servers that answer with a single 206 part are handled by slicing.
+        If the header is ignored (200), only the body prefix covering the
+        ranges is streamed, up to RANGE_FALLBACK_MAX bytes, so a whole model
+        is never pulled into memory.
+
+        Args:
+            url: Source URL
+            ranges: Inclusive (start, end) byte offsets
+            timeout: Request timeout in seconds
+
+        Returns:
+            Bytes for each requested range, in the order given
+
+        Raises:
+            DownloadError: If the response does not cover a requested range,
+                or ranges were ignored and the prefix exceeds the cap
+            requests.exceptions.RequestException: On network failure
+        """
+        headers = DownloadService._auth_headers(url)
+        headers["Range"] = "bytes=" + ",".join(f"{lo}-{hi}" for lo, hi in ranges)
+
+        with DownloadService._get_session().get(
+            url, headers=headers, stream=True, timeout=timeout
+        ) as response:
+            response.raise_for_status()
+
+            if response.status_code != 206:
+                # Range ignored: the body is the whole file, so read only
+                # as far as the last requested byte
+                needed = max(hi for _, hi in ranges) + 1
+                if needed > DownloadService.RANGE_FALLBACK_MAX:
+                    raise DownloadError(
+                        f"Server ignored range request for {url}; "
+                        f"refusing to read {needed} bytes"
+                    )
+                body = bytearray()
+                for chunk in response.iter_content(
+                    chunk_size=min(needed, DownloadService.CHUNK_SIZE)
+                ):
+                    body += chunk
+                    if len(body) >= needed:
+                        break
+                return [bytes(body[lo:hi + 1]) for lo, hi in ranges]
+
+            body = response.content
+
+        content_type = response.headers.get("content-type", "")
+        if content_type.lower().startswith("multipart/byteranges"):
+            boundary = content_type.split("boundary=", 1)[1].strip().strip('"')
+            parts = _split_byteranges(body, boundary)
+        else:
+            parts = {_parse_content_range(response.headers["content-range"]): body}
+
+        results = []
+        for lo, hi in ranges:
+            for (start, end), data in parts.items():
+                if start <= lo and hi <= end:
+                    results.append(data[lo - start:hi - start + 1])
+                    break
+            else:
+                raise DownloadError(f"Server response for {url} is missing bytes {lo}-{hi}")
+        return results
+
     @staticmethod
     def get_file_size(url: str, timeout: int = 10) -> Optional[int]:
         """
@@ -271,12 +906,9 @@ class DownloadService:
         Per ARCHITECTURE_PRINCIPLES: Explicit failure, no silent exceptions.
         """
         try:
-            response = requests.head(url, allow_redirects=True, timeout=timeout)
-            response.raise_for_status()
-
-            content_length = response.headers.get('content-length')
-            if content_length:
-                return int(content_length)
+            size, _ = DownloadService._probe(url, timeout)
+            if size is not None:
+                return size
 
             log.debug(f"No content-length header for {url}")
             return None
@@ -356,6 +988,27 @@ class DownloadService:
         finally:
             session.close()
 
+    def enqueue(self, task: DownloadTask) -> bool:
+        """
+        Add a task to the running download_queue.
+
+        The task is scheduled by priority against the tasks still waiting
+        in the most recently started run, so an urgent download can jump
+        ahead of a bulk batch. Its result is returned by that run.
+
+        Returns:
+            True if a queue run accepted the task, False if no run is
+            active (call download_queue instead)
+        """
+        with self._runs_lock:
+            runs = list(reversed(self._runs))
+        for run in runs:
+            with run.lock:
+                if run.active_workers > 0:
+                    run.push(task)
+                    return True
+        return False
+
     def download_queue(
         self,
         tasks: List[DownloadTask],
@@ -365,6 +1018,11 @@ class DownloadService:
         """
         Download multiple files concurrently.
 
+        Workers pull the highest-priority waiting task from a heap each time
+        they finish one, so tasks added with enqueue() while the queue runs
+        are ordered against the remaining work. Each call schedules its own
+        heap, so concurrent calls on one service never mix their results.
+
         Args:
             tasks: List of DownloadTask objects
             progress_callback: Called with (url, bytes_downloaded, total_bytes)
@@ -373,42 +1031,113 @@ class DownloadService:
         Returns:
             List of DownloadResult objects
         """
-        results = []
-
-        # Sort by priority (lower = higher priority)
-        sorted_tasks = sorted(tasks, key=lambda t: t.priority)
-
-        with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
-            futures = {}
+        run = _QueueRun()
+
+        def make_callback(task_url):
+            def callback(downloaded, total):
+                progress_callback(task_url, downloaded, total)
+            return callback
+
+        def worker():
+            while True:
+                with run.lock:
+                    if not run.pending:
+                        run.active_workers -= 1
+                        return
+                    # Lower priority value = higher priority
+                    _, _, task = heapq.heappop(run.pending)
 
-            for task in sorted_tasks:
-                def make_callback(task_url):
-                    def callback(downloaded, total):
-                        if progress_callback:
-                            progress_callback(task_url, downloaded, total)
-                    return callback
-
-                future = executor.submit(
-                    self._download_task,
-                    task,
-                    make_callback(task.url)
-                )
-                futures[future] = task
-
-            for future in as_completed(futures):
-                task = futures[future]
                 try:
-                    result = future.result()
-                    results.append(result)
+                    # Without a queue-level callback, pass None so download_file
+                    # skips the per-chunk callback call entirely
+                    result = self._download_task(
+                        task,
+                        make_callback(task.url) if progress_callback else None
+                    )
                 except Exception as e:
-                    results.append(DownloadResult(
+                    result = DownloadResult(
                         url=task.url,
                         dest_path=task.dest_path,
                         success=False,
                         error=str(e)
-                    ))
+                    )
+                with run.lock:
+                    run.results.append(result)
+                    if result.success and self.sync_mode == "batch":
+                        run.unsynced.append(task.dest_path)
+
+        DownloadService._prewarm_hosts(
+            [task.url for task in sorted(tasks, key=lambda t: t.priority)]
+        )
+
+        with run.lock:
+            for task in tasks:
+                run.push(task)
+            worker_count = min(max_concurrent, len(run.pending))
+            run.active_workers = worker_count
+
+        with self._runs_lock:
+            self._runs.append(run)
+        try:
+            with ThreadPoolExecutor(max_workers=max(worker_count, 1)) as executor:
+                for _ in range(worker_count):
+                    executor.submit(worker)
+        finally:
+            with self._runs_lock:
+                self._runs.remove(run)
 
-        return results
+        if self.sync_mode == "batch":
+            self._sync_completed(run.unsynced)
+
+        return run.results
+
+    @staticmethod
+    def _prewarm_hosts(urls: List[str]) -> None:
+        """
+        Open pooled connections to the first hosts in a queue up front.
+
+        With tasks spread over several hosts, the DNS lookups and TLS
+        handshakes otherwise happen one worker at a time as each host is
+        first reached. The first file on each host is probed in parallel
+        (an authenticated HEAD of the real URL, whose size is then cached),
+        leaving a keep-alive connection in the shared session's pool. Only
+        as many hosts as the session keeps pools for (MAX_CONCURRENT) are
+        warmed, since later ones would evict them. Waits at most
+        PREWARM_TIMEOUT; failures are ignored since the download itself
+        will report them.
+        """
+        # First URL per origin, in the order given
+        first_urls: Dict[str, str] = {}
+        for url in urls:
+            parts = urlsplit(url)
+            if parts.netloc:
+                first_urls.setdefault(f"{parts.scheme}://{parts.netloc}", url)
+        # A single host gains nothing: the first downloads connect in parallel
+        if len(first_urls) < 2:
+            return
+        targets = list(first_urls.values())[:DownloadService.MAX_CONCURRENT]
+
+        def warm(url: str) -> None:
+            try:
+                DownloadService._probe(url, DownloadService.PREWARM_TIMEOUT)
+            except requests.exceptions.RequestException as e:
+                log.debug(f"Connection prewarm failed for {url}: {e}")
+
+        executor = ThreadPoolExecutor(max_workers=len(targets))
+        wait(
+            [executor.submit(warm, url) for url in targets],
+            timeout=DownloadService.PREWARM_TIMEOUT
+        )
+        executor.shutdown(wait=False)
+
+    @staticmethod
+    def _sync_completed(paths: List[str]) -> None:
+        """Flush every file a queue run completed."""
+        for path in paths:
+            try:
+                _sync_file(path)
+            except OSError as e:
+                log.warning(f"Failed to sync {path} to disk: {e}")
 
     def _download_task(
         self,
@@ -419,12 +1148,19 @@ class DownloadService:
         self._update_task_status(task.url, task.dest_path, "downloading")
         
         try:
-            success = self.download_file(
+            size = self.fetch_file(
                 url=task.url,
                 dest_path=task.dest_path,
                 progress_callback=progress_callback,
                 expected_hash=task.expected_hash
             )
+            success = size is not None
+
+            if success and self.sync_mode == "per_file":
+                try:
+                    _sync_file(task.dest_path)
+                except OSError as e:
+                    log.warning(f"Failed to sync {task.dest_path} to disk: {e}")
 
             status = "completed" if success else "failed"
             self._update_task_status(task.url, task.dest_path, status)
@@ -433,7 +1169,7 @@ class DownloadService:
                 url=task.url,
                 dest_path=task.dest_path,
                 success=success,
-                bytes_downloaded=os.path.getsize(task.dest_path) if success else 0
+                bytes_downloaded=size or 0
             )
 
         except HashMismatchError as e:
@@ -18,7 +18,11 @@ See: docs/spec/MIGRATION_PROTOCOL.md Section 3
 """
 
 import platform
-from typing import Optional
+import sys
+import threading
+from functools import lru_cache
+from importlib import import_module
+from typing import Optional, Type, TYPE_CHECKING
 
 from src.schemas.hardware import (
     HardwareProfile,
@@ -37,9 +41,6 @@ from src.services.hardware.base import (
     NoCUDAError,
     NoROCmError,
 )
-from src.services.hardware.apple_silicon import AppleSiliconDetector
-from src.services.hardware.nvidia import NVIDIADetector
-from src.services.hardware.amd_rocm import AMDROCmDetector
 from src.services.hardware.cpu import detect_cpu, get_cpu_model_name, detect_avx_support
 from src.services.hardware.ram import (
     detect_ram,
@@ -61,6 +62,11 @@ from src.services.hardware.form_factor import (
 )
 from src.utils.logger import log
 
+if TYPE_CHECKING:
+    from src.services.hardware.apple_silicon import AppleSiliconDetector
+    from src.services.hardware.nvidia import NVIDIADetector
+    from src.services.hardware.amd_rocm import AMDROCmDetector
+
 
 # Export public interface
 __all__ = [
@@ -107,11 +113,50 @@ __all__ = [
 ]
 
 
+# Platform detector classes are imported on first use, so a host only loads
+# the detectors it actually probes (PEP 562 module __getattr__)
+_DETECTOR_MODULES = {
+    "AppleSiliconDetector": "src.services.hardware.apple_silicon",
+    "NVIDIADetector": "src.services.hardware.nvidia",
+    "AMDROCmDetector": "src.services.hardware.amd_rocm",
+}
+
+
+def _load_detector(name: str) -> Type[HardwareDetector]:
+    """Import a platform detector class and cache it on this module."""
+    detector_class = getattr(import_module(_DETECTOR_MODULES[name]), name)
+    globals()[name] = detector_class
+    return detector_class
+
+
+def __getattr__(name: str):
+    if name in _DETECTOR_MODULES:
+        return _load_detector(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Detectors worth probing on each sys.platform, in SPEC_v3 detection order.
+# Skips probes that cannot succeed (e.g. importing torch to look for CUDA
+# on a Mac, rocminfo on Windows); unknown platforms try every detector.
+_DETECTION_ORDER = ("AppleSiliconDetector", "NVIDIADetector", "AMDROCmDetector")
+_DETECTORS_BY_PLATFORM = {
+    "darwin": ("AppleSiliconDetector", "NVIDIADetector"),
+    "linux": ("NVIDIADetector", "AMDROCmDetector"),
+    "win32": ("NVIDIADetector",),
+}
+
+
+@lru_cache(maxsize=1)
 def get_detector() -> HardwareDetector:
     """
     Factory function to get the appropriate hardware detector.
 
-    Detection order (per SPEC_v3):
+    The platform cannot change while the process runs, so the availability
+    probes (platform checks, nvidia-smi, rocminfo) run once and the chosen
+    detector is reused. Call get_detector.cache_clear() to re-probe.
+
+    Detection order (per SPEC_v3), limited to detectors that can apply
+    to sys.platform:
     1. Apple Silicon (Darwin + arm64)
     2. NVIDIA (nvidia-smi or CUDA available)
     3. AMD ROCm (Linux + rocminfo available)
@@ -125,33 +170,36 @@ def get_detector() -> HardwareDetector:
         profile = detector.detect()
         print(f"Tier: {profile.tier.value}")
     """
-    # 1. Apple Silicon
-    apple_detector = AppleSiliconDetector()
-    if apple_detector.is_available():
-        log.debug("Using AppleSiliconDetector")
-        return apple_detector
-
-    # 2. NVIDIA
-    nvidia_detector = NVIDIADetector()
-    if nvidia_detector.is_available():
-        log.debug("Using NVIDIADetector")
-        return nvidia_detector
-
-    # 3. AMD ROCm
-    rocm_detector = AMDROCmDetector()
-    if rocm_detector.is_available():
-        log.debug("Using AMDROCmDetector")
-        return rocm_detector
-
-    # 4. CPU-only fallback
+    for name in _DETECTORS_BY_PLATFORM.get(sys.platform, _DETECTION_ORDER):
+        detector = _load_detector(name)()
+        if detector.is_available():
+            log.debug(f"Using {name}")
+            return detector
+
+    # CPU-only fallback
     log.warning("No GPU detected, using CPUOnlyDetector")
     return CPUOnlyDetector()
 
 
-def detect_hardware() -> HardwareProfile:
+# Profile shared by detect_hardware() callers; guarded so concurrent first
+# calls run detection (and its subprocesses) only once
+_cached_profile: Optional[HardwareProfile] = None
+_profile_lock = threading.Lock()
+
+
+def detect_hardware(refresh: bool = False) -> HardwareProfile:
     """
     Convenience function to detect hardware in one call.
 
+    The profile is detected once per process and shared by later callers;
+    values that drift at runtime (available RAM, free disk, thermal state)
+    reflect the detection that produced it, so callers that act on them
+    should pass refresh=True. A failed detection raises and is not cached.
+
+    Args:
+        refresh: Re-run detection, dropping the detector's cached device
+            queries, and replace the shared profile
+
     Returns:
         HardwareProfile for the current system
 
@@ -163,8 +211,14 @@ def detect_hardware() -> HardwareProfile:
         if profile.can_run_fp8:
             print("FP8 models available")
     """
-    detector = get_detector()
-    return detector.detect()
+    global _cached_profile
+    with _profile_lock:
+        if refresh or _cached_profile is None:
+            detector = get_detector()
+            if refresh:
+                detector.clear_caches()
+            _cached_profile = detector.detect()
+        return _cached_profile
 
 
 class CPUOnlyDetector(HardwareDetector):
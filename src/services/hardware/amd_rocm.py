@@ -18,7 +18,9 @@ import platform
 import subprocess
 import shutil
 import re
-from typing import Optional
+from bisect import bisect_right
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
 
 from src.schemas.hardware import (
     HardwareProfile,
@@ -31,6 +33,26 @@ from src.services.hardware.storage import detect_storage
 from src.utils.logger import log
 
 
+# "Temperature (Sensor edge) (C): 45.0" from rocm-smi --showtemp
+_ROCM_SMI_TEMP_RE = re.compile(r'Temperature.*?:\s*(\d+(?:\.\d+)?)')
+
+# amd-smi outputs temperature with field labels like:
+# "TEMPERATURE: 45.0 C" or "Temperature (C): 52" or "GPU Temperature: 67°C"
+# Specific patterns avoid matching unrelated numbers (e.g. "PCIe Gen3")
+_AMD_SMI_TEMP_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'[Tt]emperature[^:]*:\s*(\d+(?:\.\d+)?)\s*[°]?C?',  # "Temperature: 45.0 C"
+        r'TEMP(?:ERATURE)?[^:]*:\s*(\d+(?:\.\d+)?)',         # "TEMP: 45" or "TEMPERATURE: 45"
+        r'(\d+(?:\.\d+)?)\s*°C',                              # "45.0°C" (degree symbol required)
+    )
+)
+
+# _TEMP_STATES[i] covers temperatures (°C) from _TEMP_STATE_BOUNDS[i - 1] up.
+_TEMP_STATE_BOUNDS = (70.0, 85.0, 95.0)
+_TEMP_STATES = ("nominal", "fair", "serious", "critical")
+
+
 class AMDROCmDetector(HardwareDetector):
     """
     Detection strategy for Linux with AMD GPUs.
@@ -41,18 +63,18 @@ class AMDROCmDetector(HardwareDetector):
 
     # Officially supported GFX versions (RDNA3)
     # Per SPEC_v3 Section 4.4
-    OFFICIALLY_SUPPORTED_GFX = {
+    OFFICIALLY_SUPPORTED_GFX: Mapping[str, str] = MappingProxyType({
         "gfx1100": "RX 7900 XTX/XT",
         "gfx1101": "RX 7900 GRE",
         "gfx1102": "RX 7800 XT/7700 XT",
-    }
+    })
 
     # RDNA2 GPUs requiring workaround
-    RDNA2_WORKAROUND = {
+    RDNA2_WORKAROUND: Mapping[str, Tuple[str, str]] = MappingProxyType({
         "gfx1030": ("RX 6900 XT/6800", "HSA_OVERRIDE_GFX_VERSION=10.3.0"),
         "gfx1031": ("RX 6700 XT", "HSA_OVERRIDE_GFX_VERSION=10.3.0"),
         "gfx1032": ("RX 6600 XT", "HSA_OVERRIDE_GFX_VERSION=10.3.0"),
-    }
+    })
 
     # GPU memory bandwidth lookup table (GB/s)
     # Based on memory type and bus width per GPU series
@@ -75,6 +97,13 @@ class AMDROCmDetector(HardwareDetector):
         "6600": 224,        # 128-bit GDDR6
     }
 
+    # One scan for any known key; longest first so "7900 xtx" wins over
+    # "7900 xt", matching the table's ordering
+    _BANDWIDTH_KEY_RE = re.compile(
+        "|".join(sorted(map(re.escape, GPU_BANDWIDTH_GBPS), key=len, reverse=True))
+    )
+    _MODEL_NUMBER_RE = re.compile(r'(\d{4})\s*(xt|xtx|gre)?')
+
     def is_available(self) -> bool:
         """Check if AMD ROCm detection is possible."""
         # Only available on Linux
@@ -280,13 +309,12 @@ class AMDROCmDetector(HardwareDetector):
         name_lower = name_lower.strip()
 
         # Try direct match
-        for key, bandwidth in self.GPU_BANDWIDTH_GBPS.items():
-            if key in name_lower:
-                return float(bandwidth)
+        key_match = self._BANDWIDTH_KEY_RE.search(name_lower)
+        if key_match:
+            return float(self.GPU_BANDWIDTH_GBPS[key_match.group(0)])
 
         # Try extracting model number
-        model_pattern = r'(\d{4})\s*(xt|xtx|gre)?'
-        match = re.search(model_pattern, name_lower)
+        match = self._MODEL_NUMBER_RE.search(name_lower)
 
         if match:
             model_key = match.group(1)
@@ -302,7 +330,7 @@ class AMDROCmDetector(HardwareDetector):
         log.debug(f"No bandwidth data found for AMD GPU: {gpu_name}")
         return None
 
-    def get_thermal_state(self) -> Optional[str]:
+    def _read_thermal_state(self) -> Optional[str]:
         """
         Get GPU thermal state via rocm-smi temperature reading.
 
@@ -319,7 +347,7 @@ class AMDROCmDetector(HardwareDetector):
         """
         try:
             # Try rocm-smi first
-            result = subprocess.run(
+            result = self._run(
                 ["rocm-smi", "--showtemp"],
                 capture_output=True,
                 text=True,
@@ -330,7 +358,7 @@ class AMDROCmDetector(HardwareDetector):
                 return self._parse_rocm_smi_temp(result.stdout)
 
             # Fall back to amd-smi (newer ROCm versions)
-            result = subprocess.run(
+            result = self._run(
                 ["amd-smi", "metric", "-t"],
                 capture_output=True,
                 text=True,
@@ -357,7 +385,7 @@ class AMDROCmDetector(HardwareDetector):
         """Parse temperature from rocm-smi --showtemp output."""
         # Look for temperature values like "Temperature (Sensor edge) (C): 45.0"
         # or "GPU[0] : Temperature (Sensor junction) (C): 52.0"
-        temp_match = re.search(r'Temperature.*?:\s*(\d+(?:\.\d+)?)', output)
+        temp_match = _ROCM_SMI_TEMP_RE.search(output)
         if temp_match:
             temp = float(temp_match.group(1))
             return self._temp_to_state(temp)
@@ -366,29 +394,15 @@ class AMDROCmDetector(HardwareDetector):
 
     def _parse_amd_smi_temp(self, output: str) -> Optional[str]:
         """Parse temperature from amd-smi metric -t output."""
-        # amd-smi outputs temperature with field labels like:
-        # "TEMPERATURE: 45.0 C" or "Temperature (C): 52" or "GPU Temperature: 67°C"
-        # Use specific patterns to avoid matching unrelated numbers (e.g. "PCIe Gen3")
-        patterns = [
-            r'[Tt]emperature[^:]*:\s*(\d+(?:\.\d+)?)\s*[°]?C?',  # "Temperature: 45.0 C"
-            r'TEMP(?:ERATURE)?[^:]*:\s*(\d+(?:\.\d+)?)',         # "TEMP: 45" or "TEMPERATURE: 45"
-            r'(\d+(?:\.\d+)?)\s*°C',                              # "45.0°C" (degree symbol required)
-        ]
-        for pattern in patterns:
-            temp_match = re.search(pattern, output, re.IGNORECASE)
+        for pattern in _AMD_SMI_TEMP_RES:
+            temp_match = pattern.search(output)
             if temp_match:
                 temp = float(temp_match.group(1))
                 return self._temp_to_state(temp)
 
         return None
 
-    def _temp_to_state(self, temp_celsius: float) -> str:
+    @staticmethod
+    def _temp_to_state(temp_celsius: float) -> str:
         """Convert temperature to thermal state string."""
-        if temp_celsius < 70:
-            return "nominal"
-        elif temp_celsius < 85:
-            return "fair"
-        elif temp_celsius < 95:
-            return "serious"
-        else:
-            return "critical"
+        return _TEMP_STATES[bisect_right(_TEMP_STATE_BOUNDS, temp_celsius)]
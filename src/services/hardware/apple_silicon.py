@@ -18,7 +18,9 @@ See: docs/spec/MIGRATION_PROTOCOL.md Section 3
 import platform
 import subprocess
 import re
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 from src.schemas.hardware import (
     HardwareProfile,
@@ -31,6 +33,13 @@ from src.services.hardware.cpu import detect_cpu
 from src.services.hardware.storage import detect_storage
 from src.utils.logger import log
 
+# M1/M2/M3/M4 with optional Pro/Max/Ultra suffix
+_CHIP_VARIANT_RE = re.compile(r"(M[1-4](?:\s+(?:Pro|Max|Ultra))?)")
+
+# `pmset -g therm` throttling indicators (100 = unthrottled)
+_PMSET_SPEED_LIMIT_RE = re.compile(r'CPU_Speed_Limit\s*=\s*(\d+)')
+_PMSET_SCHEDULER_LIMIT_RE = re.compile(r'CPU_Scheduler_Limit\s*=\s*(\d+)')
+
 
 class AppleSiliconDetector(HardwareDetector):
     """
@@ -42,7 +51,7 @@ class AppleSiliconDetector(HardwareDetector):
 
     # Memory bandwidth lookup table (GB/s) per chip variant
     # Per SPEC_v3 Section 4.2
-    BANDWIDTH_LOOKUP = {
+    BANDWIDTH_LOOKUP: Mapping[str, int] = MappingProxyType({
         "M1": 68,
         "M1 Pro": 200,
         "M1 Max": 400,
@@ -59,7 +68,7 @@ class AppleSiliconDetector(HardwareDetector):
         "M4 Pro": 273,
         "M4 Max": 546,
         "M4 Ultra": 800,  # Added - estimated based on architecture
-    }
+    })
 
     def is_available(self) -> bool:
         """Check if running on Apple Silicon Mac."""
@@ -202,7 +211,9 @@ class AppleSiliconDetector(HardwareDetector):
             )
         )
 
-    def _parse_chip_variant(self, chip_string: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _parse_chip_variant(chip_string: str) -> str:
         """
         Parse chip variant from brand string.
 
@@ -213,8 +224,7 @@ class AppleSiliconDetector(HardwareDetector):
         # Remove "Apple " prefix if present
         chip = chip_string.replace("Apple ", "")
 
-        # Match M1/M2/M3/M4 with optional Pro/Max/Ultra suffix
-        match = re.match(r"(M[1-4](?:\s+(?:Pro|Max|Ultra))?)", chip)
+        match = _CHIP_VARIANT_RE.match(chip)
         if match:
             return match.group(1)
 
@@ -233,7 +243,7 @@ class AppleSiliconDetector(HardwareDetector):
             log.warning(f"MPS check failed: {e}")
             return False
 
-    def get_thermal_state(self) -> Optional[str]:
+    def _read_thermal_state(self) -> Optional[str]:
         """
         Get thermal state via pmset (macOS).
 
@@ -243,7 +253,7 @@ class AppleSiliconDetector(HardwareDetector):
         Per SPEC §4.6.1: Maps to ThermalState enum values.
         """
         try:
-            result = subprocess.run(
+            result = self._run(
                 ["pmset", "-g", "therm"],
                 capture_output=True,
                 text=True,
@@ -257,7 +267,7 @@ class AppleSiliconDetector(HardwareDetector):
             output = result.stdout
 
             # Parse CPU_Speed_Limit (100 = no throttling, <100 = throttling)
-            speed_match = re.search(r'CPU_Speed_Limit\s*=\s*(\d+)', output)
+            speed_match = _PMSET_SPEED_LIMIT_RE.search(output)
             if speed_match:
                 speed_limit = int(speed_match.group(1))
 
@@ -271,7 +281,7 @@ class AppleSiliconDetector(HardwareDetector):
                     return "critical"  # Heavy throttling
 
             # Check for scheduler limit as alternative indicator
-            sched_match = re.search(r'CPU_Scheduler_Limit\s*=\s*(\d+)', output)
+            sched_match = _PMSET_SCHEDULER_LIMIT_RE.search(output)
             if sched_match:
                 sched_limit = int(sched_match.group(1))
 
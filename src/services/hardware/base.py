@@ -7,8 +7,10 @@ NEW in Phase 1 - does not replace existing code.
 See: docs/spec/MIGRATION_PROTOCOL.md Section 3
 """
 
+import subprocess
+import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Callable, Optional, Tuple
 
 from src.schemas.hardware import HardwareProfile
 
@@ -21,6 +23,24 @@ class HardwareDetector(ABC):
     and constraints, so detection is implemented separately per platform.
     """
 
+    # Seconds a thermal reading is reused before the platform tool is run
+    # again; polling loops otherwise pay a process spawn per call
+    THERMAL_STATE_TTL = 2.0
+
+    _thermal_cache: Optional[Tuple[float, Optional[str]]] = None
+
+    def __init__(self, runner: Optional[Callable[..., subprocess.CompletedProcess]] = None):
+        """
+        Args:
+            runner: Stand-in for subprocess.run when polling platform tools
+                (tests pass a stub instead of patching the subprocess module)
+        """
+        self._runner = runner
+
+    def _run(self, *args, **kwargs) -> subprocess.CompletedProcess:
+        """Run a platform tool via the injected runner, else subprocess.run."""
+        return (self._runner or subprocess.run)(*args, **kwargs)
+
     @abstractmethod
     def detect(self) -> HardwareProfile:
         """
@@ -50,11 +70,34 @@ class HardwareDetector(ABC):
         """
         Get current GPU thermal state.
 
-        Override in subclasses that support thermal monitoring.
+        Readings are cached per detector for THERMAL_STATE_TTL seconds.
 
         Returns:
             "normal", "warning", "critical", or None if unsupported
         """
+        now = time.monotonic()
+        cached = self._thermal_cache
+        if cached is not None and now - cached[0] < self.THERMAL_STATE_TTL:
+            return cached[1]
+
+        state = self._read_thermal_state()
+        self._thermal_cache = (now, state)
+        return state
+
+    def clear_caches(self) -> None:
+        """
+        Forget cached platform readings so the next detect() re-queries.
+
+        Subclasses that memoize device queries extend this.
+        """
+        self._thermal_cache = None
+
+    def _read_thermal_state(self) -> Optional[str]:
+        """
+        Read the thermal state from the platform, bypassing the cache.
+
+        Override in subclasses that support thermal monitoring.
+        """
         return None
 
 
@@ -14,7 +14,7 @@ import platform
 import subprocess
 from typing import Tuple
 
-from src.schemas.hardware import CPUProfile, CPUTier
+from src.schemas.hardware import CPUProfile, CPUTier, classify_cpu_tier
 from src.services.hardware.base import DetectionFailedError
 from src.utils.logger import log
 
@@ -281,11 +281,4 @@ def calculate_cpu_tier(physical_cores: int) -> CPUTier:
     Returns:
         CPUTier enum value
     """
-    if physical_cores >= 16:
-        return CPUTier.HIGH
-    elif physical_cores >= 8:
-        return CPUTier.MEDIUM
-    elif physical_cores >= 4:
-        return CPUTier.LOW
-    else:
-        return CPUTier.MINIMAL
+    return classify_cpu_tier(physical_cores)
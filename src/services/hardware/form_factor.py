@@ -14,7 +14,9 @@ import math
 import platform
 import re
 import subprocess
-from typing import Optional, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
 
 from src.schemas.hardware import FormFactorProfile
 from src.utils.logger import log
@@ -22,7 +24,7 @@ from src.utils.logger import log
 
 # Reference TDP database per HARDWARE_DETECTION.md Section 2.3
 # Maps normalized GPU names to desktop reference TDP in watts
-GPU_REFERENCE_TDP = {
+GPU_REFERENCE_TDP: Mapping[str, int] = MappingProxyType({
     # Blackwell (RTX 50 series)
     "5090": 575,
     "5080": 360,
@@ -67,7 +69,10 @@ GPU_REFERENCE_TDP = {
     "a4000": 140,
     "v100": 300,
     "t4": 70,
-}
+})
+
+# Matches patterns like "4090", "3080 ti", "4070 super"
+_MODEL_NUMBER_RE = re.compile(r'(\d{4})\s*(ti|super)?')
 
 
 def detect_form_factor(gpu_name: str) -> FormFactorProfile:
@@ -177,10 +182,14 @@ def _detect_mobile_from_name(gpu_name: str) -> bool:
     return any(ind in name_lower for ind in mobile_indicators)
 
 
+@lru_cache(maxsize=16)
 def lookup_reference_tdp(gpu_name: str) -> Optional[float]:
     """
     Look up desktop reference TDP for a GPU.
 
+    Cached per name: normalisation dominates the cost of
+    calculate_sustained_performance_ratio, and the table is read-only.
+
     Args:
         gpu_name: GPU name string (e.g., "NVIDIA GeForce RTX 4090")
 
@@ -206,9 +215,7 @@ def lookup_reference_tdp(gpu_name: str) -> Optional[float]:
         return GPU_REFERENCE_TDP[name_lower]
 
     # Try to extract model number with regex
-    # Matches patterns like "4090", "3080 ti", "4070 super"
-    model_pattern = r'(\d{4})\s*(ti|super)?'
-    match = re.search(model_pattern, name_lower)
+    match = _MODEL_NUMBER_RE.search(name_lower)
 
     if match:
         model_key = match.group(1)
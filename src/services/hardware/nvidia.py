@@ -16,8 +16,11 @@ See: docs/spec/MIGRATION_PROTOCOL.md Section 3
 """
 
 import platform
+import re
 import subprocess
 import shutil
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional, Tuple
 
 from src.schemas.hardware import (
@@ -33,6 +36,28 @@ from src.services.hardware.form_factor import detect_form_factor
 from src.utils.logger import log
 from src.utils.subprocess_utils import run_command
 
+# Kernel version string; contains "microsoft" under WSL
+PROC_VERSION_PATH = "/proc/version"
+
+# nvidia-smi fields for the GPU inventory query; compute_cap needs a
+# recent driver, so the query falls back to the first two fields
+NVIDIA_SMI_INVENTORY_FIELDS = ("name", "memory.total", "compute_cap")
+
+# Compute capability by model number, per SPEC_v3 Section 4.3
+COMPUTE_CAPABILITY_BY_MODEL = {
+    # RTX 50 series (Blackwell)
+    "5090": 12.0, "5080": 12.0, "5070": 12.0,
+    # RTX 40 series (Ada Lovelace)
+    "4090": 8.9, "4080": 8.9, "4070": 8.9, "4060": 8.9,
+    # RTX 30 series (Ampere)
+    "3090": 8.6, "3080": 8.6, "3070": 8.6, "3060": 8.6,
+    # RTX 20 series (Turing)
+    "2080": 7.5, "2070": 7.5, "2060": 7.5,
+    # Data center
+    "H100": 9.0, "A100": 8.0, "V100": 7.0,
+}
+_COMPUTE_CAPABILITY_RE = re.compile("|".join(COMPUTE_CAPABILITY_BY_MODEL))
+
 
 class NVIDIADetector(HardwareDetector):
     """
@@ -84,6 +109,13 @@ class NVIDIADetector(HardwareDetector):
         "v100": 900,   # HBM2
     }
 
+    # One scan for any known key; longest first so "4070 ti super" wins
+    # over "4070 ti" and "4070", matching the table's ordering
+    _BANDWIDTH_KEY_RE = re.compile(
+        "|".join(sorted(map(re.escape, GPU_BANDWIDTH_GBPS), key=len, reverse=True))
+    )
+    _MODEL_NUMBER_RE = re.compile(r'(\d{4})\s*(ti|super)?')
+
     def is_available(self) -> bool:
         """Check if NVIDIA GPU detection is possible."""
         # Check for nvidia-smi first (fast check)
@@ -107,8 +139,6 @@ class NVIDIADetector(HardwareDetector):
         Returns:
             Memory bandwidth in GB/s, or None if not found
         """
-        import re
-
         # Normalize GPU name
         name_lower = gpu_name.lower()
         name_lower = name_lower.replace("nvidia", "")
@@ -118,13 +148,12 @@ class NVIDIADetector(HardwareDetector):
         name_lower = name_lower.strip()
 
         # Try exact match with suffixes first
-        for key, bandwidth in self.GPU_BANDWIDTH_GBPS.items():
-            if key in name_lower:
-                return float(bandwidth)
+        key_match = self._BANDWIDTH_KEY_RE.search(name_lower)
+        if key_match:
+            return float(self.GPU_BANDWIDTH_GBPS[key_match.group(0)])
 
         # Try to extract model number
-        model_pattern = r'(\d{4})\s*(ti|super)?'
-        match = re.search(model_pattern, name_lower)
+        match = self._MODEL_NUMBER_RE.search(name_lower)
 
         if match:
             model_key = match.group(1)
@@ -248,33 +277,168 @@ class NVIDIADetector(HardwareDetector):
             nvlink_available=nvlink_available,
         )
 
-    def _detect_via_nvidia_smi(self) -> HardwareProfile:
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _import_pynvml():
+        """Import the optional pynvml package once (None if not installed)."""
+        try:
+            import pynvml
+        except ImportError:
+            return None
+        return pynvml
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _init_nvml():
         """
-        Fallback detection via nvidia-smi when PyTorch CUDA unavailable.
+        Call nvmlInit() once and return the pynvml module.
 
-        Provides basic GPU info without compute capability details.
-        Uses shared utilities per ARCHITECTURE_PRINCIPLES.md.
+        Raises on failure, so lru_cache keeps only a successful init.
+        """
+        pynvml = NVIDIADetector._import_pynvml()
+        pynvml.nvmlInit()
+        return pynvml
+
+    @staticmethod
+    def _load_nvml():
+        """
+        Return an initialised NVML (optional pynvml package).
+
+        NVML answers in-process, avoiding an nvidia-smi spawn per query.
+        A failed nvmlInit() (e.g. the driver is still loading at startup)
+        is not cached; the next call tries again.
+
+        Returns:
+            The pynvml module, or None if it is not installed or NVML
+            cannot be initialised (no driver library)
         """
+        if NVIDIADetector._import_pynvml() is None:
+            return None
         try:
-            # Use shared utility for consistent error handling
+            return NVIDIADetector._init_nvml()
+        except Exception as e:  # pynvml.NVMLError
+            log.debug(f"NVML initialisation failed, using nvidia-smi: {e}")
+            return None
+
+    @staticmethod
+    def _query_inventory_nvml(nvml) -> Tuple[dict, ...]:
+        """Build the GPU inventory from NVML device queries."""
+        inventory = []
+        for index in range(nvml.nvmlDeviceGetCount()):
+            handle = nvml.nvmlDeviceGetHandleByIndex(index)
+            name = nvml.nvmlDeviceGetName(handle)
+            if isinstance(name, bytes):  # older pynvml releases
+                name = name.decode()
+            major, minor = nvml.nvmlDeviceGetCudaComputeCapability(handle)
+            inventory.append({
+                "name": name,
+                "vram_gb": nvml.nvmlDeviceGetMemoryInfo(handle).total / (1024 ** 3),
+                "compute_capability": float(f"{major}.{minor}"),
+            })
+        return tuple(inventory)
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _query_inventory() -> Tuple[dict, ...]:
+        """
+        Query every GPU's name, memory and compute capability in one call.
+
+        Uses NVML when pynvml is installed, otherwise one nvidia-smi run
+        covers all devices and attributes; a successful result is cached
+        until clear_caches(). Drivers older than the compute_cap field are
+        retried without it. Each entry has "name", "vram_gb" and
+        "compute_capability" (None if not reported).
+
+        Returns:
+            One dict per GPU in device index order
+
+        Raises:
+            DetectionFailedError: If no GPU is reported; failures are not
+                cached, so a later call queries again
+        """
+        nvml = NVIDIADetector._load_nvml()
+        if nvml is not None:
+            try:
+                inventory = NVIDIADetector._query_inventory_nvml(nvml)
+                if inventory:
+                    return inventory
+            except Exception as e:  # pynvml.NVMLError
+                log.debug(f"NVML inventory query failed, using nvidia-smi: {e}")
+
+        output = None
+        for fields in (NVIDIA_SMI_INVENTORY_FIELDS, NVIDIA_SMI_INVENTORY_FIELDS[:2]):
             output = run_command(
-                ["nvidia-smi", "--query-gpu=name,memory.total", "--format=csv,noheader,nounits"],
+                ["nvidia-smi", f"--query-gpu={','.join(fields)}", "--format=csv,noheader,nounits"],
                 timeout=10
             )
+            if output:
+                break
+        if not output:
+            raise DetectionFailedError(
+                component="NVIDIA GPU",
+                message="nvidia-smi returned no output",
+                details="Ensure NVIDIA drivers are installed."
+            )
 
-            if not output:
-                raise DetectionFailedError(
-                    component="NVIDIA GPU",
-                    message="nvidia-smi returned no output",
-                    details="Ensure NVIDIA drivers are installed."
-                )
+        inventory = []
+        for line in output.splitlines():
+            columns = [column.strip() for column in line.split(",")]
+            if len(columns) < 2:
+                continue
+            try:
+                compute_capability = float(columns[2]) if len(columns) > 2 else None
+            except ValueError:
+                compute_capability = None  # "[N/A]" on some drivers
+            inventory.append({
+                "name": columns[0],
+                "vram_gb": float(columns[1]) / 1024,
+                "compute_capability": compute_capability,
+            })
+        if not inventory:
+            raise DetectionFailedError(
+                component="NVIDIA GPU",
+                message="nvidia-smi reported no GPUs",
+                details="Ensure NVIDIA drivers are installed."
+            )
+        return tuple(inventory)
 
-            name, mem = output.strip().split(',')
-            vram_gb = float(mem.strip()) / 1024
+    def clear_caches(self) -> None:
+        """Also forget the GPU inventory so the next detect() re-queries it."""
+        super().clear_caches()
+        NVIDIADetector._query_inventory.cache_clear()
+
+    def _detect_via_nvidia_smi(self) -> HardwareProfile:
+        """
+        Fallback detection via NVML/nvidia-smi when PyTorch CUDA unavailable.
+
+        Provides basic GPU info; compute capability comes from the driver
+        when it reports it, otherwise it is inferred from the name.
+        The profile describes GPU 0; other devices are counted and, if they
+        differ, listed in the warnings.
+        Uses shared utilities per ARCHITECTURE_PRINCIPLES.md.
+        """
+        try:
+            inventory = self._query_inventory()
+
+            primary = inventory[0]
+            gpu_name_clean = primary["name"]
+            vram_gb = primary["vram_gb"]
+
+            warnings = []
+            cc = primary["compute_capability"]
+            if cc is None:
+                # Infer compute capability from GPU name (approximate)
+                cc = self._infer_compute_capability(gpu_name_clean)
+                warnings.append(
+                    "Compute capability inferred from GPU name (PyTorch CUDA unavailable)"
+                )
 
-            # Infer compute capability from GPU name (approximate)
-            cc = self._infer_compute_capability(name)
-            gpu_name_clean = name.strip()
+            if len({(gpu["name"], gpu["vram_gb"]) for gpu in inventory}) > 1:
+                warnings.append(
+                    "Mixed GPUs detected ("
+                    + ", ".join(f"{gpu['name']} {gpu['vram_gb']:.0f}GB" for gpu in inventory)
+                    + f"); recommendations use GPU 0 ({gpu_name_clean})"
+                )
 
             # GPU memory bandwidth lookup
             gpu_bandwidth = self._lookup_gpu_bandwidth(gpu_name_clean)
@@ -291,7 +455,8 @@ class NVIDIADetector(HardwareDetector):
                 supports_tf32=cc is not None and cc >= 8.0,
                 flash_attention_available=cc is not None and cc >= 8.0,
                 gpu_bandwidth_gbps=gpu_bandwidth,
-                warnings=["Compute capability inferred from GPU name (PyTorch CUDA unavailable)"],
+                gpu_count=len(inventory),
+                warnings=warnings,
             )
         except Exception as e:
             raise DetectionFailedError(
@@ -300,47 +465,25 @@ class NVIDIADetector(HardwareDetector):
                 details="Ensure NVIDIA drivers are installed and nvidia-smi is accessible."
             )
 
-    def _infer_compute_capability(self, gpu_name: str) -> Optional[float]:
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _infer_compute_capability(gpu_name: str) -> Optional[float]:
         """
         Infer compute capability from GPU name.
 
         This is a fallback when PyTorch CUDA is unavailable.
         Per SPEC_v3 Section 4.3 compute capability matrix.
         """
-        name = gpu_name.upper()
-
-        # RTX 50 series (Blackwell) - CC 12.0
-        if any(x in name for x in ["5090", "5080", "5070"]):
-            return 12.0
-
-        # RTX 40 series (Ada Lovelace) - CC 8.9
-        if any(x in name for x in ["4090", "4080", "4070", "4060"]):
-            return 8.9
-
-        # RTX 30 series (Ampere) - CC 8.6
-        if any(x in name for x in ["3090", "3080", "3070", "3060"]):
-            return 8.6
-
-        # RTX 20 series (Turing) - CC 7.5
-        if any(x in name for x in ["2080", "2070", "2060"]):
-            return 7.5
+        match = _COMPUTE_CAPABILITY_RE.search(gpu_name.upper())
+        return COMPUTE_CAPABILITY_BY_MODEL[match.group(0)] if match else None
 
-        # Data center GPUs
-        if "H100" in name:
-            return 9.0
-        if "A100" in name:
-            return 8.0
-        if "V100" in name:
-            return 7.0
-
-        return None
-
-    def _detect_wsl(self) -> bool:
-        """Detect if running in WSL2."""
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _detect_wsl() -> bool:
+        """Detect if running in WSL2 (the kernel cannot change, so cached)."""
         try:
-            with open("/proc/version", "r") as f:
-                return "microsoft" in f.read().lower()
-        except FileNotFoundError:
+            return b"microsoft" in Path(PROC_VERSION_PATH).read_bytes().lower()
+        except OSError:
             return False
 
     def _check_nvlink(self) -> bool:
@@ -360,15 +503,24 @@ class NVIDIADetector(HardwareDetector):
             log.warning("psutil not available, cannot get system RAM")
             return 0.0
 
-    def get_thermal_state(self) -> Optional[str]:
+    def _read_thermal_state(self) -> Optional[str]:
         """
-        Get GPU thermal state via nvidia-smi.
+        Get GPU thermal state via NVML, falling back to nvidia-smi.
 
         Per SPEC_v3 Section 4.6.1:
         - NORMAL: <82C
         - WARNING: 82-84C (approaching throttle)
         - CRITICAL: 85C+ (active throttling)
         """
+        nvml = self._load_nvml()
+        if nvml is not None:
+            try:
+                handle = nvml.nvmlDeviceGetHandleByIndex(0)
+                temp = nvml.nvmlDeviceGetTemperature(handle, nvml.NVML_TEMPERATURE_GPU)
+                return self._temp_to_state(temp)
+            except Exception as e:  # pynvml.NVMLError
+                log.debug(f"NVML temperature query failed, using nvidia-smi: {e}")
+
         # Use shared utility for consistent error handling
         output = run_command(
             ["nvidia-smi", "--query-gpu=temperature.gpu", "--format=csv,noheader,nounits"],
@@ -381,13 +533,17 @@ class NVIDIADetector(HardwareDetector):
 
         try:
             temp = int(output.strip().split('\n')[0])
-
-            if temp >= 85:
-                return ThermalState.CRITICAL.value
-            elif temp >= 82:
-                return ThermalState.WARNING.value
-            else:
-                return ThermalState.NORMAL.value
         except (ValueError, IndexError) as e:
             log.debug(f"Thermal state parsing failed: {e}")
             return None
+        return self._temp_to_state(temp)
+
+    @staticmethod
+    def _temp_to_state(temp_celsius: int) -> str:
+        """Convert GPU temperature to a ThermalState value."""
+        if temp_celsius >= 85:
+            return ThermalState.CRITICAL.value
+        elif temp_celsius >= 82:
+            return ThermalState.WARNING.value
+        else:
+            return ThermalState.NORMAL.value
@@ -13,7 +13,9 @@ Phase 1 Week 2a implementation.
 import platform
 import subprocess
 import re
-from typing import Optional, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
 
 from src.schemas.hardware import RAMProfile
 from src.services.hardware.base import DetectionFailedError
@@ -27,8 +29,8 @@ from src.utils.subprocess_utils import (
 from src.config.constants import OS_RESERVED_RAM_GB, OFFLOAD_SAFETY_FACTOR
 
 # System RAM bandwidth by memory type (GB/s, dual-channel)
-# Based on DDR specifications
-RAM_BANDWIDTH_GBPS = {
+# Based on DDR specifications; read-only so get_bandwidth_for_type can cache
+RAM_BANDWIDTH_GBPS: Mapping[str, float] = MappingProxyType({
     "ddr5-6400": 102.4,  # 6400 MT/s * 8 bytes * 2 channels / 1000
     "ddr5-6000": 96.0,
     "ddr5-5600": 89.6,
@@ -44,7 +46,7 @@ RAM_BANDWIDTH_GBPS = {
     "ddr3": 25.6,        # DDR3-1600 dual-channel
     "lpddr5": 68.0,      # Laptop DDR5
     "lpddr4": 34.0,      # Laptop DDR4
-}
+})
 
 
 def detect_ram() -> RAMProfile:
@@ -514,11 +516,13 @@ def _detect_memory_type_linux() -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=32)
 def get_bandwidth_for_type(memory_type: Optional[str]) -> Optional[float]:
     """
     Get memory bandwidth in GB/s for a given memory type.
 
     Uses the RAM_BANDWIDTH_GBPS lookup table with known DDR specifications.
+    Results are cached; only a handful of distinct type strings occur.
 
     Args:
         memory_type: Memory type string (e.g., "ddr5", "ddr4-3200")
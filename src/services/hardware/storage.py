@@ -37,6 +37,33 @@ class StorageType(Enum):
     UNKNOWN = "unknown"
 
 
+# Approximate sequential read speeds in MB/s
+READ_SPEED_MBPS = {
+    StorageType.NVME_GEN4: 7000,
+    StorageType.NVME_GEN3: 3500,
+    StorageType.NVME: 3500,       # Assume Gen 3 as baseline
+    StorageType.SATA_SSD: 550,
+    StorageType.HDD: 140,
+    StorageType.UNKNOWN: 550,     # Assume SATA SSD as conservative estimate
+}
+_DEFAULT_READ_SPEED_MBPS = 550
+
+# Load time per GB, derived once from the read speeds
+_SECONDS_PER_GB = {
+    storage_type: 1024 / speed for storage_type, speed in READ_SPEED_MBPS.items()
+}
+_DEFAULT_SECONDS_PER_GB = 1024 / _DEFAULT_READ_SPEED_MBPS
+
+# Per SPEC_v3 Section 4.6.2; types not listed need no warning
+_STORAGE_WARNINGS = {
+    StorageType.HDD: (
+        "HDD storage detected. AI model loading will be extremely slow "
+        "(~80+ seconds for a 10GB model). Consider using an SSD for models."
+    ),
+    StorageType.UNKNOWN: "Could not detect storage type. Performance may vary.",
+}
+
+
 def detect_storage_type(path: str = ".") -> StorageType:
     """
     Detect storage interface type for a given path.
@@ -258,14 +285,7 @@ def get_storage_warning(storage_type: StorageType) -> Optional[str]:
     Returns:
         Warning message string, or None if no warning needed
     """
-    if storage_type == StorageType.HDD:
-        return (
-            "HDD storage detected. AI model loading will be extremely slow "
-            "(~80+ seconds for a 10GB model). Consider using an SSD for models."
-        )
-    elif storage_type == StorageType.UNKNOWN:
-        return "Could not detect storage type. Performance may vary."
-    return None
+    return _STORAGE_WARNINGS.get(storage_type)
 
 
 def get_estimated_load_time(storage_type: StorageType, model_size_gb: float) -> float:
@@ -279,20 +299,7 @@ def get_estimated_load_time(storage_type: StorageType, model_size_gb: float) ->
     Returns:
         Estimated load time in seconds
     """
-    # Approximate read speeds in MB/s
-    speeds = {
-        StorageType.NVME_GEN4: 7000,
-        StorageType.NVME_GEN3: 3500,
-        StorageType.NVME: 3500,       # Assume Gen 3 as baseline
-        StorageType.SATA_SSD: 550,
-        StorageType.HDD: 140,
-        StorageType.UNKNOWN: 550,     # Assume SATA SSD as conservative estimate
-    }
-
-    speed = speeds.get(storage_type, 550)
-    size_mb = model_size_gb * 1024
-
-    return size_mb / speed
+    return _SECONDS_PER_GB.get(storage_type, _DEFAULT_SECONDS_PER_GB) * model_size_gb
 
 
 def detect_storage(path: str = ".") -> "StorageProfile":
@@ -334,15 +341,7 @@ def detect_storage(path: str = ".") -> "StorageProfile":
         free_gb = 0.0
 
     # Estimate read speed based on storage type
-    speeds = {
-        StorageType.NVME_GEN4: 7000,
-        StorageType.NVME_GEN3: 3500,
-        StorageType.NVME: 3500,
-        StorageType.SATA_SSD: 550,
-        StorageType.HDD: 140,
-        StorageType.UNKNOWN: 550,
-    }
-    estimated_read_mbps = speeds.get(storage_type, 550)
+    estimated_read_mbps = READ_SPEED_MBPS.get(storage_type, _DEFAULT_READ_SPEED_MBPS)
 
     # Determine tier
     if storage_type in (StorageType.NVME_GEN4, StorageType.NVME_GEN3, StorageType.NVME):
@@ -7,15 +7,33 @@ definitions with variants, platform support, and capabilities.
 This replaces the legacy resources.json model loading.
 """
 
+from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any, Iterator
 from pathlib import Path
-import yaml
+from functools import lru_cache
+import sys
 import threading
 
 from src.utils.logger import log
 
 
+@lru_cache(maxsize=1)
+def _get_yaml_loader():
+    """
+    Safe YAML loader class, imported on first use.
+
+    PyYAML (and libyaml) are only needed when the YAML file is actually
+    parsed, so importing this module stays stdlib-only. Prefers libyaml's
+    C parser when PyYAML was built with it; same safe semantics.
+    """
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader
+    return loader
+
+
 class ModelDatabaseError(Exception):
     """Base exception for model database errors."""
     pass
@@ -25,7 +43,7 @@ class ModelDatabaseError(Exception):
 # Data Classes for YAML Schema
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PlatformSupport:
     """Platform support configuration for a model variant."""
     supported: bool = False
@@ -33,7 +51,7 @@ class PlatformSupport:
     notes: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModelVariant:
     """A specific variant of a model (e.g., fp16, fp8, gguf_q4)."""
     id: str
@@ -49,7 +67,7 @@ class ModelVariant:
     notes: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelCapabilities:
     """Capabilities and scores for a model."""
     primary: List[str] = field(default_factory=list)
@@ -75,7 +93,7 @@ class ModelCapabilities:
     pbr_materials: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelDependencies:
     """Dependencies for a model."""
     required_nodes: List[Dict[str, Any]] = field(default_factory=list)
@@ -83,7 +101,7 @@ class ModelDependencies:
     incompatibilities: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelExplanation:
     """Pre-written explanation templates for a model."""
     selected: Optional[str] = None
@@ -91,7 +109,7 @@ class ModelExplanation:
     rejected_platform: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CloudInfo:
     """Cloud availability information."""
     partner_node: bool = False
@@ -100,7 +118,7 @@ class CloudInfo:
     estimated_cost_per_generation: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HardwareInfo:
     """
     Hardware requirements and compatibility per SPEC Section 7.2.
@@ -122,7 +140,7 @@ class HardwareInfo:
     mps_performance_penalty: float = 1.0 # 0.0-1.0, penalty on Apple Silicon (1.0 = not supported)
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelEntry:
     """
     Complete model entry from the database.
@@ -166,10 +184,28 @@ PLATFORM_KEYS = {
 }
 
 
+# PlatformType member name -> YAML platform key.
+# CPU only currently uses the windows_nvidia model set (mostly GGUF/standard);
+# Linux/WSL2 + NVIDIA share Windows NVIDIA support.
+_PLATFORM_TYPE_KEYS = {
+    "APPLE_SILICON": "mac_mps",
+    "LINUX_ROCM": "linux_rocm",
+    "WINDOWS_NVIDIA": "windows_nvidia",
+    "LINUX_NVIDIA": "windows_nvidia",
+    "WSL2_NVIDIA": "windows_nvidia",
+    "CPU_ONLY": "windows_nvidia",
+}
+
+_AMD_VENDORS = frozenset({"amd", "rocm"})
+
+
+@lru_cache(maxsize=32)
 def normalize_platform(gpu_vendor: str, os_platform: Any) -> str:
     """
     Convert gpu_vendor and OS to a platform key.
 
+    Cached: callers resolve the same (vendor, OS) pair for every model.
+
     Args:
         gpu_vendor: "nvidia", "apple", "amd", "none"
         os_platform: "Windows", "Darwin", "Linux" or PlatformType enum
@@ -180,36 +216,17 @@ def normalize_platform(gpu_vendor: str, os_platform: Any) -> str:
     # If already a PlatformType enum, map it to YAML keys
     from src.schemas.hardware import PlatformType
     if isinstance(os_platform, PlatformType):
-        if os_platform == PlatformType.APPLE_SILICON:
-            return "mac_mps"
-        elif os_platform == PlatformType.LINUX_ROCM:
-            return "linux_rocm"
-        elif os_platform in (PlatformType.WINDOWS_NVIDIA, PlatformType.LINUX_NVIDIA, PlatformType.WSL2_NVIDIA):
-            return "windows_nvidia"
-        elif os_platform == PlatformType.CPU_ONLY:
-            # CPU only currently uses the windows_nvidia model set (mostly GGUF/standard)
-            return "windows_nvidia"
-        return os_platform.value
-
-    os_str = str(os_platform)
-    os_lower = os_str.lower()
-    vendor_lower = gpu_vendor.lower()
+        return _PLATFORM_TYPE_KEYS.get(os_platform.name, os_platform.value)
+
+    os_lower = str(os_platform).casefold()
 
     if "darwin" in os_lower or "mac" in os_lower:
         return "mac_mps"
-    elif "linux" in os_lower:
-        if vendor_lower in ("amd", "rocm"):
-            return "linux_rocm"
-        else:
-            return "windows_nvidia"  # Linux + NVIDIA uses same support
-    else:
-        # Windows
-        if vendor_lower == "nvidia":
-            return "windows_nvidia"
-        elif vendor_lower in ("amd", "rocm"):
-            return "linux_rocm"  # Windows AMD similar to Linux ROCm support
-        else:
-            return "windows_nvidia"  # Default
+    # Linux and Windows alike: AMD maps to ROCm support, everything else
+    # (NVIDIA, unknown, none) to the NVIDIA model set
+    if gpu_vendor.casefold() in _AMD_VENDORS:
+        return "linux_rocm"
+    return "windows_nvidia"
 
 
 # =============================================================================
@@ -273,8 +290,34 @@ class ModelDatabase:
         self.yaml_path = yaml_path or self.DEFAULT_PATH
         self._raw_data: Dict[str, Any] = {}
         self._models: Dict[str, ModelEntry] = {}  # Keyed by model ID
+        # Inverted indexes over _models, rebuilt by _parse_models()
+        self._by_category: Dict[str, List[ModelEntry]] = {}
+        self._by_family: Dict[str, List[ModelEntry]] = {}
+        self._by_capability: Dict[str, List[ModelEntry]] = {}
+        # Smallest variant vram_min_mb per model ID; inf for variant-less models
+        self._min_vram_mb: Dict[str, float] = {}
+        # (model ID, variant ID) -> required node packages
+        self._required_nodes: Dict[tuple[str, str], tuple[str, ...]] = {}
         self._loaded = False
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], yaml_path: Optional[Path] = None) -> "ModelDatabase":
+        """
+        Build a loaded database from already-parsed YAML data.
+
+        Skips file I/O and YAML parsing, e.g. when the same data backs
+        many instances. The data is read, not copied or modified.
+
+        Args:
+            data: Parsed YAML document (as returned by yaml.safe_load)
+            yaml_path: Optional path recorded as the data's origin
+        """
+        db = cls(yaml_path)
+        db._raw_data = data or {}
+        db._parse_models()
+        db._loaded = True
+        return db
+
     def load(self) -> bool:
         """
         Load the model database from YAML.
@@ -282,11 +325,16 @@ class ModelDatabase:
         Returns:
             True if loaded successfully, False otherwise.
         """
+        import yaml
+
         try:
             with open(self.yaml_path, "r", encoding="utf-8") as f:
-                self._raw_data = yaml.safe_load(f) or {}
+                self._raw_data = yaml.load(f, Loader=_get_yaml_loader()) or {}
 
             self._parse_models()
+            # Everything needed is now in ModelEntry objects; drop the parsed
+            # dict tree instead of holding a second copy of the database
+            self._raw_data = {}
             self._loaded = True
             log.info(f"Loaded {len(self._models)} models from {self.yaml_path}")
             return True
@@ -319,6 +367,35 @@ class ModelDatabase:
             # Legacy flat structure
             self._parse_flat_structure()
 
+        self._build_indexes()
+
+    def _build_indexes(self) -> None:
+        """Index parsed models by category, family and primary capability."""
+        by_category = defaultdict(list)
+        by_family = defaultdict(list)
+        by_capability = defaultdict(list)
+        min_vram_mb = {}
+        required_nodes = {}
+
+        for model in self._models.values():
+            by_category[model.category].append(model)
+            by_family[model.family].append(model)
+            for capability in dict.fromkeys(model.capabilities.primary):
+                by_capability[capability].append(model)
+            min_vram_mb[model.id] = min(
+                (v.vram_min_mb for v in model.variants), default=float("inf")
+            )
+            for variant in model.variants:
+                required_nodes[(model.id, variant.id)] = self._collect_required_nodes(
+                    model, variant
+                )
+
+        self._by_category = dict(by_category)
+        self._by_family = dict(by_family)
+        self._by_capability = dict(by_capability)
+        self._min_vram_mb = min_vram_mb
+        self._required_nodes = required_nodes
+
     def _is_two_tier_cloud_apis(self) -> bool:
         """Check if cloud_apis contains subcategories (new) vs direct models (legacy)."""
         cloud_data = self._raw_data.get("cloud_apis", {})
@@ -459,8 +536,8 @@ class ModelDatabase:
         return ModelEntry(
             id=model_id,
             name=data.get("name", model_id),
-            category=category,
-            family=data.get("family", "unknown"),
+            category=sys.intern(category),
+            family=sys.intern(data.get("family", "unknown")),
             release_date=data.get("release_date"),
             license=data.get("license"),
             commercial_use=data.get("commercial_use", True),
@@ -481,10 +558,11 @@ class ModelDatabase:
     def _parse_variant(self, data: Dict[str, Any]) -> ModelVariant:
         """Parse a model variant from YAML data."""
 
-        # Parse platform support
+        # Parse platform support (keys are the interned PLATFORM_KEYS literals)
         platform_support = {}
-        for platform_key in ["windows_nvidia", "mac_mps", "linux_rocm"]:
-            ps_data = data.get("platform_support", {}).get(platform_key, {})
+        ps_section = data.get("platform_support", {})
+        for platform_key in PLATFORM_KEYS:
+            ps_data = ps_section.get(platform_key, {})
             if isinstance(ps_data, dict):
                 platform_support[platform_key] = PlatformSupport(
                     supported=ps_data.get("supported", False),
@@ -496,7 +574,8 @@ class ModelDatabase:
 
         return ModelVariant(
             id=data.get("id", "unknown"),
-            precision=data.get("precision", "fp16"),
+            # A handful of distinct values repeated across every variant
+            precision=sys.intern(data.get("precision", "fp16")),
             vram_min_mb=data.get("vram_min_mb", 0),
             vram_recommended_mb=data.get("vram_recommended_mb", 0),
             download_size_gb=data.get("download_size_gb", 0),
@@ -623,18 +702,15 @@ class ModelDatabase:
 
     def get_models_by_category(self, category: str) -> List[ModelEntry]:
         """Get all models in a category."""
-        return [m for m in self._models.values() if m.category == category]
+        return list(self._by_category.get(category, ()))
 
     def get_models_by_family(self, family: str) -> List[ModelEntry]:
         """Get all models in a family (e.g., 'flux', 'wan', 'sdxl')."""
-        return [m for m in self._models.values() if m.family == family]
+        return list(self._by_family.get(family, ()))
 
     def get_models_by_capability(self, capability: str) -> List[ModelEntry]:
         """Get models that support a specific capability (e.g., 'text_to_image')."""
-        return [
-            m for m in self._models.values()
-            if capability in m.capabilities.primary
-        ]
+        return list(self._by_capability.get(capability, ()))
 
     def get_local_models(self) -> List[ModelEntry]:
         """Get models from the local_models section (run locally on user hardware)."""
@@ -725,16 +801,22 @@ class ModelDatabase:
             List of (model, best_variant) tuples
         """
         results = []
+        category_set = frozenset(categories) if categories else None
+        capability_set = frozenset(capabilities) if capabilities else None
+        min_vram_mb = self._min_vram_mb
 
         for model in self._models.values():
+            # Cheapest check first: no variant can fit in this much VRAM
+            if min_vram_mb[model.id] > vram_mb:
+                continue
+
             # Category filter
-            if categories and model.category not in categories:
+            if category_set and model.category not in category_set:
                 continue
 
             # Capability filter
-            if capabilities:
-                if not any(c in model.capabilities.primary for c in capabilities):
-                    continue
+            if capability_set and capability_set.isdisjoint(model.capabilities.primary):
+                continue
 
             # Commercial license filter
             if commercial_only and not model.commercial_use:
@@ -762,10 +844,18 @@ class ModelDatabase:
         Returns:
             List of required node package names
         """
-        nodes = set()
-
+        # Precomputed at load for models owned by this database
+        if self._models.get(model.id) is model:
+            cached = self._required_nodes.get((model.id, variant.id))
+            if cached is not None:
+                return list(cached)
+        return list(self._collect_required_nodes(model, variant))
+
+    @staticmethod
+    def _collect_required_nodes(model: ModelEntry, variant: ModelVariant) -> tuple[str, ...]:
+        """Variant- and model-level node packages required for variant, deduplicated."""
         # Variant-specific nodes (e.g., ComfyUI-GGUF for GGUF variants)
-        nodes.update(variant.requires_nodes)
+        nodes = dict.fromkeys(variant.requires_nodes)
 
         # Model-level dependencies
         for dep in model.dependencies.required_nodes:
@@ -775,11 +865,11 @@ class ModelDatabase:
 
                 # Check if this node is required for this variant
                 if "all" in required_for or variant.id in required_for:
-                    nodes.add(package)
+                    nodes[package] = None
             elif isinstance(dep, str):
-                nodes.add(dep)
+                nodes[dep] = None
 
-        return list(nodes)
+        return tuple(nodes)
 
     def get_paired_models(self, model: ModelEntry) -> List[str]:
         """
@@ -814,28 +904,20 @@ class ModelDatabase:
 # Module-level singleton for convenience
 # =============================================================================
 
-_default_database: Optional['SQLiteModelDatabase'] = None
-
-
+@lru_cache(maxsize=1)
 def get_model_database() -> 'SQLiteModelDatabase':
     """
     Get the default relational model database instance (Singleton).
-    Loads the database on first call.
+    Loads the database on first call; later calls are a lock-free cache hit.
     """
-    global _default_database
-
-    if _default_database is None:
-        _default_database = SQLiteModelDatabase()
-
-    return _default_database
+    return SQLiteModelDatabase()
 
 
 def reload_model_database() -> 'SQLiteModelDatabase':
     """
     Force clear and re-initialize the model database singleton.
     """
-    global _default_database
-    _default_database = None
+    get_model_database.cache_clear()
     return get_model_database()
 
 
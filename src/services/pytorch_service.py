@@ -13,7 +13,8 @@ This implements the core "zero terminal interaction" principle.
 import json
 import subprocess
 import sys
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Tuple, Callable
 
@@ -35,18 +36,19 @@ class DriverVersionError(PyTorchInstallError):
     pass
 
 
-@dataclass
+@dataclass(frozen=True)
 class PyTorchConfig:
     """
     Recommended PyTorch installation configuration.
 
-    Per CUDA_PYTORCH_INSTALLATION.md Section 2.
+    Per CUDA_PYTORCH_INSTALLATION.md Section 2. Immutable so cached configs
+    from get_pytorch_config() can be shared safely.
     """
     cuda_version: str           # "cu130", "cu121", "cu118", "cpu"
     pytorch_version: str        # "2.9.0", "2.5.1", etc.
     index_url: str              # PyPI index URL
     is_stable: bool = True      # False if nightly required
-    notes: List[str] = field(default_factory=list)
+    notes: Tuple[str, ...] = ()
 
 
 @dataclass
@@ -71,6 +73,23 @@ class InstallationResult:
     error: Optional[str] = None
 
 
+def _run_venv_command(cmd: List[str], timeout: int) -> subprocess.CompletedProcess:
+    """
+    Run a venv pip/python command with captured text output.
+
+    On POSIX, close_fds=False lets CPython use posix_spawn() instead of
+    fork()+exec(), whose cost grows with the parent's memory size. Our own
+    fds are non-inheritable by default (PEP 446), so nothing leaks to pip.
+    """
+    return subprocess.run(
+        cmd,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        close_fds=sys.platform == "win32",
+    )
+
+
 class PyTorchService:
     """
     Service for installing and managing PyTorch/CUDA.
@@ -94,6 +113,7 @@ class PyTorchService:
     DEFAULT_PACKAGES = ["torch", "torchvision"]
 
     @staticmethod
+    @lru_cache(maxsize=16)
     def get_pytorch_config(compute_capability: Optional[float]) -> PyTorchConfig:
         """
         Determine optimal PyTorch config based on GPU compute capability.
@@ -113,7 +133,7 @@ class PyTorchService:
                 pytorch_version="2.5.1",
                 index_url="https://download.pytorch.org/whl/cpu",
                 is_stable=True,
-                notes=["No NVIDIA GPU detected - CPU-only installation"]
+                notes=("No NVIDIA GPU detected - CPU-only installation",)
             )
 
         cc = compute_capability
@@ -125,10 +145,10 @@ class PyTorchService:
                 pytorch_version="2.9.0",
                 index_url="https://download.pytorch.org/whl/cu130",
                 is_stable=True,
-                notes=[
+                notes=(
                     "Blackwell architecture - using CUDA 13.0",
                     "FP4/FP6 Tensor Cores available",
-                ]
+                )
             )
 
         # Ada Lovelace (8.9) - RTX 4090, 4080, etc.
@@ -138,7 +158,7 @@ class PyTorchService:
                 pytorch_version="2.9.0",
                 index_url="https://download.pytorch.org/whl/cu130",
                 is_stable=True,
-                notes=["Ada Lovelace - using CUDA 13.0", "FP8 available"]
+                notes=("Ada Lovelace - using CUDA 13.0", "FP8 available")
             )
 
         # Ampere (8.0-8.6) - RTX 3090, 3080, A100, etc.
@@ -148,7 +168,7 @@ class PyTorchService:
                 pytorch_version="2.9.0",
                 index_url="https://download.pytorch.org/whl/cu130",
                 is_stable=True,
-                notes=["Ampere - using CUDA 13.0", "BF16 available"]
+                notes=("Ampere - using CUDA 13.0", "BF16 available")
             )
 
         # Turing (7.5) - RTX 2080, 2070, etc.
@@ -158,7 +178,7 @@ class PyTorchService:
                 pytorch_version="2.9.0",
                 index_url="https://download.pytorch.org/whl/cu130",
                 is_stable=True,
-                notes=["Turing - minimum architecture for CUDA 13.0"]
+                notes=("Turing - minimum architecture for CUDA 13.0",)
             )
 
         # Volta (7.0) - V100, Titan V - CUDA 13.0 dropped support
@@ -168,7 +188,7 @@ class PyTorchService:
                 pytorch_version="2.5.1",
                 index_url="https://download.pytorch.org/whl/cu121",
                 is_stable=True,
-                notes=["Volta - CUDA 13.0 dropped support, using 12.1"]
+                notes=("Volta - CUDA 13.0 dropped support, using 12.1",)
             )
 
         # Pascal (6.x) - GTX 1080, 1070, P100, etc.
@@ -177,7 +197,7 @@ class PyTorchService:
             pytorch_version="2.5.1",
             index_url="https://download.pytorch.org/whl/cu118",
             is_stable=True,
-            notes=["Legacy GPU (Pascal) - using CUDA 11.8"]
+            notes=("Legacy GPU (Pascal) - using CUDA 11.8",)
         )
 
     @staticmethod
@@ -248,12 +268,7 @@ class PyTorchService:
         log.debug(f"Command: {' '.join(cmd)}")
 
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
+            result = _run_venv_command(cmd, timeout=timeout)
 
             if result.returncode != 0:
                 log.error(f"PyTorch installation failed: {result.stderr}")
@@ -322,12 +337,7 @@ print(json.dumps(result))
 '''
 
         try:
-            result = subprocess.run(
-                [str(python), "-c", verify_script],
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
+            result = _run_venv_command([str(python), "-c", verify_script], timeout=timeout)
 
             if result.returncode == 0:
                 data = json.loads(result.stdout)
@@ -431,7 +441,7 @@ print(json.dumps(result))
                     pytorch_version=torch_ver,
                     index_url=f"https://download.pytorch.org/whl/{cuda_ver}",
                     is_stable=True,
-                    notes=["Fallback installation"]
+                    notes=("Fallback installation",)
                 )
 
                 if PyTorchService.install_pytorch(venv_path, fallback_config):
@@ -455,7 +465,7 @@ print(json.dumps(result))
                 pytorch_version="2.5.1",
                 index_url="https://download.pytorch.org/whl/cpu",
                 is_stable=True,
-                notes=["CPU-only fallback - GPU acceleration unavailable"]
+                notes=("CPU-only fallback - GPU acceleration unavailable",)
             )
 
             if PyTorchService.install_pytorch(venv_path, cpu_config):
@@ -505,12 +515,7 @@ print(json.dumps(result))
         log.info(f"Installing {package}")
 
         try:
-            result = subprocess.run(
-                [str(pip), "install", package],
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
+            result = _run_venv_command([str(pip), "install", package], timeout=timeout)
 
             if result.returncode == 0:
                 log.info(f"{package} installed successfully")
@@ -550,12 +555,7 @@ print(json.dumps(result))
         log.info("Uninstalling PyTorch packages")
 
         try:
-            result = subprocess.run(
-                [str(pip), "uninstall", "-y", *packages],
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
+            result = _run_venv_command([str(pip), "uninstall", "-y", *packages], timeout=timeout)
 
             # Uninstall returns 0 even if package wasn't installed
             return True
@@ -599,12 +599,7 @@ print(json.dumps(result))
 '''
 
         try:
-            result = subprocess.run(
-                [str(python), "-c", check_script],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            result = _run_venv_command([str(python), "-c", check_script], timeout=10)
 
             if result.returncode == 0:
                 return json.loads(result.stdout)
@@ -7,12 +7,25 @@ fitting to select which models to install locally vs recommend for cloud.
 Per SPEC_v3 Section 6.7.5 and HARDWARE_DETECTION.md Section 4.4.
 """
 
+import sys
+from array import array
+from bisect import bisect_right
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from enum import Enum
+from itertools import accumulate
+from types import MappingProxyType
+from typing import Any, Callable, List, Dict, Mapping, Optional, Tuple
 
 from src.schemas.hardware import StorageProfile
 
 
+class SuggestionKind(Enum):
+    """Kinds of user-facing suggestions produced by space adjustment."""
+    FREE_UP_SPACE = "free_up_space"
+    USE_CLOUD = "use_cloud"
+    NO_CLOUD_ALTERNATIVE = "no_cloud_alternative"
+
+
 @dataclass
 class SpaceAdjustedModel:
     """A model with its storage requirements."""
@@ -22,6 +35,10 @@ class SpaceAdjustedModel:
     use_case: str
     has_cloud_alternative: bool = False
 
+    def __post_init__(self):
+        """Intern use_case so priority lookups can match by identity."""
+        self.use_case = sys.intern(self.use_case)
+
 
 @dataclass
 class SpaceConstrainedResult:
@@ -42,11 +59,47 @@ class SpaceConstrainedResult:
     space_short_gb: float
     # Suggestions for the user
     suggestions: List[str] = field(default_factory=list)
+    # Structured form of the suggestions: (kind, context) pairs
+    suggestion_codes: List[Tuple[SuggestionKind, Dict[str, Any]]] = field(
+        default_factory=list
+    )
+
+
+def _render_cloud_suggestion(context: Dict[str, Any]) -> str:
+    names = context["model_names"]
+    model_names = ", ".join(names[:3])
+    if len(names) > 3:
+        model_names += f", and {len(names) - 3} more"
+    return (
+        f"Use cloud APIs for: {model_names}. "
+        "These models work with ComfyUI Partner Nodes."
+    )
+
+
+# Text templates for each suggestion kind, applied only when rendering
+SUGGESTION_TEMPLATES: Dict[SuggestionKind, Callable[[Dict[str, Any]], str]] = {
+    SuggestionKind.FREE_UP_SPACE: lambda ctx: (
+        f"Free up {ctx['space_short_gb']:.0f} GB of disk space to install all "
+        f"recommended models."
+    ),
+    SuggestionKind.USE_CLOUD: _render_cloud_suggestion,
+    SuggestionKind.NO_CLOUD_ALTERNATIVE: lambda ctx: (
+        f"{ctx['count']} model(s) have no cloud alternative. "
+        "Consider prioritizing storage for these."
+    ),
+}
+
+
+def render_suggestions(
+    codes: List[Tuple[SuggestionKind, Dict[str, Any]]],
+) -> List[str]:
+    """Render structured suggestion codes into user-facing strings."""
+    return [SUGGESTION_TEMPLATES[kind](context) for kind, context in codes]
 
 
 # Default use case priorities (lower = more important)
-# Users can override these based on their preferences
-DEFAULT_USE_CASE_PRIORITIES: Dict[str, int] = {
+# Read-only; users override by passing their own dict to the adjuster
+DEFAULT_USE_CASE_PRIORITIES: Mapping[str, int] = MappingProxyType({
     "image_generation": 1,      # Most users want image gen first
     "video_generation": 2,      # Video is popular but resource-heavy
     "audio_generation": 3,      # Audio models are smaller
@@ -55,7 +108,10 @@ DEFAULT_USE_CASE_PRIORITIES: Dict[str, int] = {
     "inpainting": 6,            # Specialized use case
     "controlnet": 7,            # Advanced users
     "lora": 8,                  # Enhancements, smaller files
-}
+})
+
+# Priority assigned to use cases missing from the priority table
+UNKNOWN_USE_CASE_PRIORITY = 99
 
 # Workspace buffer to reserve for model operations
 # This accounts for temp files during generation, safetensors loading, etc.
@@ -73,7 +129,7 @@ class SpaceConstrainedAdjustment:
 
     def __init__(
         self,
-        priorities: Optional[Dict[str, int]] = None,
+        priorities: Optional[Mapping[str, int]] = None,
         buffer_gb: float = WORKSPACE_BUFFER_GB,
     ):
         """
@@ -135,10 +191,7 @@ class SpaceConstrainedAdjustment:
             )
 
         # Sort by priority (lower priority number = more important)
-        sorted_models = sorted(
-            recommendations,
-            key=lambda m: self.priorities.get(m.use_case, 99)
-        )
+        sorted_models = self.reorder_by_priority(recommendations)
 
         # Greedily fit models
         fitted: List[SpaceAdjustedModel] = []
@@ -160,7 +213,7 @@ class SpaceConstrainedAdjustment:
         space_short = max(0, space_short)
 
         # Generate suggestions
-        suggestions = self._generate_suggestions(
+        suggestion_codes = self._generate_suggestions(
             removed, cloud_fallback, space_short
         )
 
@@ -172,7 +225,8 @@ class SpaceConstrainedAdjustment:
             space_needed_gb=total_needed,
             space_available_gb=storage.free_gb,
             space_short_gb=space_short,
-            suggestions=suggestions,
+            suggestions=render_suggestions(suggestion_codes),
+            suggestion_codes=suggestion_codes,
         )
 
     def _generate_suggestions(
@@ -180,30 +234,27 @@ class SpaceConstrainedAdjustment:
         removed: List[SpaceAdjustedModel],
         cloud_fallback: List[SpaceAdjustedModel],
         space_short_gb: float,
-    ) -> List[str]:
-        """Generate user-facing suggestions based on adjustment result."""
-        suggestions = []
+    ) -> List[Tuple[SuggestionKind, Dict[str, Any]]]:
+        """Generate suggestion codes based on adjustment result."""
+        suggestions: List[Tuple[SuggestionKind, Dict[str, Any]]] = []
 
         if space_short_gb > 0:
             suggestions.append(
-                f"Free up {space_short_gb:.0f} GB of disk space to install all "
-                f"recommended models."
+                (SuggestionKind.FREE_UP_SPACE, {"space_short_gb": space_short_gb})
             )
 
         if cloud_fallback:
-            model_names = ", ".join(m.model_name for m in cloud_fallback[:3])
-            if len(cloud_fallback) > 3:
-                model_names += f", and {len(cloud_fallback) - 3} more"
-            suggestions.append(
-                f"Use cloud APIs for: {model_names}. "
-                "These models work with ComfyUI Partner Nodes."
-            )
+            suggestions.append((
+                SuggestionKind.USE_CLOUD,
+                {"model_names": [m.model_name for m in cloud_fallback]},
+            ))
 
-        removed_without_cloud = [m for m in removed if not m.has_cloud_alternative]
+        removed_without_cloud = sum(
+            1 for m in removed if not m.has_cloud_alternative
+        )
         if removed_without_cloud:
             suggestions.append(
-                f"{len(removed_without_cloud)} model(s) have no cloud alternative. "
-                "Consider prioritizing storage for these."
+                (SuggestionKind.NO_CLOUD_ALTERNATIVE, {"count": removed_without_cloud})
             )
 
         return suggestions
@@ -223,9 +274,10 @@ class SpaceConstrainedAdjustment:
         Returns:
             Models sorted by priority (most important first)
         """
+        priority_of = self.priorities.get
         return sorted(
             models,
-            key=lambda m: self.priorities.get(m.use_case, 99)
+            key=lambda m: priority_of(m.use_case, UNKNOWN_USE_CASE_PRIORITY)
         )
 
     def estimate_fit(
@@ -248,15 +300,20 @@ class SpaceConstrainedAdjustment:
         total_size = sum(m.size_gb for m in models)
         available = free_gb - self.buffer_gb
 
-        # Quick greedy count
-        fitted_count = 0
-        fitted_size = 0.0
-        for m in sorted(models, key=lambda x: self.priorities.get(x.use_case, 99)):
-            if fitted_size + m.size_gb <= available:
-                fitted_count += 1
-                fitted_size += m.size_gb
-            else:
-                break
+        if total_size <= available:
+            # Everything fits - no need to order by priority
+            fitted_count = len(models)
+            fitted_size = total_size
+        else:
+            # Quick greedy count
+            fitted_count = 0
+            fitted_size = 0.0
+            for m in self.reorder_by_priority(models):
+                if fitted_size + m.size_gb <= available:
+                    fitted_count += 1
+                    fitted_size += m.size_gb
+                else:
+                    break
 
         return {
             "total_models": len(models),
@@ -268,9 +325,61 @@ class SpaceConstrainedAdjustment:
             "fits_all": fitted_count == len(models),
         }
 
+    def estimate_fit_multi(
+        self,
+        models: List[SpaceAdjustedModel],
+        free_gbs: List[float],
+    ) -> List[Dict[str, any]]:
+        """
+        Estimate fit against several candidate drives at once.
+
+        The priority sort and running totals are computed once and shared;
+        each drive only needs a binary search over the cumulative sizes.
+
+        Args:
+            models: Models to evaluate
+            free_gbs: Available free space in GB for each candidate drive
+
+        Returns:
+            List of estimate_fit-style dicts, one per entry in free_gbs
+        """
+        sorted_sizes = (m.size_gb for m in self.reorder_by_priority(models))
+        # Packed doubles rather than a list of float objects
+        cumulative = array("d", accumulate(sorted_sizes))
+        total_size = sum(m.size_gb for m in models)
+
+        estimates = []
+        for free_gb in free_gbs:
+            available = free_gb - self.buffer_gb
+            if total_size <= available:
+                fitted_count = len(models)
+                fitted_size = total_size
+            else:
+                fitted_count = bisect_right(cumulative, available)
+                fitted_size = cumulative[fitted_count - 1] if fitted_count else 0.0
+            estimates.append({
+                "total_models": len(models),
+                "models_that_fit": fitted_count,
+                "models_removed": len(models) - fitted_count,
+                "total_size_gb": total_size,
+                "fitted_size_gb": fitted_size,
+                "space_available_gb": free_gb,
+                "fits_all": fitted_count == len(models),
+            })
+
+        return estimates
+
 
 def create_space_adjustment(
-    priorities: Optional[Dict[str, int]] = None,
+    priorities: Optional[Mapping[str, int]] = None,
+    buffer_gb: Optional[float] = None,
 ) -> SpaceConstrainedAdjustment:
-    """Factory function to create SpaceConstrainedAdjustment instance."""
-    return SpaceConstrainedAdjustment(priorities=priorities)
+    """
+    Factory function to create SpaceConstrainedAdjustment instance.
+
+    Always returns a new instance: callers may change buffer_gb or
+    priorities on it without affecting anyone else.
+    """
+    if buffer_gb is None:
+        buffer_gb = WORKSPACE_BUFFER_GB
+    return SpaceConstrainedAdjustment(priorities=priorities, buffer_gb=buffer_gb)
@@ -211,7 +211,8 @@ class RecommendationService:
         # (This transformation logic will eventually move to PAT-04 Adapter)
         from src.services.hardware import detect_hardware
         try:
-            full_hardware = detect_hardware()
+            # Fresh profile: fitting reads free disk and available RAM
+            full_hardware = detect_hardware(refresh=True)
         except Exception:
             # Fallback to normalized constraints if full detection fails during transition
             from src.schemas.hardware import HardwareProfile, PlatformType
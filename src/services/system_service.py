@@ -9,13 +9,16 @@ for reference but no longer executes.
 See: docs/spec/MIGRATION_PROTOCOL.md Section 3
 """
 
+import atexit
 import shutil
 import subprocess
 import platform
 import sys
 import os
+import threading
+import time
 from pathlib import Path
-from typing import Tuple, Optional, Dict
+from typing import Callable, Dict, FrozenSet, Iterable, Optional, Tuple
 from functools import lru_cache
 from src.utils.logger import log
 from src.schemas.environment import EnvironmentReport
@@ -23,8 +26,110 @@ from src.schemas.environment import EnvironmentReport
 # Feature flag for new hardware detection (Pattern C from migration protocol)
 USE_NEW_HARDWARE_DETECTION = True
 
+_POWER_SUPPLY_PATH = "/sys/class/power_supply"
+
+# Win32_SystemEnclosure ChassisTypes: Laptop, Notebook, Sub Notebook
+_LAPTOP_CHASSIS_TYPES = frozenset({9, 10, 14})
+
+
+# sysfs attribute path -> open fd, re-read with pread on every poll.
+# The lock covers open, read and close so no thread preads a closed fd.
+_sysfs_fds: Dict[str, int] = {}
+_sysfs_lock = threading.Lock()
+
+
+def _close_fd(fd: int) -> None:
+    try:
+        os.close(fd)
+    except OSError:
+        pass
+
+
+def _read_sysfs(path: str) -> bytes:
+    """
+    Read a small sysfs attribute; empty bytes if unreadable.
+
+    sysfs regenerates attribute content on each read from offset 0, so the
+    fd is kept open and polled with a single pread() instead of
+    open/read/close every time. A held fd that fails (the device was
+    removed and re-added under the same name) is reopened and read once.
+    """
+    with _sysfs_lock:
+        fd = _sysfs_fds.pop(path, None)
+        if fd is not None:
+            try:
+                data = os.pread(fd, 64, 0)
+                _sysfs_fds[path] = fd
+                return data.strip()
+            except OSError:
+                _close_fd(fd)
+
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return b""
+        try:
+            data = os.pread(fd, 64, 0)
+        except OSError:
+            _close_fd(fd)
+            return b""
+        _sysfs_fds[path] = fd
+        return data.strip()
+
+
+def _evict_sysfs_fds(present_dirs: Iterable[str]) -> None:
+    """Close held fds for supplies no longer listed (e.g. unplugged USB-C)."""
+    present = frozenset(present_dirs)
+    with _sysfs_lock:
+        for path in [p for p in _sysfs_fds if os.path.dirname(p) not in present]:
+            _close_fd(_sysfs_fds.pop(path))
+
+
+def _close_sysfs_fds() -> None:
+    """Close all held sysfs fds."""
+    with _sysfs_lock:
+        while _sysfs_fds:
+            _close_fd(_sysfs_fds.popitem()[1])
+
+
+atexit.register(_close_sysfs_fds)
+
+
+@lru_cache(maxsize=1)
+def _power_status_api():
+    """
+    Bind kernel32.GetSystemPowerStatus once (Windows only).
+
+    Returns the typed function and the SYSTEM_POWER_STATUS struct type,
+    so each poll skips redefining the struct and ctypes argument coercion.
+    Callers allocate their own struct per call; a shared buffer would be
+    overwritten by concurrent polls.
+    """
+    import ctypes
+    from ctypes import wintypes
+
+    class SYSTEM_POWER_STATUS(ctypes.Structure):
+        _fields_ = [
+            ("ACLineStatus", ctypes.c_byte),
+            ("BatteryFlag", ctypes.c_byte),
+            ("BatteryLifePercent", ctypes.c_byte),
+            ("SystemStatusFlag", ctypes.c_byte),
+            ("BatteryLifeTime", wintypes.DWORD),
+            ("BatteryFullLifeTime", wintypes.DWORD),
+        ]
+
+    get_status = ctypes.windll.kernel32.GetSystemPowerStatus
+    get_status.argtypes = [ctypes.POINTER(SYSTEM_POWER_STATUS)]
+    get_status.restype = wintypes.BOOL
+    return get_status, SYSTEM_POWER_STATUS
+
 
 class SystemService:
+    # Seconds a Windows/macOS power reading is reused; status bar polling
+    # would otherwise spawn powercfg or two pmset processes per call
+    POWER_STATE_TTL = 5.0
+    _power_state_cache: Optional[Tuple[float, Tuple[str, bool]]] = None
+
     @staticmethod
     @lru_cache(maxsize=1)
     def get_gpu_info() -> Tuple[str, str, float]:
@@ -51,10 +156,20 @@ class SystemService:
         # This code path is disabled by default
         return _legacy_get_gpu_info()
 
+    @classmethod
+    def clear_caches(cls) -> None:
+        """Drop memoized hardware facts so the next call re-detects them."""
+        cls.get_gpu_info.cache_clear()
+        cls.get_system_ram_gb.cache_clear()
+        cls.detect_form_factor.cache_clear()
+        cls._power_state_cache = None
+        _close_sysfs_fds()
+
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_system_ram_gb() -> Optional[float]:
         """
-        Returns total system RAM in GB.
+        Returns total system RAM in GB (cached; installed RAM does not change).
 
         Returns: RAM in GB, or None if detection fails.
 
@@ -119,42 +234,79 @@ class SystemService:
         return (free_gb - headroom) >= required_gb
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def detect_form_factor() -> str:
         """
         Detect system form factor (desktop, laptop, mini, workstation).
 
-        Per ARCHITECTURE_PRINCIPLES: Uses run_powershell() with -NoProfile.
+        On Windows, queries WMI in-process via pywin32 when available and
+        otherwise uses run_powershell() with -NoProfile (per
+        ARCHITECTURE_PRINCIPLES). Cached: the chassis does not change while
+        the process runs.
         """
         if platform.system() == "Windows":
-            try:
-                from src.utils.subprocess_utils import run_powershell
-
-                cmd = "Get-CimInstance -ClassName Win32_SystemEnclosure | Select-Object -ExpandProperty ChassisTypes"
-                output = run_powershell(cmd, timeout=10)
-
-                if output:
-                    # ChassisTypes: 9, 10, 14 = Laptop/Notebook/Sub-Notebook
-                    if any(x in output for x in ["9", "10", "14"]):
-                        return "laptop"
-            except ImportError:
-                log.warning("subprocess_utils not available, using fallback")
-                # Fallback to direct call if utilities not available
-                try:
-                    cmd = "Get-CimInstance -ClassName Win32_SystemEnclosure | Select-Object -ExpandProperty ChassisTypes"
-                    output = subprocess.check_output(
-                        ["powershell", "-NoProfile", "-Command", cmd],
-                        creationflags=subprocess.CREATE_NO_WINDOW
-                    ).decode().strip()
-                    if any(x in output for x in ["9", "10", "14"]):
-                        return "laptop"
-                except Exception:
-                    pass
-            except Exception as e:
-                log.warning(f"Form factor detection failed: {e}")
+            chassis_types = SystemService._read_chassis_types_wmi()
+            if chassis_types is None:
+                chassis_types = SystemService._read_chassis_types_powershell()
+            if not _LAPTOP_CHASSIS_TYPES.isdisjoint(chassis_types):
+                return "laptop"
 
         # Default to desktop if detection fails
         return "desktop"
 
+    @staticmethod
+    def _read_chassis_types_wmi() -> Optional[FrozenSet[int]]:
+        """
+        Read Win32_SystemEnclosure.ChassisTypes through pywin32's COM bridge.
+
+        Avoids a PowerShell cold start. Returns None if pywin32 is not
+        installed or the query fails, so the caller can fall back.
+        """
+        try:
+            import pythoncom
+            import win32com.client
+
+            pythoncom.CoInitialize()
+            enclosures = win32com.client.GetObject("winmgmts:").InstancesOf(
+                "Win32_SystemEnclosure"
+            )
+            return frozenset(
+                int(chassis)
+                for enclosure in enclosures
+                for chassis in (enclosure.ChassisTypes or ())
+            )
+        except ImportError:
+            log.debug("pywin32 not available, querying chassis via PowerShell")
+        except Exception as e:
+            log.debug(f"WMI chassis query failed, falling back to PowerShell: {e}")
+        return None
+
+    @staticmethod
+    def _read_chassis_types_powershell() -> FrozenSet[int]:
+        """Read Win32_SystemEnclosure.ChassisTypes via PowerShell."""
+        cmd = "Get-CimInstance -ClassName Win32_SystemEnclosure | Select-Object -ExpandProperty ChassisTypes"
+        output = None
+        try:
+            from src.utils.subprocess_utils import run_powershell
+
+            output = run_powershell(cmd, timeout=10)
+        except ImportError:
+            log.warning("subprocess_utils not available, using fallback")
+            # Fallback to direct call if utilities not available
+            try:
+                output = subprocess.check_output(
+                    ["powershell", "-NoProfile", "-Command", cmd],
+                    creationflags=subprocess.CREATE_NO_WINDOW
+                ).decode().strip()
+            except Exception:
+                pass
+        except Exception as e:
+            log.warning(f"Form factor detection failed: {e}")
+
+        if not output:
+            return frozenset()
+        return frozenset(int(token) for token in output.split() if token.isdigit())
+
     @staticmethod
     def detect_storage_type(path: str = ".") -> str:
         """
@@ -187,25 +339,30 @@ class SystemService:
         else:
             return "unknown", False
 
+    @staticmethod
+    def _cached_power_state(read: Callable[[], Tuple[str, bool]]) -> Tuple[str, bool]:
+        """Return the last power reading if younger than POWER_STATE_TTL, else read()."""
+        now = time.monotonic()
+        cached = SystemService._power_state_cache
+        if cached is not None and now - cached[0] < SystemService.POWER_STATE_TTL:
+            return cached[1]
+
+        state = read()
+        SystemService._power_state_cache = (now, state)
+        return state
+
     @staticmethod
     def _detect_power_state_windows() -> Tuple[str, bool]:
-        """Windows power state detection via GetSystemPowerStatus."""
+        """Windows power state detection, cached for POWER_STATE_TTL."""
+        return SystemService._cached_power_state(SystemService._read_power_state_windows)
+
+    @staticmethod
+    def _read_power_state_windows() -> Tuple[str, bool]:
+        """Query GetSystemPowerStatus and the active powercfg scheme."""
         try:
-            import ctypes
-            from ctypes import wintypes
-
-            class SYSTEM_POWER_STATUS(ctypes.Structure):
-                _fields_ = [
-                    ("ACLineStatus", ctypes.c_byte),
-                    ("BatteryFlag", ctypes.c_byte),
-                    ("BatteryLifePercent", ctypes.c_byte),
-                    ("SystemStatusFlag", ctypes.c_byte),
-                    ("BatteryLifeTime", wintypes.DWORD),
-                    ("BatteryFullLifeTime", wintypes.DWORD),
-                ]
-
-            status = SYSTEM_POWER_STATUS()
-            if not ctypes.windll.kernel32.GetSystemPowerStatus(ctypes.byref(status)):
+            get_status, status_type = _power_status_api()
+            status = status_type()
+            if not get_status(status):
                 log.warning("GetSystemPowerStatus failed")
                 return "unknown", False
 
@@ -235,7 +392,12 @@ class SystemService:
 
     @staticmethod
     def _detect_power_state_macos() -> Tuple[str, bool]:
-        """macOS power state detection via pmset."""
+        """macOS power state detection via pmset, cached for POWER_STATE_TTL."""
+        return SystemService._cached_power_state(SystemService._read_power_state_macos)
+
+    @staticmethod
+    def _read_power_state_macos() -> Tuple[str, bool]:
+        """Query pmset for the power source and Low Power Mode."""
         try:
             result = subprocess.run(
                 ["pmset", "-g", "batt"],
@@ -288,29 +450,25 @@ class SystemService:
     def _detect_power_state_linux() -> Tuple[str, bool]:
         """Linux power state detection via /sys/class/power_supply."""
         try:
-            import os
-
-            power_supply_path = "/sys/class/power_supply"
             on_battery = True  # Default to battery if no AC found
 
-            if os.path.exists(power_supply_path):
-                for supply in os.listdir(power_supply_path):
-                    supply_path = os.path.join(power_supply_path, supply)
-                    type_path = os.path.join(supply_path, "type")
-                    online_path = os.path.join(supply_path, "online")
-
-                    if os.path.exists(type_path):
-                        with open(type_path, 'r') as f:
-                            supply_type = f.read().strip().lower()
-
-                        # Check if AC adapter is online
-                        if supply_type in ("mains", "usb"):
-                            if os.path.exists(online_path):
-                                with open(online_path, 'r') as f:
-                                    online = f.read().strip()
-                                    if online == "1":
-                                        on_battery = False
-                                        break
+            try:
+                supplies = os.scandir(_POWER_SUPPLY_PATH)
+            except OSError:
+                supplies = None
+
+            if supplies is not None:
+                with supplies:
+                    supply_dirs = [supply.path for supply in supplies]
+                _evict_sysfs_fds(supply_dirs)
+                for supply_path in supply_dirs:
+                    supply_type = _read_sysfs(os.path.join(supply_path, "type"))
+                    # Check if AC adapter is online
+                    if supply_type.lower() not in (b"mains", b"usb"):
+                        continue
+                    if _read_sysfs(os.path.join(supply_path, "online")) == b"1":
+                        on_battery = False
+                        break
 
             # Linux power profiles (if available)
             profile = "balanced"
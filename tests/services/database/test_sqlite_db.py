@@ -109,7 +109,7 @@ def test_singleton_integrity():
     
     # Force reset for clean test
     import src.services.model_database as mb_module
-    mb_module._default_database = None
+    mb_module.get_model_database.cache_clear()
     SQLiteModelDatabase._instance = None
     
     db1 = SQLiteModelDatabase()
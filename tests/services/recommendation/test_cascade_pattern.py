@@ -43,6 +43,7 @@ def test_standard_cascade_cloud_fallback(monkeypatch):
     model.name = "Heavy Model"
     model.family = "flux"
     model.variants = [] # No variants -> all local steps will fail
+    model.cloud = None  # No partner/replicate options -> generic cloud message
     
     hardware = MagicMock(spec=HardwareProfile)
     hardware.vram_gb = 4.0
@@ -5,7 +5,7 @@ Tests human-readable explanation generation per SPEC_v3 Section 6.6.
 """
 
 import pytest
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import List, Dict, Optional
 
 from src.services.recommendation.recommendation_explainer import (
@@ -887,12 +887,12 @@ class TestHardwareWarnings:
         """Should warn about laptop GPU with < 80% sustained performance."""
         explainer = RecommendationExplainer()
         hardware = create_mock_hardware()
-        hardware.form_factor = FormFactorProfile(
+        hardware = replace(hardware, form_factor=FormFactorProfile(
             is_laptop=True,
             power_limit_watts=175.0,
             reference_tdp_watts=450.0,
             sustained_performance_ratio=0.62,  # sqrt(175/450) ≈ 0.62
-        )
+        ))
         ranked = [create_mock_ranked_candidate()]
 
         warnings = explainer._generate_hardware_warnings(ranked, hardware)
@@ -905,12 +905,12 @@ class TestHardwareWarnings:
         """Should still warn about laptop even with > 80% performance."""
         explainer = RecommendationExplainer()
         hardware = create_mock_hardware()
-        hardware.form_factor = FormFactorProfile(
+        hardware = replace(hardware, form_factor=FormFactorProfile(
             is_laptop=True,
             power_limit_watts=300.0,
             reference_tdp_watts=350.0,
             sustained_performance_ratio=0.93,  # Good ratio but still laptop
-        )
+        ))
         ranked = [create_mock_ranked_candidate()]
 
         warnings = explainer._generate_hardware_warnings(ranked, hardware)
@@ -923,10 +923,10 @@ class TestHardwareWarnings:
         """Should not warn about desktop GPU."""
         explainer = RecommendationExplainer()
         hardware = create_mock_hardware()
-        hardware.form_factor = FormFactorProfile(
+        hardware = replace(hardware, form_factor=FormFactorProfile(
             is_laptop=False,
             sustained_performance_ratio=1.0,
-        )
+        ))
         ranked = [create_mock_ranked_candidate()]
 
         warnings = explainer._generate_hardware_warnings(ranked, hardware)
@@ -956,14 +956,14 @@ class TestHardwareWarnings:
         explainer = RecommendationExplainer()
         hardware = create_mock_hardware()
         # Need to set both storage_type and tier since __post_init__ already ran
-        hardware.storage = StorageProfile(
+        hardware = replace(hardware, storage=StorageProfile(
             path="C:\\",
             total_gb=500.0,
             free_gb=200.0,
             storage_type="sata_ssd",
             estimated_read_mbps=500,
             tier=StorageTier.MODERATE,
-        )
+        ))
         ranked = [create_mock_ranked_candidate()]
 
         warnings = explainer._generate_hardware_warnings(
@@ -1011,11 +1011,11 @@ class TestHardwareWarnings:
         """Should warn about low RAM when models use offload."""
         explainer = RecommendationExplainer()
         hardware = create_mock_hardware(ram_gb=16.0)
-        hardware.ram = RAMProfile(
+        hardware = replace(hardware, ram=RAMProfile(
             total_gb=16.0,
             available_gb=8.0,
             usable_for_offload_gb=6.0,  # Below 16GB threshold
-        )
+        ))
         ranked = [create_mock_ranked_candidate(execution_mode="gpu_offload")]
 
         warnings = explainer._generate_hardware_warnings(ranked, hardware)
@@ -1028,11 +1028,11 @@ class TestHardwareWarnings:
         """Should not warn about RAM when usable RAM is >= 16GB."""
         explainer = RecommendationExplainer()
         hardware = create_mock_hardware(ram_gb=64.0)
-        hardware.ram = RAMProfile(
+        hardware = replace(hardware, ram=RAMProfile(
             total_gb=64.0,
             available_gb=48.0,
             usable_for_offload_gb=32.0,  # Above 16GB threshold
-        )
+        ))
         ranked = [create_mock_ranked_candidate(execution_mode="gpu_offload")]
 
         warnings = explainer._generate_hardware_warnings(ranked, hardware)
@@ -1044,11 +1044,11 @@ class TestHardwareWarnings:
         """Should not warn about RAM when no models use offload."""
         explainer = RecommendationExplainer()
         hardware = create_mock_hardware(ram_gb=16.0)
-        hardware.ram = RAMProfile(
+        hardware = replace(hardware, ram=RAMProfile(
             total_gb=16.0,
             available_gb=8.0,
             usable_for_offload_gb=6.0,  # Low RAM, but no offload needed
-        )
+        ))
         ranked = [create_mock_ranked_candidate(execution_mode="native")]
 
         warnings = explainer._generate_hardware_warnings(ranked, hardware)
@@ -1062,7 +1062,7 @@ class TestHardwareWarnings:
         """Should warn about missing AVX2 when GGUF models are recommended."""
         explainer = RecommendationExplainer()
         hardware = create_mock_hardware()
-        hardware.cpu = CPUProfile(
+        hardware = replace(hardware, cpu=CPUProfile(
             model="Intel Core i5-4570",
             architecture="x86_64",
             physical_cores=4,
@@ -1070,7 +1070,7 @@ class TestHardwareWarnings:
             supports_avx=True,
             supports_avx2=False,  # No AVX2
             tier=CPUTier.LOW,
-        )
+        ))
 
         # Create a ranked candidate with GGUF variant
         ranked_gguf = create_mock_ranked_candidate()
@@ -1088,7 +1088,7 @@ class TestHardwareWarnings:
         """Should not warn about AVX2 when CPU supports it."""
         explainer = RecommendationExplainer()
         hardware = create_mock_hardware()
-        hardware.cpu = CPUProfile(
+        hardware = replace(hardware, cpu=CPUProfile(
             model="AMD Ryzen 9 7950X",
             architecture="x86_64",
             physical_cores=16,
@@ -1096,7 +1096,7 @@ class TestHardwareWarnings:
             supports_avx=True,
             supports_avx2=True,  # Has AVX2
             tier=CPUTier.HIGH,
-        )
+        ))
 
         # Create a ranked candidate with GGUF variant
         ranked_gguf = create_mock_ranked_candidate()
@@ -1113,7 +1113,7 @@ class TestHardwareWarnings:
         """Should not warn about AVX2 on ARM64 (uses NEON instead)."""
         explainer = RecommendationExplainer()
         hardware = create_mock_hardware(platform=PlatformType.APPLE_SILICON)
-        hardware.cpu = CPUProfile(
+        hardware = replace(hardware, cpu=CPUProfile(
             model="Apple M3 Max",
             architecture="arm64",  # ARM, not x86
             physical_cores=12,
@@ -1121,7 +1121,7 @@ class TestHardwareWarnings:
             supports_avx=False,
             supports_avx2=False,
             tier=CPUTier.HIGH,
-        )
+        ))
 
         # Create a ranked candidate with GGUF variant
         ranked_gguf = create_mock_ranked_candidate()
@@ -1138,7 +1138,7 @@ class TestHardwareWarnings:
         """Should not warn about AVX2 when no GGUF models are recommended."""
         explainer = RecommendationExplainer()
         hardware = create_mock_hardware()
-        hardware.cpu = CPUProfile(
+        hardware = replace(hardware, cpu=CPUProfile(
             model="Intel Core i5-4570",
             architecture="x86_64",
             physical_cores=4,
@@ -1146,7 +1146,7 @@ class TestHardwareWarnings:
             supports_avx=True,
             supports_avx2=False,  # No AVX2, but no GGUF models
             tier=CPUTier.LOW,
-        )
+        ))
 
         # Create a ranked candidate with FP16 variant (not GGUF)
         ranked_fp16 = create_mock_ranked_candidate()
@@ -1193,12 +1193,12 @@ class TestHardwareWarnings:
 
         # Create hardware with laptop and slow storage
         hardware = create_mock_hardware(storage_tier=StorageTier.SLOW)
-        hardware.form_factor = FormFactorProfile(
+        hardware = replace(hardware, form_factor=FormFactorProfile(
             is_laptop=True,
             power_limit_watts=175.0,
             reference_tdp_watts=450.0,
             sustained_performance_ratio=0.62,
-        )
+        ))
 
         ranked = [create_mock_ranked_candidate()]
         rejected = []
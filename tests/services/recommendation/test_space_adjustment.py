@@ -11,6 +11,7 @@ from src.services.recommendation.space_adjustment import (
     SpaceConstrainedAdjustment,
     SpaceAdjustedModel,
     SpaceConstrainedResult,
+    SuggestionKind,
     DEFAULT_USE_CASE_PRIORITIES,
     WORKSPACE_BUFFER_GB,
     create_space_adjustment,
@@ -85,6 +86,13 @@ class TestSpaceAdjustedModel:
         )
         assert model.has_cloud_alternative is False
 
+    def test_use_case_interned(self):
+        """Should intern use_case to match the priority table keys."""
+        use_case = "".join(["image", "_generation"])
+        model = create_mock_model(use_case=use_case)
+        key = next(k for k in DEFAULT_USE_CASE_PRIORITIES if k == use_case)
+        assert model.use_case is key
+
 
 class TestSpaceConstrainedResult:
     """Tests for SpaceConstrainedResult dataclass."""
@@ -137,7 +145,7 @@ class TestDefaultPriorities:
 
     def test_all_use_cases_defined(self):
         """Should have all common use cases defined."""
-        expected = [
+        expected = {
             "image_generation",
             "video_generation",
             "audio_generation",
@@ -146,9 +154,13 @@ class TestDefaultPriorities:
             "inpainting",
             "controlnet",
             "lora",
-        ]
-        for use_case in expected:
-            assert use_case in DEFAULT_USE_CASE_PRIORITIES
+        }
+        assert expected <= DEFAULT_USE_CASE_PRIORITIES.keys()
+
+    def test_defaults_are_read_only(self):
+        """Default priorities should not be mutable by callers."""
+        with pytest.raises(TypeError):
+            DEFAULT_USE_CASE_PRIORITIES["image_generation"] = 99
 
 
 # --- SpaceConstrainedAdjustment Tests ---
@@ -301,6 +313,37 @@ class TestAdjustForSpaceRemoves:
         assert result.space_needed_gb == 70.0
 
 
+class TestRepeatedAdjustment:
+    """Tests for repeated adjustments with unchanged inputs."""
+
+    def test_repeated_calls_return_independent_results(self):
+        """Each call should build its own result; callers may mutate it."""
+        adjuster = SpaceConstrainedAdjustment()
+        storage = create_mock_storage(free_gb=50.0)
+        models = [create_mock_model(model_id=f"m{i}", size_gb=15.0) for i in range(4)]
+
+        first = adjuster.adjust_for_space(models, storage)
+        first.adjusted_models.clear()
+        second = adjuster.adjust_for_space(models, storage)
+
+        assert second is not first
+        assert len(second.adjusted_models) == 2
+
+    def test_changed_inputs_recompute(self):
+        """Results should follow changes to free space and buffer."""
+        adjuster = SpaceConstrainedAdjustment()
+        models = [create_mock_model(size_gb=30.0)]
+
+        tight = adjuster.adjust_for_space(models, create_mock_storage(free_gb=20.0))
+        roomy = adjuster.adjust_for_space(models, create_mock_storage(free_gb=100.0))
+        adjuster.buffer_gb = 0
+        no_buffer = adjuster.adjust_for_space(models, create_mock_storage(free_gb=30.0))
+
+        assert tight.fits is False
+        assert roomy.fits is True
+        assert no_buffer.fits is True
+
+
 class TestCloudFallback:
     """Tests for cloud fallback functionality."""
 
@@ -402,6 +445,26 @@ class TestSuggestions:
         assert len(no_cloud_warnings) == 1
 
 
+    def test_suggestion_codes_match_text(self):
+        """Should expose structured codes alongside rendered text."""
+        adjuster = SpaceConstrainedAdjustment()
+        storage = create_mock_storage(free_gb=20.0)
+        models = [
+            create_mock_model(model_id="a", size_gb=30.0, has_cloud=True),
+            create_mock_model(model_id="b", size_gb=30.0, has_cloud=False),
+        ]
+
+        result = adjuster.adjust_for_space(models, storage)
+
+        kinds = [kind for kind, _ in result.suggestion_codes]
+        assert kinds == [
+            SuggestionKind.FREE_UP_SPACE,
+            SuggestionKind.USE_CLOUD,
+            SuggestionKind.NO_CLOUD_ALTERNATIVE,
+        ]
+        assert len(result.suggestions) == len(result.suggestion_codes)
+
+
 class TestReorderByPriority:
     """Tests for priority reordering."""
 
@@ -453,6 +516,7 @@ class TestEstimateFit:
         assert estimate["models_that_fit"] == 2
         assert estimate["models_removed"] == 0
         assert estimate["total_size_gb"] == 50.0
+        assert estimate["fitted_size_gb"] == 50.0
 
     def test_partial_fit(self):
         """Should correctly estimate partial fit."""
@@ -471,6 +535,20 @@ class TestEstimateFit:
         assert estimate["models_that_fit"] == 1
         assert estimate["models_removed"] == 2
 
+    def test_multi_matches_single(self):
+        """Should match estimate_fit for each candidate drive."""
+        adjuster = SpaceConstrainedAdjustment(buffer_gb=10.0)
+        models = [
+            create_mock_model(model_id="a", size_gb=30.0, use_case="image_generation"),
+            create_mock_model(model_id="b", size_gb=40.0, use_case="video_generation"),
+            create_mock_model(model_id="c", size_gb=50.0, use_case="lora"),
+        ]
+        free_gbs = [0.0, 5.0, 40.0, 70.0, 80.0, 130.0, 500.0]
+
+        estimates = adjuster.estimate_fit_multi(models, free_gbs)
+
+        assert estimates == [adjuster.estimate_fit(models, f) for f in free_gbs]
+
 
 class TestFactoryFunction:
     """Tests for factory function."""
@@ -481,6 +559,21 @@ class TestFactoryFunction:
         assert isinstance(adjuster, SpaceConstrainedAdjustment)
         assert adjuster.priorities == DEFAULT_USE_CASE_PRIORITIES
 
+    def test_default_instance_not_shared(self):
+        """Changing one default adjuster should not affect later ones."""
+        first = create_space_adjustment()
+        first.buffer_gb = 0
+        second = create_space_adjustment()
+        assert second is not first
+        assert second.buffer_gb == WORKSPACE_BUFFER_GB
+
+    def test_create_with_custom_buffer(self):
+        """Should create a fresh instance with custom buffer."""
+        adjuster = create_space_adjustment(buffer_gb=20.0)
+        assert adjuster is not create_space_adjustment()
+        assert adjuster.buffer_gb == 20.0
+        assert adjuster.priorities == DEFAULT_USE_CASE_PRIORITIES
+
     def test_create_with_custom_priorities(self):
         """Should create instance with custom priorities."""
         custom = {"custom": 1}
@@ -491,38 +584,21 @@ class TestFactoryFunction:
 class TestEdgeCases:
     """Edge case tests."""
 
-    def test_zero_size_models(self):
-        """Should handle zero-size models."""
-        adjuster = SpaceConstrainedAdjustment()
-        storage = create_mock_storage(free_gb=10.0)
-        models = [create_mock_model(size_gb=0.0)]
-
-        result = adjuster.adjust_for_space(models, storage)
-
-        assert result.fits is True
-        assert len(result.adjusted_models) == 1
-
-    def test_exact_fit_with_buffer(self):
-        """Should handle exact fit with buffer."""
+    @pytest.mark.parametrize("free_gb,size_gb,expected_fits", [
+        (10.0, 0.0, True),    # Zero-size model fits in buffer-only space
+        (60.0, 50.0, True),   # 50 + 10 buffer = 60 = exactly available
+        (59.0, 50.0, False),  # 50 + 10 buffer = 60 > 59 available
+    ])
+    def test_buffer_boundaries(self, free_gb, size_gb, expected_fits):
+        """Should fit exactly up to the buffered free space."""
         adjuster = SpaceConstrainedAdjustment(buffer_gb=10.0)
-        storage = create_mock_storage(free_gb=60.0)
-        models = [create_mock_model(size_gb=50.0)]
+        storage = create_mock_storage(free_gb=free_gb)
+        models = [create_mock_model(size_gb=size_gb)]
 
         result = adjuster.adjust_for_space(models, storage)
 
-        # 50 + 10 buffer = 60 = exactly available
-        assert result.fits is True
-
-    def test_just_under_buffer(self):
-        """Should not fit when just under buffer threshold."""
-        adjuster = SpaceConstrainedAdjustment(buffer_gb=10.0)
-        storage = create_mock_storage(free_gb=59.0)
-        models = [create_mock_model(size_gb=50.0)]
-
-        result = adjuster.adjust_for_space(models, storage)
-
-        # 50 + 10 buffer = 60 > 59 available
-        assert result.fits is False
+        assert result.fits is expected_fits
+        assert len(result.adjusted_models) == (1 if expected_fits else 0)
 
     def test_many_small_models(self):
         """Should handle many small models correctly."""
@@ -0,0 +1,50 @@
+"""
+Tests for ComfyService installed-model discovery.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.services.comfy_service import ComfyService
+
+
+class TestGetInstalledModels:
+    """Tests for get_installed_models() directory walk."""
+
+    def test_missing_models_dir_returns_empty(self, tmp_path: Path) -> None:
+        """No models/ directory should yield an empty mapping."""
+        assert ComfyService.get_installed_models(str(tmp_path)) == {}
+
+    def test_lists_model_files_recursively(self, tmp_path: Path) -> None:
+        """Model files in category subfolders should be found; others ignored."""
+        checkpoints = tmp_path / "models" / "checkpoints"
+        (checkpoints / "sdxl").mkdir(parents=True)
+        (checkpoints / "base.safetensors").write_bytes(b"")
+        (checkpoints / "sdxl" / "refiner.ckpt").write_bytes(b"")
+        (checkpoints / "notes.txt").write_text("not a model")
+        (checkpoints / "folder.gguf").mkdir()
+        (tmp_path / "models" / "loras").mkdir()
+        (tmp_path / "models" / "loras" / "style.pth").write_bytes(b"")
+
+        result = ComfyService.get_installed_models(str(tmp_path))
+
+        assert sorted(result["checkpoints"]) == ["base.safetensors", "refiner.ckpt"]
+        assert result["loras"] == ["style.pth"]
+        assert result["vae"] == []
+        assert set(result) == {"checkpoints", "unet", "loras", "vae", "controlnet"}
+
+    def test_symlinked_dirs_not_followed(self, tmp_path: Path) -> None:
+        """A symlink cycle must not recurse; files beside it are still listed."""
+        sub = tmp_path / "models" / "checkpoints" / "sub"
+        sub.mkdir(parents=True)
+        (sub / "a.safetensors").write_bytes(b"")
+        (sub.parent / "b.ckpt").write_bytes(b"")
+        try:
+            (sub / "loop").symlink_to(sub.parent, target_is_directory=True)
+        except (OSError, NotImplementedError):
+            pytest.skip("symlinks not supported here")
+
+        result = ComfyService.get_installed_models(str(tmp_path))
+
+        assert sorted(result["checkpoints"]) == ["a.safetensors", "b.ckpt"]
@@ -8,9 +8,12 @@ import os
 import pytest
 import hashlib
 import tempfile
+import threading
 from pathlib import Path
-from unittest.mock import patch, MagicMock, PropertyMock
-from typing import Generator
+from socketserver import ThreadingMixIn
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+from unittest.mock import patch
+from typing import Generator, Optional
 
 import requests
 
@@ -21,9 +24,102 @@ from src.services.download_service import (
     DownloadError,
     HashMismatchError,
     DownloadTimeoutError,
+    _preallocate_file,
 )
 
 
+class _ThreadedWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+class FakeFileServer:
+    """In-process HTTP server serving in-memory files with Range support."""
+
+    def __init__(self) -> None:
+        self.files = {}
+        self.requests = {}
+        self._server = make_server(
+            "127.0.0.1", 0, self._app,
+            server_class=_ThreadedWSGIServer, handler_class=_QuietHandler
+        )
+        self.url = f"http://127.0.0.1:{self._server.server_port}"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def serve(self, name: str, content: bytes) -> str:
+        """Publish content under /file/<name> and return its URL."""
+        self.files[name] = content
+        self.requests[name] = []
+        return f"{self.url}/file/{name}"
+
+    def _app(self, environ, start_response):
+        name = environ["PATH_INFO"][len("/file/"):]
+        content = self.files.get(name)
+        if content is None:
+            start_response("404 Not Found", [("Content-Length", "0")])
+            return [b""]
+
+        range_header = environ.get("HTTP_RANGE")
+        self.requests[name].append({"method": environ["REQUEST_METHOD"], "range": range_header})
+
+        status, headers, body = "200 OK", [("Accept-Ranges", "bytes")], content
+        if range_header:
+            start, _, end = range_header[len("bytes="):].partition("-")
+            start = int(start)
+            end = int(end) if end else len(content) - 1
+            body = content[start:end + 1]
+            status = "206 Partial Content"
+            headers.append(("Content-Range", f"bytes {start}-{end}/{len(content)}"))
+
+        headers.append(("Content-Length", str(len(body))))
+        start_response(status, headers)
+        return [b""] if environ["REQUEST_METHOD"] == "HEAD" else [body]
+
+
+@pytest.fixture(scope="module")
+def http() -> Generator[FakeFileServer, None, None]:
+    """Shared in-process file server for real requests/urllib3 round trips."""
+    server = FakeFileServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+class _StubResponse:
+    """Plain stand-in for requests.Response; no MagicMock child-attribute tree."""
+
+    __slots__ = ("status_code", "headers", "content", "_chunks")
+
+    def __init__(self, headers=None, chunks=(), status_code: int = 200, content: bytes = b"") -> None:
+        self.status_code = status_code
+        self.headers = headers if headers is not None else {}
+        self.content = content
+        self._chunks = chunks
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def iter_content(self, chunk_size=None):
+        return iter(self._chunks)
+
+    def __enter__(self) -> "_StubResponse":
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        return False
+
+
 class TestDownloadServiceBasic:
     """Basic download service functionality tests."""
 
@@ -46,6 +142,13 @@ class TestDownloadServiceBasic:
         assert task.expected_hash is None
         assert task.priority == 0
 
+    def test_download_task_is_slotted(self) -> None:
+        """DownloadTask should be a slotted, immutable value."""
+        task = DownloadTask(url="https://example.com/file.bin", dest_path="/tmp/file.bin")
+        assert not hasattr(task, '__dict__')
+        with pytest.raises(AttributeError):
+            task.priority = 5
+
     def test_download_result_dataclass(self) -> None:
         """DownloadResult should hold result information."""
         result = DownloadResult(
@@ -146,11 +249,13 @@ class TestHashVerification:
 class TestGetFileSize:
     """Tests for get_file_size() remote file size check."""
 
+    def setup_method(self) -> None:
+        DownloadService.clear_probe_cache()
+
     def test_get_file_size_success(self) -> None:
         """get_file_size should return content-length from headers."""
-        with patch('requests.head') as mock_head:
-            mock_response = MagicMock()
-            mock_response.headers = {'content-length': '1048576'}
+        with patch('requests.Session.head') as mock_head:
+            mock_response = _StubResponse(headers={'content-length': '1048576'})
             mock_head.return_value = mock_response
 
             size = DownloadService.get_file_size("https://example.com/file.bin")
@@ -158,9 +263,8 @@ class TestGetFileSize:
 
     def test_get_file_size_no_content_length(self) -> None:
         """get_file_size should return None if no content-length header."""
-        with patch('requests.head') as mock_head:
-            mock_response = MagicMock()
-            mock_response.headers = {}
+        with patch('requests.Session.head') as mock_head:
+            mock_response = _StubResponse(headers={})
             mock_head.return_value = mock_response
 
             size = DownloadService.get_file_size("https://example.com/file.bin")
@@ -168,7 +272,7 @@ class TestGetFileSize:
 
     def test_get_file_size_timeout(self) -> None:
         """get_file_size should return None on timeout."""
-        with patch('requests.head') as mock_head:
+        with patch('requests.Session.head') as mock_head:
             mock_head.side_effect = requests.exceptions.Timeout()
 
             size = DownloadService.get_file_size("https://example.com/file.bin")
@@ -176,65 +280,105 @@ class TestGetFileSize:
 
     def test_get_file_size_request_error(self) -> None:
         """get_file_size should return None on request error (no silent exception)."""
-        with patch('requests.head') as mock_head:
+        with patch('requests.Session.head') as mock_head:
             mock_head.side_effect = requests.exceptions.ConnectionError()
 
             # Per ARCHITECTURE_PRINCIPLES: Returns None, not raises
             size = DownloadService.get_file_size("https://example.com/file.bin")
             assert size is None
 
+    def test_get_file_size_cached(self) -> None:
+        """get_file_size should reuse a recent probe for the same URL."""
+        with patch('requests.Session.head') as mock_head:
+            mock_response = _StubResponse(headers={'content-length': '2048'})
+            mock_head.return_value = mock_response
+
+            assert DownloadService.get_file_size("https://example.com/file.bin") == 2048
+            assert DownloadService.get_file_size("https://example.com/file.bin") == 2048
+            assert mock_head.call_count == 1
+
+    def test_get_file_size_failure_not_cached(self) -> None:
+        """get_file_size should retry the probe after a failure."""
+        with patch('requests.Session.head') as mock_head:
+            mock_response = _StubResponse(headers={'content-length': '2048'})
+            mock_head.side_effect = [requests.exceptions.Timeout(), mock_response]
+
+            assert DownloadService.get_file_size("https://example.com/file.bin") is None
+            assert DownloadService.get_file_size("https://example.com/file.bin") == 2048
+
+    def test_get_file_size_cache_expires(self) -> None:
+        """get_file_size should probe again once the cache entry expires."""
+        with patch('requests.Session.head') as mock_head, \
+             patch.object(DownloadService, 'PROBE_CACHE_TTL', 0):
+            mock_response = _StubResponse(headers={'content-length': '2048'})
+            mock_head.return_value = mock_response
+
+            DownloadService.get_file_size("https://example.com/file.bin")
+            DownloadService.get_file_size("https://example.com/file.bin")
+            assert mock_head.call_count == 2
+
+    def test_probe_cache_is_bounded(self) -> None:
+        """The probe cache should evict least recently used URLs past its size."""
+        with patch('requests.Session.head') as mock_head, \
+             patch.object(DownloadService, 'PROBE_CACHE_SIZE', 2):
+            mock_head.return_value = _StubResponse(headers={'content-length': '2048'})
+
+            for name in ("a", "b", "a", "c"):
+                DownloadService.get_file_size(f"https://example.com/{name}.bin")
+
+            assert list(DownloadService._probe_cache) == [
+                "https://example.com/a.bin", "https://example.com/c.bin"
+            ]
+
+    def test_expired_probe_evicted_on_lookup(self) -> None:
+        """An expired entry should be removed, not left in the cache."""
+        with patch('requests.Session.head') as mock_head, \
+             patch.object(DownloadService, 'PROBE_CACHE_TTL', 0):
+            mock_head.side_effect = [
+                _StubResponse(headers={'content-length': '2048'}),
+                requests.exceptions.ConnectionError(),
+            ]
+
+            DownloadService.get_file_size("https://example.com/file.bin")
+            DownloadService.get_file_size("https://example.com/file.bin")
+
+            assert "https://example.com/file.bin" not in DownloadService._probe_cache
+
 
 class TestDownloadFile:
     """Tests for download_file() with retry logic."""
 
-    def test_download_file_success(self) -> None:
+    def test_download_file_success(self, http) -> None:
         """download_file should successfully download and save file."""
+        content = b"file content data"
+        url = http.serve("success.bin", content)
+
         with tempfile.TemporaryDirectory() as temp_dir:
             dest_path = os.path.join(temp_dir, "subdir", "downloaded.bin")
-            content = b"file content data"
-
-            with patch('requests.get') as mock_get:
-                mock_response = MagicMock()
-                mock_response.headers = {'content-length': str(len(content))}
-                mock_response.iter_content.return_value = [content]
-                mock_response.__enter__ = MagicMock(return_value=mock_response)
-                mock_response.__exit__ = MagicMock(return_value=False)
-                mock_get.return_value = mock_response
 
-                result = DownloadService.download_file(
-                    url="https://example.com/file.bin",
-                    dest_path=dest_path
-                )
+            result = DownloadService.download_file(url=url, dest_path=dest_path)
 
-                assert result is True
-                assert os.path.exists(dest_path)
-                with open(dest_path, 'rb') as f:
-                    assert f.read() == content
+            assert result is True
+            assert os.path.exists(dest_path)
+            with open(dest_path, 'rb') as f:
+                assert f.read() == content
 
-    def test_download_file_creates_parent_dirs(self) -> None:
+    def test_download_file_creates_parent_dirs(self, http) -> None:
         """download_file should create parent directories."""
+        url = http.serve("parents.bin", b"test!")
+
         with tempfile.TemporaryDirectory() as temp_dir:
             dest_path = os.path.join(temp_dir, "a", "b", "c", "file.bin")
 
-            with patch('requests.get') as mock_get:
-                mock_response = MagicMock()
-                mock_response.headers = {'content-length': '5'}
-                mock_response.iter_content.return_value = [b"test!"]
-                mock_response.__enter__ = MagicMock(return_value=mock_response)
-                mock_response.__exit__ = MagicMock(return_value=False)
-                mock_get.return_value = mock_response
-
-                result = DownloadService.download_file(
-                    url="https://example.com/file.bin",
-                    dest_path=dest_path
-                )
+            result = DownloadService.download_file(url=url, dest_path=dest_path)
 
-                assert result is True
-                assert os.path.exists(dest_path)
+            assert result is True
+            assert os.path.exists(dest_path)
 
-    def test_download_file_progress_callback(self) -> None:
+    def test_download_file_progress_callback(self, http) -> None:
         """download_file should call progress callback."""
         progress_calls = []
+        url = http.serve("progress.bin", b"0123456789" * 3)
 
         def progress_cb(downloaded: int, total: int) -> None:
             progress_calls.append((downloaded, total))
@@ -242,69 +386,66 @@ class TestDownloadFile:
         with tempfile.TemporaryDirectory() as temp_dir:
             dest_path = os.path.join(temp_dir, "file.bin")
 
-            with patch('requests.get') as mock_get:
-                mock_response = MagicMock()
-                mock_response.headers = {'content-length': '30'}
-                mock_response.iter_content.return_value = [b"0123456789"] * 3
-                mock_response.__enter__ = MagicMock(return_value=mock_response)
-                mock_response.__exit__ = MagicMock(return_value=False)
-                mock_get.return_value = mock_response
-
+            with patch.object(DownloadService, '_chunk_size_for_rate', return_value=10):
                 DownloadService.download_file(
-                    url="https://example.com/file.bin",
+                    url=url,
                     dest_path=dest_path,
                     progress_callback=progress_cb
                 )
 
-                # Should have 3 progress updates
-                assert len(progress_calls) == 3
-                assert progress_calls[-1][0] == 30  # Final downloaded bytes
+            # Should have 3 progress updates
+            assert len(progress_calls) == 3
+            assert progress_calls[-1] == (30, 30)  # Final downloaded bytes
 
-    def test_download_file_hash_verification_pass(self) -> None:
+    def test_download_file_hash_verification_pass(self, http) -> None:
         """download_file should verify hash when provided."""
         content = b"content with known hash"
         expected_hash = hashlib.sha256(content).hexdigest()
+        url = http.serve("hash_pass.bin", content)
 
         with tempfile.TemporaryDirectory() as temp_dir:
             dest_path = os.path.join(temp_dir, "file.bin")
 
-            with patch('requests.get') as mock_get:
-                mock_response = MagicMock()
-                mock_response.headers = {'content-length': str(len(content))}
-                mock_response.iter_content.return_value = [content]
-                mock_response.__enter__ = MagicMock(return_value=mock_response)
-                mock_response.__exit__ = MagicMock(return_value=False)
-                mock_get.return_value = mock_response
+            result = DownloadService.download_file(
+                url=url,
+                dest_path=dest_path,
+                expected_hash=expected_hash
+            )
 
-                result = DownloadService.download_file(
-                    url="https://example.com/file.bin",
+            assert result is True
+
+    def test_download_file_hash_mismatch_raises(self, http) -> None:
+        """download_file should raise HashMismatchError on hash mismatch."""
+        url = http.serve("hash_mismatch.bin", b"some content")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            dest_path = os.path.join(temp_dir, "file.bin")
+
+            with pytest.raises(HashMismatchError):
+                DownloadService.download_file(
+                    url=url,
                     dest_path=dest_path,
-                    expected_hash=expected_hash
+                    expected_hash="wrong_hash_value"
                 )
 
-                assert result is True
-
-    def test_download_file_hash_mismatch_raises(self) -> None:
-        """download_file should raise HashMismatchError on hash mismatch."""
-        content = b"some content"
+    def test_download_file_hash_computed_inline(self, http) -> None:
+        """download_file should hash while streaming, not re-read the file."""
+        content = b"content hashed during streaming"
+        expected_hash = hashlib.sha256(content).hexdigest()
+        url = http.serve("hash_inline.bin", content)
 
         with tempfile.TemporaryDirectory() as temp_dir:
             dest_path = os.path.join(temp_dir, "file.bin")
 
-            with patch('requests.get') as mock_get:
-                mock_response = MagicMock()
-                mock_response.headers = {'content-length': str(len(content))}
-                mock_response.iter_content.return_value = [content]
-                mock_response.__enter__ = MagicMock(return_value=mock_response)
-                mock_response.__exit__ = MagicMock(return_value=False)
-                mock_get.return_value = mock_response
+            with patch.object(DownloadService, 'verify_hash') as mock_verify:
+                result = DownloadService.download_file(
+                    url=url,
+                    dest_path=dest_path,
+                    expected_hash=expected_hash
+                )
 
-                with pytest.raises(HashMismatchError):
-                    DownloadService.download_file(
-                        url="https://example.com/file.bin",
-                        dest_path=dest_path,
-                        expected_hash="wrong_hash_value"
-                    )
+            assert result is True
+            assert mock_verify.call_count == 0
 
     def test_download_file_retry_on_timeout(self) -> None:
         """download_file should retry on timeout."""
@@ -313,13 +454,12 @@ class TestDownloadFile:
         with tempfile.TemporaryDirectory() as temp_dir:
             dest_path = os.path.join(temp_dir, "file.bin")
 
-            with patch('requests.get') as mock_get:
+            with patch('requests.Session.get') as mock_get:
                 # First call times out, second succeeds
-                mock_response = MagicMock()
-                mock_response.headers = {'content-length': str(len(content))}
-                mock_response.iter_content.return_value = [content]
-                mock_response.__enter__ = MagicMock(return_value=mock_response)
-                mock_response.__exit__ = MagicMock(return_value=False)
+                mock_response = _StubResponse(
+                    headers={'content-length': str(len(content))},
+                    chunks=[content],
+                )
 
                 mock_get.side_effect = [
                     requests.exceptions.Timeout(),
@@ -340,7 +480,7 @@ class TestDownloadFile:
         with tempfile.TemporaryDirectory() as temp_dir:
             dest_path = os.path.join(temp_dir, "file.bin")
 
-            with patch('requests.get') as mock_get:
+            with patch('requests.Session.get') as mock_get:
                 mock_get.side_effect = requests.exceptions.Timeout()
 
                 with patch('time.sleep'):  # Skip actual sleep
@@ -364,13 +504,13 @@ class TestDownloadQueue:
             dest_path = os.path.join(temp_dir, "file.bin")
             task = DownloadTask(url="https://example.com/file.bin", dest_path=dest_path)
 
-            with patch.object(DownloadService, 'download_file', return_value=True):
-                with patch('os.path.getsize', return_value=len(content)):
-                    service = DownloadService()
-                    results = service.download_queue([task])
+            with patch.object(DownloadService, 'fetch_file', return_value=len(content)):
+                service = DownloadService()
+                results = service.download_queue([task])
 
             assert len(results) == 1
             assert results[0].success is True
+            assert results[0].bytes_downloaded == len(content)
 
     def test_download_queue_multiple_tasks(self) -> None:
         """download_queue should handle multiple concurrent tasks."""
@@ -383,10 +523,9 @@ class TestDownloadQueue:
                 for i in range(3)
             ]
 
-            with patch.object(DownloadService, 'download_file', return_value=True):
-                with patch('os.path.getsize', return_value=100):
-                    service = DownloadService()
-                    results = service.download_queue(tasks)
+            with patch.object(DownloadService, 'fetch_file', return_value=100):
+                service = DownloadService()
+                results = service.download_queue(tasks)
 
             assert len(results) == 3
             assert all(r.success for r in results)
@@ -395,9 +534,9 @@ class TestDownloadQueue:
         """download_queue should process by priority (lower = higher priority)."""
         download_order = []
 
-        def mock_download_file(url: str, dest_path: str, **kwargs) -> bool:
+        def mock_fetch_file(url: str, dest_path: str, **kwargs) -> int:
             download_order.append(url)
-            return True
+            return 100
 
         with tempfile.TemporaryDirectory() as temp_dir:
             tasks = [
@@ -409,26 +548,98 @@ class TestDownloadQueue:
                             dest_path=os.path.join(temp_dir, "med.bin"), priority=5),
             ]
 
-            with patch.object(DownloadService, 'download_file', side_effect=mock_download_file):
-                with patch('os.path.getsize', return_value=100):
-                    service = DownloadService()
-                    service.download_queue(tasks, max_concurrent=1)
+            with patch.object(DownloadService, 'fetch_file', side_effect=mock_fetch_file):
+                service = DownloadService()
+                service.download_queue(tasks, max_concurrent=1)
 
             # With max_concurrent=1, should be in priority order
             assert download_order[0] == "https://example.com/high.bin"
             assert download_order[1] == "https://example.com/med.bin"
             assert download_order[2] == "https://example.com/low.bin"
 
+    def test_download_queue_dynamic_enqueue(self) -> None:
+        """Tasks enqueued mid-run should be ordered against waiting tasks."""
+        download_order = []
+        service = None
+
+        def mock_fetch_file(url: str, dest_path: str, **kwargs) -> int:
+            download_order.append(url)
+            if url.endswith("first.bin"):
+                urgent = DownloadTask(url="https://example.com/urgent.bin",
+                                      dest_path=dest_path + ".urgent", priority=0)
+                assert service.enqueue(urgent) is True
+            return 100
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tasks = [
+                DownloadTask(url="https://example.com/first.bin",
+                            dest_path=os.path.join(temp_dir, "first.bin"), priority=1),
+                DownloadTask(url="https://example.com/bulk.bin",
+                            dest_path=os.path.join(temp_dir, "bulk.bin"), priority=5),
+            ]
+
+            with patch.object(DownloadService, 'fetch_file', side_effect=mock_fetch_file):
+                service = DownloadService()
+                results = service.download_queue(tasks, max_concurrent=1)
+
+        assert download_order == [
+            "https://example.com/first.bin",
+            "https://example.com/urgent.bin",
+            "https://example.com/bulk.bin",
+        ]
+        assert len(results) == 3
+
+    def test_concurrent_queue_runs_keep_their_results(self) -> None:
+        """Two download_queue calls on one service should not mix results."""
+        both_started = threading.Barrier(2)
+
+        def mock_fetch_file(url: str, dest_path: str, **kwargs) -> int:
+            if url.endswith("0.bin"):
+                both_started.wait(timeout=5)
+            return 100
+
+        def make_tasks(run: str) -> list:
+            return [
+                DownloadTask(url=f"https://example.com/{run}{i}.bin",
+                             dest_path=f"/tmp/{run}{i}.bin")
+                for i in range(6)
+            ]
+
+        runs = {}
+        with patch.object(DownloadService, 'fetch_file', side_effect=mock_fetch_file), \
+             patch.object(DownloadService, '_update_task_status'):
+            service = DownloadService()
+            threads = [
+                threading.Thread(
+                    target=lambda r=run: runs.__setitem__(r, service.download_queue(make_tasks(r)))
+                )
+                for run in ("a", "b")
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=10)
+
+        for run in ("a", "b"):
+            urls = sorted(result.url for result in runs[run])
+            assert urls == sorted(task.url for task in make_tasks(run))
+
+    def test_enqueue_without_running_queue(self) -> None:
+        """enqueue should refuse tasks when no queue run is active."""
+        service = DownloadService()
+        task = DownloadTask(url="https://example.com/file.bin", dest_path="/tmp/file.bin")
+        assert service.enqueue(task) is False
+
     def test_download_queue_partial_failure(self) -> None:
         """download_queue should capture individual task failures."""
         call_count = 0
 
-        def mock_download_file(url: str, dest_path: str, **kwargs) -> bool:
+        def mock_fetch_file(url: str, dest_path: str, **kwargs) -> Optional[int]:
             nonlocal call_count
             call_count += 1
             if "fail" in url:
-                return False
-            return True
+                return None
+            return 100
 
         with tempfile.TemporaryDirectory() as temp_dir:
             tasks = [
@@ -438,10 +649,9 @@ class TestDownloadQueue:
                             dest_path=os.path.join(temp_dir, "fail.bin")),
             ]
 
-            with patch.object(DownloadService, 'download_file', side_effect=mock_download_file):
-                with patch('os.path.getsize', return_value=100):
-                    service = DownloadService()
-                    results = service.download_queue(tasks)
+            with patch.object(DownloadService, 'fetch_file', side_effect=mock_fetch_file):
+                service = DownloadService()
+                results = service.download_queue(tasks)
 
             assert len(results) == 2
             successes = [r for r in results if r.success]
@@ -449,9 +659,111 @@ class TestDownloadQueue:
             assert len(successes) == 1
             assert len(failures) == 1
 
+    def test_download_queue_forwards_progress(self) -> None:
+        """download_queue should tag progress updates with the task URL."""
+        updates = []
+
+        def mock_fetch_file(url: str, dest_path: str, progress_callback=None, **kwargs) -> int:
+            progress_callback(50, 100)
+            return 100
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            task = DownloadTask(
+                url="https://example.com/file.bin",
+                dest_path=os.path.join(temp_dir, "file.bin")
+            )
+
+            with patch.object(DownloadService, 'fetch_file', side_effect=mock_fetch_file):
+                service = DownloadService()
+                service.download_queue(
+                    [task],
+                    progress_callback=lambda *args: updates.append(args)
+                )
+
+        assert updates == [("https://example.com/file.bin", 50, 100)]
+
+    def test_download_queue_no_callback_passes_none(self) -> None:
+        """download_queue should not wrap a missing progress callback."""
+        received = []
+
+        def mock_fetch_file(url: str, dest_path: str, progress_callback=None, **kwargs) -> int:
+            received.append(progress_callback)
+            return 100
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            task = DownloadTask(
+                url="https://example.com/file.bin",
+                dest_path=os.path.join(temp_dir, "file.bin")
+            )
+
+            with patch.object(DownloadService, 'fetch_file', side_effect=mock_fetch_file):
+                service = DownloadService()
+                service.download_queue([task])
+
+        assert received == [None]
+
+    def test_download_queue_prewarms_hosts(self) -> None:
+        """download_queue should open a connection to each host before any download."""
+        calls = []
+
+        def mock_head(url: str, **kwargs) -> _StubResponse:
+            calls.append(("HEAD", url))
+            return _StubResponse()
+
+        def mock_fetch_file(url: str, dest_path: str, **kwargs) -> int:
+            calls.append(("GET", url))
+            return 100
+
+        DownloadService.clear_probe_cache()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tasks = [
+                DownloadTask(url=url, dest_path=os.path.join(temp_dir, f"file{i}.bin"))
+                for i, url in enumerate([
+                    "https://huggingface.co/a.bin",
+                    "https://civitai.com/b.bin",
+                    "https://huggingface.co/c.bin",
+                ])
+            ]
+
+            with patch('requests.Session.head', side_effect=mock_head), \
+                 patch.object(DownloadService, 'fetch_file', side_effect=mock_fetch_file):
+                service = DownloadService()
+                service.download_queue(tasks)
+
+        heads = [url for method, url in calls[:2] if method == "HEAD"]
+        assert sorted(heads) == ["https://civitai.com/b.bin", "https://huggingface.co/a.bin"]
+        assert [method for method, _ in calls[2:]] == ["GET"] * 3
+
+    def test_prewarm_limited_to_pooled_hosts(self) -> None:
+        """Only as many hosts as the session keeps pools for should be warmed."""
+        DownloadService.clear_probe_cache()
+        urls = [f"https://host{i}.example/model.bin" for i in range(6)]
+
+        with patch('requests.Session.head', return_value=_StubResponse()) as mock_head:
+            DownloadService._prewarm_hosts(urls)
+
+        warmed = sorted(c.args[0] for c in mock_head.call_args_list)
+        assert warmed == urls[:DownloadService.MAX_CONCURRENT]
+
+    def test_download_queue_single_host_skips_prewarm(self) -> None:
+        """download_queue should not prewarm when every task shares a host."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tasks = [
+                DownloadTask(url=f"https://example.com/file{i}.bin",
+                            dest_path=os.path.join(temp_dir, f"file{i}.bin"))
+                for i in range(2)
+            ]
+
+            with patch('requests.Session.head') as mock_head, \
+                 patch.object(DownloadService, 'fetch_file', return_value=100):
+                service = DownloadService()
+                service.download_queue(tasks)
+
+        mock_head.assert_not_called()
+
     def test_download_queue_hash_mismatch_captured(self) -> None:
         """download_queue should capture hash mismatch errors."""
-        def mock_download_file(url: str, dest_path: str, **kwargs) -> bool:
+        def mock_fetch_file(url: str, dest_path: str, **kwargs) -> int:
             raise HashMismatchError("Hash mismatch for test file")
 
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -461,7 +773,7 @@ class TestDownloadQueue:
                 expected_hash="expected_hash"
             )
 
-            with patch.object(DownloadService, 'download_file', side_effect=mock_download_file):
+            with patch.object(DownloadService, 'fetch_file', side_effect=mock_fetch_file):
                 service = DownloadService()
                 results = service.download_queue([task])
 
@@ -470,11 +782,62 @@ class TestDownloadQueue:
             assert "Hash mismatch" in results[0].error
 
 
+class TestSyncMode:
+    """Tests for download_queue durability modes."""
+
+    def _run_queue(self, temp_dir: str, sync_mode: str, sync_calls: list) -> None:
+        def mock_fetch_file(url: str, dest_path: str, **kwargs) -> int:
+            # Files must all be complete before a batch sync starts
+            assert sync_calls == [] or sync_mode == "per_file"
+            return 100
+
+        tasks = [
+            DownloadTask(url=f"https://example.com/file{i}.bin",
+                        dest_path=os.path.join(temp_dir, f"file{i}.bin"))
+            for i in range(3)
+        ]
+        with patch.object(DownloadService, 'fetch_file', side_effect=mock_fetch_file), \
+             patch('src.services.download_service._sync_file',
+                   side_effect=sync_calls.append):
+            service = DownloadService(sync_mode=sync_mode)
+            service.download_queue(tasks, max_concurrent=1)
+
+    def test_download_sync_mode_off(self) -> None:
+        """sync_mode='off' should never flush files."""
+        sync_calls = []
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self._run_queue(temp_dir, "off", sync_calls)
+        assert sync_calls == []
+
+    def test_download_sync_mode_per_file(self) -> None:
+        """sync_mode='per_file' should flush each completed file."""
+        sync_calls = []
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self._run_queue(temp_dir, "per_file", sync_calls)
+        assert len(sync_calls) == 3
+
+    def test_download_sync_mode_batch(self) -> None:
+        """sync_mode='batch' should flush all files once the run finishes."""
+        sync_calls = []
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self._run_queue(temp_dir, "batch", sync_calls)
+            assert sorted(sync_calls) == [
+                os.path.join(temp_dir, f"file{i}.bin") for i in range(3)
+            ]
+
+    def test_invalid_sync_mode(self) -> None:
+        """Unknown sync modes should be rejected."""
+        with pytest.raises(ValueError):
+            DownloadService(sync_mode="sometimes")
+
+
 class TestResumeSupport:
     """Tests for download resume functionality via Range headers."""
 
-    def test_download_resume_sends_range_header(self) -> None:
+    def test_download_resume_sends_range_header(self, http) -> None:
         """download_file should send Range header for partial files."""
+        url = http.serve("resume_range.bin", b"partial content and more")
+
         with tempfile.TemporaryDirectory() as temp_dir:
             dest_path = os.path.join(temp_dir, "file.bin")
             temp_path = dest_path + ".tmp"
@@ -483,26 +846,388 @@ class TestResumeSupport:
             with open(temp_path, 'wb') as f:
                 f.write(b"partial content")  # 15 bytes
 
-            remaining_content = b" and more"
+            DownloadService.download_file(url=url, dest_path=dest_path)
+
+            # Check Range header was sent
+            assert http.requests["resume_range.bin"][-1]["range"] == 'bytes=15-'
+            with open(dest_path, 'rb') as f:
+                assert f.read() == b"partial content and more"
+
+    def test_fetch_file_reports_full_size_after_resume(self, http) -> None:
+        """fetch_file should return the size of the whole completed file."""
+        url = http.serve("resume_size.bin", b"partial content and more")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            dest_path = os.path.join(temp_dir, "file.bin")
+            with open(dest_path + ".tmp", 'wb') as f:
+                f.write(b"partial content")
+
+            size = DownloadService.fetch_file(url=url, dest_path=dest_path)
+
+            assert size == os.path.getsize(dest_path) == 24
+
+    def test_download_resume_hash_includes_partial_content(self, http) -> None:
+        """download_file should verify the hash over the resumed prefix too."""
+        partial = b"partial content"
+        remaining_content = b" and more"
+        expected_hash = hashlib.sha256(partial + remaining_content).hexdigest()
+        url = http.serve("resume_hash.bin", partial + remaining_content)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            dest_path = os.path.join(temp_dir, "file.bin")
+            with open(dest_path + ".tmp", 'wb') as f:
+                f.write(partial)
+
+            result = DownloadService.download_file(
+                url=url,
+                dest_path=dest_path,
+                expected_hash=expected_hash
+            )
+
+            assert result is True
+
+
+def _make_range_get(content: bytes, status_code: int = 206):
+    """Build a requests.get stand-in that serves byte ranges of content."""
+    requested_ranges = []
+
+    def fake_get(url, headers=None, **kwargs):
+        start, end = headers["Range"][len("bytes="):].split("-")
+        start, end = int(start), int(end)
+        requested_ranges.append((start, end))
+        body = content[start:end + 1] if status_code == 206 else content
+
+        response_headers = {'content-length': str(len(body))}
+        if status_code == 206:
+            response_headers['content-range'] = f"bytes {start}-{end}/{len(content)}"
+        return _StubResponse(
+            headers=response_headers,
+            chunks=[body],
+            status_code=status_code,
+        )
+
+    return fake_get, requested_ranges
+
+
+class TestParallelDownload:
+    """Tests for multi-part byte-range downloads."""
+
+    def setup_method(self) -> None:
+        DownloadService.clear_probe_cache()
+
+    def test_download_file_multipart_parallel(self) -> None:
+        """download_file should fetch ranges concurrently and reassemble them."""
+        content = bytes(range(256)) * 12  # 3072 bytes
+        head_response = _StubResponse(headers={
+            'content-length': str(len(content)),
+            'accept-ranges': 'bytes',
+        })
+        fake_get, requested_ranges = _make_range_get(content)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            dest_path = os.path.join(temp_dir, "file.bin")
+
+            with patch.object(DownloadService, 'MULTIPART_MIN_SIZE', 1024), \
+                 patch.object(DownloadService, 'MULTIPART_PART_SIZE', 1024), \
+                 patch('requests.Session.head', return_value=head_response), \
+                 patch('requests.Session.get', side_effect=fake_get):
+                result = DownloadService.download_file(
+                    url="https://example.com/file.bin",
+                    dest_path=dest_path,
+                    expected_hash=hashlib.sha256(content).hexdigest(),
+                    parallel_parts=3
+                )
+
+            assert result is True
+            assert sorted(requested_ranges) == [(0, 1023), (1024, 2047), (2048, 3071)]
+            with open(dest_path, 'rb') as f:
+                assert f.read() == content
+
+    def test_download_file_multipart_falls_back_without_206(self) -> None:
+        """download_file should fall back to one stream if ranges are ignored."""
+        content = b"x" * 2048
+        head_response = _StubResponse(headers={
+            'content-length': str(len(content)),
+            'accept-ranges': 'bytes',
+        })
+        range_get, _ = _make_range_get(content, status_code=200)
+        calls = []
+
+        def fake_get(url, headers=None, **kwargs):
+            calls.append(dict(headers))
+            if "Range" in headers:
+                return range_get(url, headers=headers)
+            return _StubResponse(
+                headers={'content-length': str(len(content))},
+                chunks=[content],
+            )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            dest_path = os.path.join(temp_dir, "file.bin")
+
+            with patch.object(DownloadService, 'MULTIPART_MIN_SIZE', 1024), \
+                 patch.object(DownloadService, 'MULTIPART_PART_SIZE', 1024), \
+                 patch('requests.Session.head', return_value=head_response), \
+                 patch('requests.Session.get', side_effect=fake_get):
+                result = DownloadService.download_file(
+                    url="https://example.com/file.bin",
+                    dest_path=dest_path,
+                    parallel_parts=2
+                )
+
+            assert result is True
+            assert "Range" not in calls[-1]
+            with open(dest_path, 'rb') as f:
+                assert f.read() == content
+
+    def test_download_parts_rejects_truncated_part(self, tmp_path) -> None:
+        """A part shorter than its range should fail instead of leaving a hole."""
+        content = bytes(range(256)) * 8  # 2048 bytes
+        range_get, _ = _make_range_get(content)
+
+        def short_get(url, headers=None, **kwargs):
+            response = range_get(url, headers=headers)
+            if headers["Range"].startswith("bytes=1024-"):
+                response._chunks = [response._chunks[0][:100]]
+            return response
+
+        with patch.object(DownloadService, 'MULTIPART_PART_SIZE', 1024), \
+             patch('requests.Session.get', side_effect=short_get):
+            with pytest.raises(DownloadError, match="truncated"):
+                DownloadService._download_parts(
+                    "https://example.com/file.bin", str(tmp_path / "file.tmp"),
+                    len(content), {}, 2, None, 30
+                )
+
+    def test_download_parts_rejects_wrong_content_range(self, tmp_path) -> None:
+        """A part served from a different offset should be rejected."""
+        content = b"y" * 2048
 
-            with patch('requests.get') as mock_get:
-                mock_response = MagicMock()
-                mock_response.headers = {'content-length': str(len(remaining_content))}
-                mock_response.iter_content.return_value = [remaining_content]
-                mock_response.__enter__ = MagicMock(return_value=mock_response)
-                mock_response.__exit__ = MagicMock(return_value=False)
+        def shifted_get(url, headers=None, **kwargs):
+            return _StubResponse(
+                headers={'content-range': f"bytes 0-1023/{len(content)}"},
+                chunks=[content[:1024]],
+                status_code=206,
+            )
+
+        with patch.object(DownloadService, 'MULTIPART_PART_SIZE', 1024), \
+             patch('requests.Session.get', side_effect=shifted_get):
+            with pytest.raises(DownloadError, match="returned range"):
+                DownloadService._download_parts(
+                    "https://example.com/file.bin", str(tmp_path / "file.tmp"),
+                    len(content), {}, 2, None, 30
+                )
+
+    def test_download_file_small_file_single_stream(self) -> None:
+        """download_file should not split files below MULTIPART_MIN_SIZE."""
+        content = b"small"
+        head_response = _StubResponse(headers={
+            'content-length': str(len(content)),
+            'accept-ranges': 'bytes',
+        })
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            dest_path = os.path.join(temp_dir, "file.bin")
+
+            with patch('requests.Session.head', return_value=head_response), \
+                 patch('requests.Session.get') as mock_get:
+                mock_response = _StubResponse(
+                    headers={'content-length': str(len(content))},
+                    chunks=[content],
+                )
                 mock_get.return_value = mock_response
 
-                DownloadService.download_file(
+                result = DownloadService.download_file(
                     url="https://example.com/file.bin",
-                    dest_path=dest_path
+                    dest_path=dest_path,
+                    parallel_parts=4
+                )
+
+            assert result is True
+            assert mock_get.call_count == 1
+            assert "Range" not in mock_get.call_args[1]['headers']
+
+
+class TestFetchRanges:
+    """Tests for fetching several byte ranges in one request."""
+
+    CONTENT = bytes(range(256)) * 4
+
+    def _response(self, status_code, body, headers):
+        chunks = [body[i:i + 256] for i in range(0, len(body), 256)]
+        return _StubResponse(
+            headers=headers, status_code=status_code, content=body, chunks=chunks
+        )
+
+    def test_fetch_ranges_multipart(self) -> None:
+        """fetch_ranges should split a multipart/byteranges reply."""
+        content = self.CONTENT
+        body = (
+            b"--SEP\r\n"
+            b"Content-Type: application/octet-stream\r\n"
+            b"Content-Range: bytes 0-9/1024\r\n\r\n"
+            + content[0:10] +
+            b"\r\n--SEP\r\n"
+            b"Content-Type: application/octet-stream\r\n"
+            b"Content-Range: bytes 500-519/1024\r\n\r\n"
+            + content[500:520] +
+            b"\r\n--SEP--\r\n"
+        )
+        response = self._response(
+            206, body, {'content-type': 'multipart/byteranges; boundary=SEP'}
+        )
+
+        with patch('requests.Session.get', return_value=response) as mock_get:
+            parts = DownloadService.fetch_ranges(
+                "https://example.com/file.bin", [(500, 519), (0, 9)]
+            )
+
+        assert mock_get.call_count == 1
+        assert mock_get.call_args[1]['headers']['Range'] == 'bytes=500-519,0-9'
+        assert parts == [content[500:520], content[0:10]]
+
+    def test_fetch_ranges_single_part(self) -> None:
+        """fetch_ranges should handle a server coalescing into one range."""
+        content = self.CONTENT
+        response = self._response(
+            206, content[0:100], {'content-range': 'bytes 0-99/1024'}
+        )
+
+        with patch('requests.Session.get', return_value=response):
+            parts = DownloadService.fetch_ranges(
+                "https://example.com/file.bin", [(0, 9), (50, 59)]
+            )
+
+        assert parts == [content[0:10], content[50:60]]
+
+    def test_fetch_ranges_range_ignored(self) -> None:
+        """fetch_ranges should slice the full body when ranges are ignored."""
+        content = self.CONTENT
+        response = self._response(200, content, {})
+
+        with patch('requests.Session.get', return_value=response):
+            parts = DownloadService.fetch_ranges(
+                "https://example.com/file.bin", [(1, 3), (1020, 1023)]
+            )
+
+        assert parts == [content[1:4], content[1020:1024]]
+
+    def test_fetch_ranges_range_ignored_reads_prefix_only(self) -> None:
+        """A 200 reply should be streamed only up to the last requested byte."""
+        content = self.CONTENT
+        chunks = iter([content[i:i + 256] for i in range(0, len(content), 256)])
+        response = _StubResponse(status_code=200, chunks=chunks)
+
+        with patch('requests.Session.get', return_value=response) as mock_get:
+            parts = DownloadService.fetch_ranges(
+                "https://example.com/file.bin", [(1, 3), (300, 309)]
+            )
+
+        assert mock_get.call_args[1]['stream'] is True
+        assert parts == [content[1:4], content[300:310]]
+        assert len(list(chunks)) == 2  # Remaining body left unread
+
+    def test_fetch_ranges_range_ignored_over_cap_raises(self) -> None:
+        """Ranges past RANGE_FALLBACK_MAX should not be read from a 200 reply."""
+        response = self._response(200, self.CONTENT, {})
+
+        with patch.object(DownloadService, 'RANGE_FALLBACK_MAX', 512), \
+             patch('requests.Session.get', return_value=response):
+            with pytest.raises(DownloadError):
+                DownloadService.fetch_ranges(
+                    "https://example.com/file.bin", [(1000, 1009)]
                 )
 
-                # Check Range header was sent
-                call_kwargs = mock_get.call_args[1]
-                assert 'headers' in call_kwargs
-                assert 'Range' in call_kwargs['headers']
-                assert call_kwargs['headers']['Range'] == 'bytes=15-'
+    def test_fetch_ranges_missing_range_raises(self) -> None:
+        """fetch_ranges should raise when a requested range is not returned."""
+        response = self._response(
+            206, self.CONTENT[0:10], {'content-range': 'bytes 0-9/1024'}
+        )
+
+        with patch('requests.Session.get', return_value=response):
+            with pytest.raises(DownloadError):
+                DownloadService.fetch_ranges(
+                    "https://example.com/file.bin", [(0, 9), (100, 109)]
+                )
+
+
+class TestSharedSession:
+    """Tests for the shared session's pooling and retry configuration."""
+
+    def test_retry_policy_backoff_and_statuses(self) -> None:
+        """The retry policy should back off and retry transient HEAD statuses."""
+        retry = DownloadService._retry_policy()
+        assert retry.total == DownloadService.MAX_RETRIES
+        assert retry.backoff_factor == DownloadService.RETRY_BACKOFF_FACTOR
+        assert 503 in retry.status_forcelist
+        assert 429 not in retry.status_forcelist
+        assert retry.respect_retry_after_header is False
+
+    def test_retry_policy_leaves_get_to_fetch_file(self) -> None:
+        """GETs must not be retried by the adapter on top of fetch_file's loop."""
+        retry = DownloadService._retry_policy()
+        assert retry.connect == 0
+        assert not retry.is_retry("GET", 503)
+        assert retry.is_retry("HEAD", 503)
+
+    def test_retry_after_is_capped(self) -> None:
+        """A huge Retry-After should be capped and retried once per attempt."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            dest_path = os.path.join(temp_dir, "file.bin")
+            limited = _StubResponse(headers={"Retry-After": "3600"}, status_code=429)
+
+            with patch('requests.Session.get', return_value=limited) as mock_get:
+                with patch('time.sleep') as mock_sleep:
+                    result = DownloadService.download_file(
+                        url="https://example.com/file.bin",
+                        dest_path=dest_path
+                    )
+
+            assert result is False
+            assert mock_get.call_count == DownloadService.MAX_RETRIES
+            assert all(
+                c.args[0] <= DownloadService.MAX_RETRY_AFTER
+                for c in mock_sleep.call_args_list
+            )
+
+    def test_session_adapter_uses_retry_policy(self) -> None:
+        """The shared session should mount adapters with the retry policy."""
+        with patch.object(DownloadService, '_session', None):
+            session = DownloadService._get_session()
+            adapter = session.get_adapter("https://example.com/file.bin")
+            assert adapter.max_retries.total == DownloadService.MAX_RETRIES
+
+    def test_session_shared_across_downloads(self) -> None:
+        """All downloads should reuse one pooled session."""
+        with patch.object(DownloadService, '_session', None):
+            session = DownloadService._get_session()
+            assert DownloadService._get_session() is session
+            adapter = session.get_adapter("https://example.com/file.bin")
+            assert adapter._pool_maxsize == (
+                DownloadService.MAX_CONCURRENT * DownloadService.MAX_PARTS
+            )
+
+
+class TestPreallocateFile:
+    """Tests for the part-writer file preallocation helper."""
+
+    def test_preallocates_to_size(self, tmp_path) -> None:
+        """_preallocate_file should size the file to the declared length."""
+        path = tmp_path / "file.bin"
+        _preallocate_file(str(path), 4096)
+        assert os.path.getsize(path) == 4096
+
+    def test_truncates_without_fallocate(self, tmp_path, monkeypatch) -> None:
+        """_preallocate_file should fall back to truncate when fallocate fails."""
+        path = tmp_path / "file.bin"
+        path.write_bytes(b"x" * 10000)
+
+        def failing_fallocate(fd, offset, length):
+            raise OSError("not supported")
+
+        monkeypatch.setattr(os, "posix_fallocate", failing_fallocate, raising=False)
+        _preallocate_file(str(path), 2048)
+        assert path.read_bytes() == b"\0" * 2048
 
 
 class TestConstants:
@@ -520,6 +1245,31 @@ class TestConstants:
         # Should be at most 16MB to avoid memory issues
         assert DownloadService.CHUNK_SIZE <= 16 * 1024 * 1024
 
+    def test_adaptive_chunk_size_bounds(self) -> None:
+        """Adaptive chunk sizes should stay within the 64KB-16MB bounds."""
+        assert DownloadService.MIN_CHUNK_SIZE >= 65536
+        assert DownloadService.MAX_CHUNK_SIZE <= 16 * 1024 * 1024
+        assert DownloadService._chunk_size_for_rate(1.0) == DownloadService.MIN_CHUNK_SIZE
+        assert DownloadService._chunk_size_for_rate(1e12) == DownloadService.MAX_CHUNK_SIZE
+
+    def test_adaptive_chunk_size_targets_update_rate(self) -> None:
+        """Chunk size should track throughput / TARGET_CHUNKS_PER_SECOND."""
+        rate = 50 * 1024 * 1024
+        expected = rate // DownloadService.TARGET_CHUNKS_PER_SECOND
+        assert DownloadService._chunk_size_for_rate(rate) == expected
+
+    def test_initial_chunk_size_without_measurement(self) -> None:
+        """Without a measurement, the initial CHUNK_SIZE should be used."""
+        assert DownloadService._chunk_size_for_rate(None) == DownloadService.CHUNK_SIZE
+
+    def test_short_streams_not_measured(self) -> None:
+        """Streams shorter than MIN_MEASURE_SECONDS should not set the rate."""
+        with patch.object(DownloadService, '_measured_bps', None):
+            DownloadService._record_throughput(1024, 0.01)
+            assert DownloadService._measured_bps is None
+            DownloadService._record_throughput(4 * 1024 * 1024, 2.0)
+            assert DownloadService._measured_bps == 2 * 1024 * 1024
+
     def test_default_timeout_is_reasonable(self) -> None:
         """DEFAULT_TIMEOUT should be reasonable."""
         assert DownloadService.DEFAULT_TIMEOUT >= 10
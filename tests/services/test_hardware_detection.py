@@ -12,15 +12,21 @@ Per PLAN_v3.md Phase 1 Week 1:
 - Test tier classification boundaries
 """
 
+import os
+import sys
 import pytest
 from unittest.mock import patch, MagicMock
 import platform
+from types import SimpleNamespace
 
 from src.schemas.hardware import (
     HardwareProfile,
     HardwareTier,
     PlatformType,
     ThermalState,
+    classify_tiers,
+    _TIER_VRAM_BOUNDS,
+    _TIERS_BY_VRAM,
 )
 from src.services.hardware import (
     get_detector,
@@ -33,175 +39,148 @@ from src.services.hardware import (
     DetectionFailedError,
 )
 from src.services.hardware.apple_silicon import AppleSiliconDetector
+import src.services.hardware as hardware_module
+from src.services.hardware import nvidia as nvidia_module
 from src.services.hardware.nvidia import NVIDIADetector
 from src.services.hardware.amd_rocm import AMDROCmDetector
 
 
-class TestHardwareProfile:
-    """Tests for HardwareProfile dataclass."""
+def _skip_off_platform(system: str):
+    """
+    Skip a mock-only detector class when not running on its platform.
 
-    def test_tier_workstation(self):
-        """48GB+ VRAM should be WORKSTATION tier."""
-        profile = HardwareProfile(
-            platform=PlatformType.WINDOWS_NVIDIA,
-            gpu_vendor="nvidia",
-            gpu_name="RTX 4090",
-            vram_gb=48.0,
-        )
-        assert profile.tier == HardwareTier.WORKSTATION
+    Opt-in via SKIP_FOREIGN_PLATFORM_TESTS=1 so a CI matrix can run each
+    class in one cell; by default every class runs everywhere under mocks.
+    """
+    return pytest.mark.skipif(
+        bool(os.environ.get("SKIP_FOREIGN_PLATFORM_TESTS")) and platform.system() != system,
+        reason=f"{system}-only detector tests (SKIP_FOREIGN_PLATFORM_TESTS set)",
+    )
 
-    def test_tier_professional(self):
-        """16-47GB VRAM should be PROFESSIONAL tier."""
-        profile = HardwareProfile(
-            platform=PlatformType.WINDOWS_NVIDIA,
-            gpu_vendor="nvidia",
-            gpu_name="RTX 4090",
-            vram_gb=24.0,
-        )
-        assert profile.tier == HardwareTier.PROFESSIONAL
 
-        # Test boundary
-        profile16 = HardwareProfile(
-            platform=PlatformType.WINDOWS_NVIDIA,
-            gpu_vendor="nvidia",
-            gpu_name="RTX 4080",
-            vram_gb=16.0,
-        )
-        assert profile16.tier == HardwareTier.PROFESSIONAL
+def _make_profile(vram: float, platform_type: PlatformType = PlatformType.WINDOWS_NVIDIA) -> HardwareProfile:
+    """Build a minimal HardwareProfile for tier checks."""
+    return HardwareProfile(
+        platform=platform_type,
+        gpu_vendor="none" if platform_type == PlatformType.CPU_ONLY else "nvidia",
+        gpu_name="Test GPU",
+        vram_gb=vram,
+    )
 
-    def test_tier_prosumer(self):
-        """12-15GB VRAM should be PROSUMER tier."""
-        profile = HardwareProfile(
-            platform=PlatformType.WINDOWS_NVIDIA,
-            gpu_vendor="nvidia",
-            gpu_name="RTX 4070 Ti",
-            vram_gb=12.0,
-        )
-        assert profile.tier == HardwareTier.PROSUMER
 
-    def test_tier_consumer(self):
-        """8-11GB VRAM should be CONSUMER tier."""
-        profile = HardwareProfile(
+@pytest.fixture(scope="module")
+def profiles() -> SimpleNamespace:
+    """Canonical profiles shared across tests (safe: HardwareProfile is frozen)."""
+    return SimpleNamespace(
+        # RTX 4090 class
+        ada=HardwareProfile(
             platform=PlatformType.WINDOWS_NVIDIA,
             gpu_vendor="nvidia",
-            gpu_name="RTX 4070",
-            vram_gb=8.0,
-        )
-        assert profile.tier == HardwareTier.CONSUMER
-
-    def test_tier_entry(self):
-        """4-7GB VRAM should be ENTRY tier."""
-        profile = HardwareProfile(
+            gpu_name="RTX 4090",
+            vram_gb=24.0,
+            compute_capability=8.9,
+            supports_fp8=True,
+        ),
+        # RTX 3090 class
+        ampere=HardwareProfile(
             platform=PlatformType.WINDOWS_NVIDIA,
             gpu_vendor="nvidia",
-            gpu_name="RTX 3050",
-            vram_gb=4.0,
-        )
-        assert profile.tier == HardwareTier.ENTRY
-
-    def test_tier_minimal(self):
-        """<4GB VRAM or CPU-only should be MINIMAL tier."""
-        profile = HardwareProfile(
-            platform=PlatformType.CPU_ONLY,
-            gpu_vendor="none",
-            gpu_name="CPU Only",
-            vram_gb=0.0,
-        )
-        assert profile.tier == HardwareTier.MINIMAL
-
-    def test_apple_silicon_constraints(self):
-        """Apple Silicon should have platform-specific constraints."""
-        profile = HardwareProfile(
+            gpu_name="RTX 3090",
+            vram_gb=24.0,
+            compute_capability=8.6,
+            supports_fp8=False,
+        ),
+        apple_small=HardwareProfile(
+            platform=PlatformType.APPLE_SILICON,
+            gpu_vendor="apple",
+            gpu_name="Apple M3",
+            vram_gb=6.0,  # 8GB * 0.75
+            unified_memory=True,
+        ),
+        apple_medium=HardwareProfile(
             platform=PlatformType.APPLE_SILICON,
             gpu_vendor="apple",
             gpu_name="Apple M3 Max",
             vram_gb=36.0,  # 48GB * 0.75
             unified_memory=True,
-        )
+        ),
+        apple_large=HardwareProfile(
+            platform=PlatformType.APPLE_SILICON,
+            gpu_vendor="apple",
+            gpu_name="Apple M3 Max",
+            vram_gb=72.0,  # 96GB * 0.75
+            unified_memory=True,
+        ),
+    )
+
+
+class TestHardwareProfile:
+    """Tests for HardwareProfile dataclass."""
+
+    def test_apple_silicon_constraints(self, profiles):
+        """Apple Silicon should have platform-specific constraints."""
+        profile = profiles.apple_medium
 
         assert "GGUF K-quants not supported" in profile.platform_constraints[0]
+        # 36GB is enough for HunyuanVideo; the 6GB profile gets the extra entry
+        assert profile.platform_constraints is profiles.apple_large.platform_constraints
+        assert "HunyuanVideo excluded" in profiles.apple_small.platform_constraints[-1]
         assert profile.supports_fp8 is False
         assert profile.flash_attention_available is False
 
-    def test_apple_silicon_allowed_quants(self):
+    def test_apple_silicon_allowed_quants(self, profiles):
         """Apple Silicon should only allow non-K GGUF quants."""
-        profile = HardwareProfile(
-            platform=PlatformType.APPLE_SILICON,
-            gpu_vendor="apple",
-            gpu_name="Apple M3",
-            vram_gb=18.0,
-            unified_memory=True,
-        )
-
-        quants = profile.allowed_gguf_quants
+        quants = profiles.apple_medium.allowed_gguf_quants
         assert "Q4_0" in quants
         assert "Q5_0" in quants
         assert "Q8_0" in quants
         assert "Q4_K_M" not in quants  # K-quants crash on MPS
 
-    def test_nvidia_allowed_quants(self):
+    def test_nvidia_allowed_quants(self, profiles):
         """NVIDIA should allow all GGUF quants."""
-        profile = HardwareProfile(
-            platform=PlatformType.WINDOWS_NVIDIA,
-            gpu_vendor="nvidia",
-            gpu_name="RTX 4090",
-            vram_gb=24.0,
-        )
-
-        quants = profile.allowed_gguf_quants
+        quants = profiles.ada.allowed_gguf_quants
         assert "Q4_K_M" in quants
         assert "Q5_K_M" in quants
 
-    def test_can_run_hunyuan_apple_silicon(self):
+    def test_profile_is_immutable(self, profiles):
+        """HardwareProfile should be frozen so a shared profile cannot drift."""
+        profile = profiles.ada
+
+        assert not hasattr(profile, '__dict__')
+        with pytest.raises(AttributeError):
+            profile.vram_gb = 8.0
+        assert profile.allowed_gguf_quants is profiles.ampere.allowed_gguf_quants
+
+    def test_nested_profiles_are_slotted(self):
+        """Nested profiles should not carry a per-instance __dict__."""
+        from src.schemas.hardware import CPUProfile, RAMProfile
+
+        cpu = CPUProfile(model="Test CPU", architecture="x86_64", physical_cores=8, logical_cores=16)
+        ram = RAMProfile(total_gb=32.0, available_gb=24.0, usable_for_offload_gb=16.0)
+
+        assert not hasattr(cpu, '__dict__')
+        assert not hasattr(ram, '__dict__')
+
+    def test_can_run_hunyuan_apple_silicon(self, profiles):
         """HunyuanVideo requires Professional tier on Apple Silicon."""
         # Too small - can't run
-        profile_small = HardwareProfile(
-            platform=PlatformType.APPLE_SILICON,
-            gpu_vendor="apple",
-            gpu_name="Apple M3",
-            vram_gb=6.0,  # 8GB * 0.75
-            unified_memory=True,
-        )
-        assert profile_small.can_run_hunyuan is False
-
+        assert profiles.apple_small.can_run_hunyuan is False
         # Professional tier - can run
-        profile_large = HardwareProfile(
-            platform=PlatformType.APPLE_SILICON,
-            gpu_vendor="apple",
-            gpu_name="Apple M3 Max",
-            vram_gb=72.0,  # 96GB * 0.75
-            unified_memory=True,
-        )
-        assert profile_large.can_run_hunyuan is True
+        assert profiles.apple_large.can_run_hunyuan is True
 
-    def test_can_run_fp8(self):
+    def test_can_run_fp8(self, profiles):
         """FP8 requires compute capability 8.9+."""
         # RTX 40 series - can run FP8
-        profile_ada = HardwareProfile(
-            platform=PlatformType.WINDOWS_NVIDIA,
-            gpu_vendor="nvidia",
-            gpu_name="RTX 4090",
-            vram_gb=24.0,
-            compute_capability=8.9,
-            supports_fp8=True,
-        )
-        assert profile_ada.can_run_fp8 is True
-
+        assert profiles.ada.can_run_fp8 is True
         # RTX 30 series - cannot run FP8
-        profile_ampere = HardwareProfile(
-            platform=PlatformType.WINDOWS_NVIDIA,
-            gpu_vendor="nvidia",
-            gpu_name="RTX 3090",
-            vram_gb=24.0,
-            compute_capability=8.6,
-            supports_fp8=False,
-        )
-        assert profile_ampere.can_run_fp8 is False
+        assert profiles.ampere.can_run_fp8 is False
 
 
 class TestAppleSiliconDetector:
     """Tests for AppleSiliconDetector."""
 
+    pytestmark = _skip_off_platform("Darwin")
+
     def test_is_available_on_mac(self):
         """Detector should be available on Apple Silicon Mac."""
         detector = AppleSiliconDetector()
@@ -243,23 +222,171 @@ class TestAppleSiliconDetector:
         assert detector.BANDWIDTH_LOOKUP["M4 Pro"] == 273
         assert detector.BANDWIDTH_LOOKUP["M4 Ultra"] == 800
 
-    def test_75_percent_memory_ceiling(self):
+    def test_75_percent_memory_ceiling(self, monkeypatch):
         """Should apply 75% memory ceiling to unified memory."""
         detector = AppleSiliconDetector()
+        monkeypatch.setattr(detector, '_get_chip_name', lambda: 'Apple M3 Max')
+        monkeypatch.setattr(detector, '_get_unified_memory', lambda: 96.0)
+        monkeypatch.setattr(detector, '_check_mps', lambda: True)
 
-        with patch.object(detector, '_get_chip_name', return_value='Apple M3 Max'):
-            with patch.object(detector, '_get_unified_memory', return_value=96.0):
-                with patch.object(detector, '_check_mps', return_value=True):
-                    profile = detector.detect()
+        profile = detector.detect()
 
-                    assert profile.ram_gb == 96.0
-                    assert profile.vram_gb == 72.0  # 96 * 0.75
-                    assert profile.unified_memory is True
+        assert profile.ram_gb == 96.0
+        assert profile.vram_gb == 72.0  # 96 * 0.75
+        assert profile.unified_memory is True
 
 
 class TestNVIDIADetector:
     """Tests for NVIDIADetector."""
 
+    @pytest.fixture(autouse=True)
+    def clear_detector_caches(self, monkeypatch):
+        """Keep cached WSL/inventory answers from leaking between tests."""
+        # Exercise the nvidia-smi path even where pynvml is installed
+        monkeypatch.setattr(NVIDIADetector, '_load_nvml', staticmethod(lambda: None))
+        NVIDIADetector._detect_wsl.cache_clear()
+        NVIDIADetector._query_inventory.cache_clear()
+        yield
+        NVIDIADetector._detect_wsl.cache_clear()
+        NVIDIADetector._query_inventory.cache_clear()
+
+    @staticmethod
+    def _fake_nvml(gpus, fail=False):
+        """Minimal pynvml stand-in serving (name, total_bytes, (major, minor)) per GPU."""
+        def get_handle(index):
+            if fail:
+                raise RuntimeError("NVML_ERROR_UNKNOWN")
+            return gpus[index]
+
+        return SimpleNamespace(
+            NVML_TEMPERATURE_GPU=0,
+            nvmlDeviceGetCount=lambda: len(gpus),
+            nvmlDeviceGetHandleByIndex=get_handle,
+            nvmlDeviceGetName=lambda handle: handle[0],
+            nvmlDeviceGetMemoryInfo=lambda handle: SimpleNamespace(total=handle[1]),
+            nvmlDeviceGetCudaComputeCapability=lambda handle: handle[2],
+            nvmlDeviceGetTemperature=lambda handle, sensor: 83,
+        )
+
+    def test_inventory_uses_nvml_when_available(self, monkeypatch):
+        """NVML should answer without spawning nvidia-smi."""
+        nvml = self._fake_nvml([(b"NVIDIA GeForce RTX 4090", 24 * 1024 ** 3, (8, 9))])
+        monkeypatch.setattr(NVIDIADetector, '_load_nvml', staticmethod(lambda: nvml))
+        monkeypatch.setattr(nvidia_module, 'run_command', MagicMock(side_effect=AssertionError))
+
+        profile = NVIDIADetector()._detect_via_nvidia_smi()
+
+        assert profile.gpu_name == "NVIDIA GeForce RTX 4090"
+        assert profile.vram_gb == 24.0
+        assert profile.compute_capability == 8.9
+        assert profile.warnings == ()
+        assert NVIDIADetector().get_thermal_state() == ThermalState.WARNING.value
+
+    def test_failed_nvml_init_not_cached(self, monkeypatch):
+        """A failed nvmlInit() should be retried by the next call."""
+        attempts = []
+
+        def nvml_init():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("NVML_ERROR_DRIVER_NOT_LOADED")
+
+        nvml = SimpleNamespace(nvmlInit=nvml_init)
+        monkeypatch.undo()  # Use the real _load_nvml
+        monkeypatch.setattr(NVIDIADetector, '_import_pynvml', staticmethod(lambda: nvml))
+        NVIDIADetector._init_nvml.cache_clear()
+        try:
+            assert NVIDIADetector._load_nvml() is None
+            assert NVIDIADetector._load_nvml() is nvml
+            assert NVIDIADetector._load_nvml() is nvml
+        finally:
+            NVIDIADetector._init_nvml.cache_clear()
+
+        assert len(attempts) == 2
+
+    def test_inventory_falls_back_when_nvml_fails(self, monkeypatch):
+        """An NVML error should fall back to nvidia-smi."""
+        nvml = self._fake_nvml([(b"NVIDIA GeForce RTX 3090", 24 * 1024 ** 3, (8, 6))], fail=True)
+        monkeypatch.setattr(NVIDIADetector, '_load_nvml', staticmethod(lambda: nvml))
+        monkeypatch.setattr(
+            nvidia_module, 'run_command', lambda command, timeout=30: "NVIDIA GeForce RTX 3090, 24576, 8.6"
+        )
+
+        inventory = NVIDIADetector._query_inventory()
+
+        assert [gpu["name"] for gpu in inventory] == ["NVIDIA GeForce RTX 3090"]
+
+    def test_heterogeneous_inventory_preserved(self, monkeypatch):
+        """One nvidia-smi query should yield a distinct entry per GPU."""
+        commands = []
+
+        def fake_run_command(command, timeout=30):
+            commands.append(command)
+            return (
+                "Tesla V100-PCIE-16GB, 16384, 7.0\n"
+                "Tesla P40, 24576, 6.1\n"
+                "Tesla M40 24GB, 24576, 5.2"
+            )
+
+        monkeypatch.setattr(nvidia_module, 'run_command', fake_run_command)
+
+        inventory = NVIDIADetector._query_inventory()
+        profile = NVIDIADetector()._detect_via_nvidia_smi()
+
+        assert len(commands) == 1
+        assert [gpu["name"] for gpu in inventory] == [
+            "Tesla V100-PCIE-16GB", "Tesla P40", "Tesla M40 24GB"
+        ]
+        assert [gpu["compute_capability"] for gpu in inventory] == [7.0, 6.1, 5.2]
+        assert profile.gpu_name == "Tesla V100-PCIE-16GB"
+        assert profile.vram_gb == 16.0
+        assert profile.compute_capability == 7.0
+        assert profile.gpu_count == 3
+        assert any("Mixed GPUs detected" in w for w in profile.warnings)
+
+    def test_failed_inventory_not_cached(self, monkeypatch):
+        """A failed nvidia-smi query should be retried on the next call."""
+        outputs = [None, None, "NVIDIA GeForce RTX 4090, 24564, 8.9"]
+        monkeypatch.setattr(
+            nvidia_module, 'run_command', lambda command, timeout=30: outputs.pop(0)
+        )
+
+        with pytest.raises(DetectionFailedError):
+            NVIDIADetector._query_inventory()
+        inventory = NVIDIADetector._query_inventory()
+
+        assert [gpu["name"] for gpu in inventory] == ["NVIDIA GeForce RTX 4090"]
+
+    def test_clear_caches_requeries_inventory(self, monkeypatch):
+        """clear_caches() should drop the cached GPU inventory."""
+        calls = []
+        monkeypatch.setattr(
+            nvidia_module, 'run_command',
+            lambda command, timeout=30: calls.append(command) or "NVIDIA GeForce RTX 4090, 24564, 8.9"
+        )
+
+        NVIDIADetector._query_inventory()
+        NVIDIADetector._query_inventory()
+        NVIDIADetector().clear_caches()
+        NVIDIADetector._query_inventory()
+
+        assert len(calls) == 2
+
+    def test_inventory_falls_back_without_compute_cap(self, monkeypatch):
+        """Older drivers without compute_cap should still be detected."""
+        def fake_run_command(command, timeout=30):
+            if "compute_cap" in command[1]:
+                return None
+            return "NVIDIA GeForce RTX 3090, 24576"
+
+        monkeypatch.setattr(nvidia_module, 'run_command', fake_run_command)
+
+        profile = NVIDIADetector()._detect_via_nvidia_smi()
+
+        assert profile.compute_capability == 8.6  # inferred from name
+        assert profile.gpu_count == 1
+        assert any("inferred from GPU name" in w for w in profile.warnings)
+
     def test_compute_capability_inference(self):
         """Should correctly infer compute capability from GPU name."""
         detector = NVIDIADetector()
@@ -281,30 +408,52 @@ class TestNVIDIADetector:
         # Unknown
         assert detector._infer_compute_capability("Some Random GPU") is None
 
+    def test_compute_capability_inference_cached(self):
+        """Repeat lookups for the same GPU name should hit the cache."""
+        NVIDIADetector._infer_compute_capability.cache_clear()
+
+        NVIDIADetector._infer_compute_capability("NVIDIA GeForce RTX 4090")
+        NVIDIADetector._infer_compute_capability("NVIDIA GeForce RTX 4090")
+
+        assert NVIDIADetector._infer_compute_capability.cache_info().hits == 1
+
     def test_fp8_support_detection(self):
         """FP8 support should be enabled for CC 8.9+."""
         # Simulated detection result
         assert 8.9 >= 8.9  # RTX 40 series supports FP8
         assert 8.6 < 8.9   # RTX 30 series does not
 
-    def test_wsl_detection(self):
+    def test_wsl_detection(self, monkeypatch, tmp_path):
         """Should detect WSL2 environment."""
         detector = NVIDIADetector()
 
-        # Mock /proc/version for WSL
-        with patch('builtins.open', create=True) as mock_open:
-            mock_open.return_value.__enter__.return_value.read.return_value = \
-                "Linux version 5.10.16.3-microsoft-standard-WSL2"
-            assert detector._detect_wsl() is True
+        # Fake /proc/version for WSL
+        version_file = tmp_path / "version"
+        version_file.write_text("Linux version 5.10.16.3-microsoft-standard-WSL2")
+        monkeypatch.setattr(nvidia_module, 'PROC_VERSION_PATH', str(version_file))
+        assert detector._detect_wsl() is True
 
         # Not WSL
-        with patch('builtins.open', side_effect=FileNotFoundError):
-            assert detector._detect_wsl() is False
+        NVIDIADetector._detect_wsl.cache_clear()
+        monkeypatch.setattr(nvidia_module, 'PROC_VERSION_PATH', str(tmp_path / "missing"))
+        assert detector._detect_wsl() is False
+
+    def test_wsl_detection_cached(self, monkeypatch, tmp_path):
+        """/proc/version should be read once per process."""
+        version_file = tmp_path / "version"
+        version_file.write_bytes(b"Linux version 6.1.0-generic")
+        monkeypatch.setattr(nvidia_module, 'PROC_VERSION_PATH', str(version_file))
+
+        assert NVIDIADetector._detect_wsl() is False
+        version_file.write_bytes(b"Linux version 5.15-microsoft-standard-WSL2")
+        assert NVIDIADetector._detect_wsl() is False
 
 
 class TestAMDROCmDetector:
     """Tests for AMDROCmDetector."""
 
+    pytestmark = _skip_off_platform("Linux")
+
     def test_gfx_version_support(self):
         """Should correctly identify supported GFX versions."""
         detector = AMDROCmDetector()
@@ -328,30 +477,111 @@ class TestAMDROCmDetector:
 class TestDetectorFactory:
     """Tests for get_detector() factory function."""
 
-    def test_returns_apple_silicon_on_mac(self):
+    @pytest.fixture(autouse=True)
+    def clear_detector_cache(self, monkeypatch):
+        """Re-probe per test so patched is_available() takes effect."""
+        get_detector.cache_clear()
+        monkeypatch.setattr(hardware_module, '_cached_profile', None)
+        yield
+        get_detector.cache_clear()
+
+    @staticmethod
+    def _set_available(monkeypatch, apple=False, nvidia=False, rocm=False, sys_platform="linux"):
+        """Patch the host platform and each detector's is_available() answer."""
+        monkeypatch.setattr(sys, 'platform', sys_platform)
+        monkeypatch.setattr(AppleSiliconDetector, 'is_available', lambda self: apple)
+        monkeypatch.setattr(NVIDIADetector, 'is_available', lambda self: nvidia)
+        monkeypatch.setattr(AMDROCmDetector, 'is_available', lambda self: rocm)
+
+    def test_detector_is_cached(self, monkeypatch):
+        """get_detector should probe the platform only once."""
+        probes = []
+        monkeypatch.setattr(sys, 'platform', 'darwin')
+        monkeypatch.setattr(AppleSiliconDetector, 'is_available',
+                            lambda self: probes.append(self) or True)
+
+        first = get_detector()
+        second = get_detector()
+
+        assert first is second
+        assert len(probes) == 1
+
+    def test_profile_warnings_are_immutable(self, monkeypatch):
+        """The shared profile's warnings should not be mutable in place."""
+        self._set_available(monkeypatch)
+
+        profile = detect_hardware()
+
+        assert isinstance(profile.warnings, tuple)
+        assert profile.warnings
+
+    def test_detect_hardware_is_cached(self, monkeypatch):
+        """detect_hardware should reuse the first profile until cleared."""
+        self._set_available(monkeypatch)
+
+        profile = detect_hardware()
+        assert detect_hardware() is profile
+
+        refreshed = detect_hardware(refresh=True)
+        assert refreshed is not profile
+        assert detect_hardware() is refreshed
+
+    def test_returns_apple_silicon_on_mac(self, monkeypatch):
         """Should return AppleSiliconDetector on Apple Silicon Mac."""
-        with patch.object(AppleSiliconDetector, 'is_available', return_value=True):
-            with patch.object(NVIDIADetector, 'is_available', return_value=False):
-                detector = get_detector()
-                assert isinstance(detector, AppleSiliconDetector)
+        self._set_available(monkeypatch, apple=True, sys_platform="darwin")
+        detector = get_detector()
+        assert isinstance(detector, AppleSiliconDetector)
 
-    def test_returns_nvidia_on_windows(self):
+    def test_returns_nvidia_on_windows(self, monkeypatch):
         """Should return NVIDIADetector when nvidia-smi available."""
-        with patch.object(AppleSiliconDetector, 'is_available', return_value=False):
-            with patch.object(NVIDIADetector, 'is_available', return_value=True):
-                detector = get_detector()
-                assert isinstance(detector, NVIDIADetector)
+        self._set_available(monkeypatch, nvidia=True, sys_platform="win32")
+        detector = get_detector()
+        assert isinstance(detector, NVIDIADetector)
+
+    def test_skips_detectors_for_other_platforms(self, monkeypatch):
+        """Only detectors that can apply to the host OS should be probed."""
+        probed = []
+
+        def record(self):
+            probed.append(type(self))
+            return False
 
-    def test_returns_cpu_only_fallback(self):
+        monkeypatch.setattr(sys, 'platform', 'win32')
+        for detector_class in (AppleSiliconDetector, NVIDIADetector, AMDROCmDetector):
+            monkeypatch.setattr(detector_class, 'is_available', record)
+
+        get_detector()
+
+        assert probed == [NVIDIADetector]
+
+    def test_detector_classes_load_lazily(self):
+        """Importing the package should not import any platform detector."""
+        import subprocess
+        from pathlib import Path
+
+        code = (
+            "import sys, src.services.hardware as hw; "
+            "print(any(m.endswith(('.apple_silicon', '.nvidia', '.amd_rocm')) for m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, timeout=60,
+            cwd=Path(__file__).resolve().parents[2],
+        )
+
+        assert result.stdout.strip() == "False", result.stderr
+        assert hardware_module.NVIDIADetector is NVIDIADetector
+        with pytest.raises(AttributeError):
+            hardware_module.NoSuchDetector
+
+    def test_returns_cpu_only_fallback(self, monkeypatch):
         """Should return CPUOnlyDetector when no GPU available."""
-        with patch.object(AppleSiliconDetector, 'is_available', return_value=False):
-            with patch.object(NVIDIADetector, 'is_available', return_value=False):
-                with patch.object(AMDROCmDetector, 'is_available', return_value=False):
-                    detector = get_detector()
-                    # CPUOnlyDetector is defined in __init__.py
-                    assert detector.is_available() is True
-                    profile = detector.detect()
-                    assert profile.platform == PlatformType.CPU_ONLY
+        self._set_available(monkeypatch)
+        detector = get_detector()
+        # CPUOnlyDetector is defined in __init__.py
+        assert detector.is_available() is True
+        profile = detector.detect()
+        assert profile.platform == PlatformType.CPU_ONLY
 
 
 class TestStorageDetection:
@@ -390,35 +620,62 @@ class TestStorageDetection:
 class TestTierBoundaries:
     """Tests for tier classification boundary conditions."""
 
-    @pytest.mark.parametrize("vram,expected_tier", [
-        (0.0, HardwareTier.MINIMAL),
-        (3.9, HardwareTier.MINIMAL),
-        (4.0, HardwareTier.ENTRY),
-        (7.9, HardwareTier.ENTRY),
-        (8.0, HardwareTier.CONSUMER),
-        (11.9, HardwareTier.CONSUMER),
-        (12.0, HardwareTier.PROSUMER),
-        (15.9, HardwareTier.PROSUMER),
-        (16.0, HardwareTier.PROFESSIONAL),
-        (24.0, HardwareTier.PROFESSIONAL),
-        (47.9, HardwareTier.PROFESSIONAL),
-        (48.0, HardwareTier.WORKSTATION),
-        (128.0, HardwareTier.WORKSTATION),
-    ])
-    def test_tier_boundary(self, vram, expected_tier):
+    # (platform, effective VRAM, expected tier) at and around each bound
+    TIER_CASES = (
+        (PlatformType.CPU_ONLY, 0.0, HardwareTier.MINIMAL),
+        (PlatformType.WINDOWS_NVIDIA, 0.0, HardwareTier.MINIMAL),
+        (PlatformType.WINDOWS_NVIDIA, 3.9, HardwareTier.MINIMAL),
+        (PlatformType.WINDOWS_NVIDIA, 4.0, HardwareTier.ENTRY),
+        (PlatformType.WINDOWS_NVIDIA, 7.9, HardwareTier.ENTRY),
+        (PlatformType.WINDOWS_NVIDIA, 8.0, HardwareTier.CONSUMER),
+        (PlatformType.WINDOWS_NVIDIA, 11.9, HardwareTier.CONSUMER),
+        (PlatformType.WINDOWS_NVIDIA, 12.0, HardwareTier.PROSUMER),
+        (PlatformType.WINDOWS_NVIDIA, 15.9, HardwareTier.PROSUMER),
+        (PlatformType.WINDOWS_NVIDIA, 16.0, HardwareTier.PROFESSIONAL),
+        (PlatformType.WINDOWS_NVIDIA, 24.0, HardwareTier.PROFESSIONAL),
+        (PlatformType.WINDOWS_NVIDIA, 47.9, HardwareTier.PROFESSIONAL),
+        (PlatformType.WINDOWS_NVIDIA, 48.0, HardwareTier.WORKSTATION),
+        (PlatformType.WINDOWS_NVIDIA, 128.0, HardwareTier.WORKSTATION),
+    )
+
+    def test_tier_boundary(self):
         """Test tier classification at exact boundaries.
 
         Note: Tier is based on VRAM only per SPEC_v3 Section 4.5.
         RAM affects offload viability but not tier classification.
         """
-        profile = HardwareProfile(
-            platform=PlatformType.WINDOWS_NVIDIA,
-            gpu_vendor="nvidia",
-            gpu_name="Test GPU",
-            vram_gb=vram,
-        )
-        assert profile.tier == expected_tier, \
-            f"VRAM {vram}GB should be {expected_tier.value}, got {profile.tier.value}"
+        for platform_type, vram, expected_tier in self.TIER_CASES:
+            profile = _make_profile(vram, platform_type)
+            assert profile.tier == expected_tier, \
+                f"VRAM {vram}GB ({platform_type.value}) should be {expected_tier.value}, got {profile.tier.value}"
+
+    def test_tiers_compare_by_rank(self):
+        """Tiers should order from MINIMAL up to WORKSTATION."""
+        assert HardwareTier.WORKSTATION > HardwareTier.PROFESSIONAL > HardwareTier.MINIMAL
+        assert HardwareTier.PROFESSIONAL >= HardwareTier.PROFESSIONAL
+        assert sorted(_TIERS_BY_VRAM, reverse=True) == list(HardwareTier)
+        assert [tier.rank for tier in _TIERS_BY_VRAM] == list(range(len(_TIERS_BY_VRAM)))
+        assert HardwareTier.PROFESSIONAL.value == "professional"
+
+    def test_tier_sweep_changes_only_at_bounds(self):
+        """A single sweep should step up one tier at each boundary, and only there."""
+        bounds = set(_TIER_VRAM_BOUNDS)
+        tiers = [_make_profile(tenths / 10).tier for tenths in range(0, 1281)]
+
+        for tenths in range(1, len(tiers)):
+            changed = tiers[tenths] != tiers[tenths - 1]
+            assert changed == (tenths / 10 in bounds), f"unexpected step at {tenths / 10}GB"
+
+        assert tiers[0] == _TIERS_BY_VRAM[0]
+        assert tiers[-1] == _TIERS_BY_VRAM[-1]
+        assert len(set(tiers)) == len(_TIERS_BY_VRAM)
+
+    def test_classify_tiers_matches_profile_tier(self):
+        """Batch classification should agree with HardwareProfile.tier."""
+        vram_values = [tenths / 10 for tenths in range(0, 641, 5)]
+
+        assert classify_tiers(vram_values) == [_make_profile(v).tier for v in vram_values]
+        assert classify_tiers([]) == []
 
 
 class TestCPUDetection:
@@ -681,6 +938,17 @@ class TestFormFactorDetection:
         assert "4080" in GPU_REFERENCE_TDP
         assert "3090" in GPU_REFERENCE_TDP
 
+    def test_lookup_tables_are_read_only(self):
+        """Shared lookup tables should reject mutation."""
+        from src.services.hardware.form_factor import GPU_REFERENCE_TDP
+
+        with pytest.raises(TypeError):
+            GPU_REFERENCE_TDP["4090"] = 0
+        with pytest.raises(TypeError):
+            AppleSiliconDetector.BANDWIDTH_LOOKUP["M1"] = 0
+        with pytest.raises(TypeError):
+            AMDROCmDetector.RDNA2_WORKAROUND["gfx1030"] = ("", "")
+
 
 class TestGPUBandwidthLookup:
     """Tests for GPU bandwidth lookup (Phase 1 Week 2a)."""
@@ -716,128 +984,124 @@ class TestGPUBandwidthLookup:
         bandwidth = detector._lookup_gpu_bandwidth("Radeon RX 6900 XT")
         assert bandwidth == 512
 
+    def test_bandwidth_lookup_prefers_longest_key(self):
+        """Suffixed models should not fall back to the base model's entry."""
+        assert NVIDIADetector()._lookup_gpu_bandwidth("NVIDIA GeForce RTX 4070 Ti SUPER") == 672
+        assert NVIDIADetector()._lookup_gpu_bandwidth("NVIDIA GeForce RTX 4060 Ti") == 288
+        assert AMDROCmDetector()._lookup_gpu_bandwidth("AMD Radeon RX 7900 XT") == 800
+
 
 class TestThermalDetection:
     """Tests for thermal detection (Phase 1 Week 2a+)."""
 
     def test_apple_silicon_thermal_nominal(self):
         """pmset output with 100% CPU should return nominal."""
-        detector = AppleSiliconDetector()
+        mock_run = MagicMock(return_value=MagicMock(
+            returncode=0,
+            stdout="CPU_Speed_Limit = 100"
+        ))
+        detector = AppleSiliconDetector(runner=mock_run)
 
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout="CPU_Speed_Limit = 100"
-            )
-            result = detector.get_thermal_state()
-            assert result == "nominal"
+        result = detector.get_thermal_state()
+        assert result == "nominal"
 
     def test_apple_silicon_thermal_fair(self):
         """pmset output with 80-99% should return fair."""
-        detector = AppleSiliconDetector()
+        mock_run = MagicMock(return_value=MagicMock(
+            returncode=0,
+            stdout="CPU_Speed_Limit = 85"
+        ))
+        detector = AppleSiliconDetector(runner=mock_run)
 
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout="CPU_Speed_Limit = 85"
-            )
-            result = detector.get_thermal_state()
-            assert result == "fair"
+        result = detector.get_thermal_state()
+        assert result == "fair"
 
     def test_apple_silicon_thermal_serious(self):
         """pmset output with 50-79% should return serious."""
-        detector = AppleSiliconDetector()
+        mock_run = MagicMock(return_value=MagicMock(
+            returncode=0,
+            stdout="CPU_Speed_Limit = 60"
+        ))
+        detector = AppleSiliconDetector(runner=mock_run)
 
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout="CPU_Speed_Limit = 60"
-            )
-            result = detector.get_thermal_state()
-            assert result == "serious"
+        result = detector.get_thermal_state()
+        assert result == "serious"
 
     def test_apple_silicon_thermal_critical(self):
         """pmset output with <50% should return critical."""
-        detector = AppleSiliconDetector()
+        mock_run = MagicMock(return_value=MagicMock(
+            returncode=0,
+            stdout="CPU_Speed_Limit = 40"
+        ))
+        detector = AppleSiliconDetector(runner=mock_run)
 
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout="CPU_Speed_Limit = 40"
-            )
-            result = detector.get_thermal_state()
-            assert result == "critical"
+        result = detector.get_thermal_state()
+        assert result == "critical"
 
     def test_apple_silicon_thermal_failure(self):
         """Should return None when pmset fails."""
-        detector = AppleSiliconDetector()
+        mock_run = MagicMock(return_value=MagicMock(returncode=1, stderr="error"))
+        detector = AppleSiliconDetector(runner=mock_run)
 
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(returncode=1, stderr="error")
-            result = detector.get_thermal_state()
-            assert result is None
+        result = detector.get_thermal_state()
+        assert result is None
 
     def test_apple_silicon_thermal_parsing_failure(self):
         """Should return None when pmset output doesn't contain expected fields."""
-        detector = AppleSiliconDetector()
-
-        with patch('subprocess.run') as mock_run:
-            # Output without CPU_Speed_Limit or CPU_Scheduler_Limit
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout="Some unrelated pmset output\nNo thermal data here"
-            )
-            result = detector.get_thermal_state()
-            # Per ARCHITECTURE_PRINCIPLES: explicit failure, no assumptions
-            assert result is None
+        # Output without CPU_Speed_Limit or CPU_Scheduler_Limit
+        mock_run = MagicMock(return_value=MagicMock(
+            returncode=0,
+            stdout="Some unrelated pmset output\nNo thermal data here"
+        ))
+        detector = AppleSiliconDetector(runner=mock_run)
+
+        result = detector.get_thermal_state()
+        # Per ARCHITECTURE_PRINCIPLES: explicit failure, no assumptions
+        assert result is None
 
     def test_amd_rocm_thermal_nominal(self):
         """rocm-smi output with <70C should return nominal."""
-        detector = AMDROCmDetector()
+        mock_run = MagicMock(return_value=MagicMock(
+            returncode=0,
+            stdout="Temperature (Sensor edge) (C): 55.0"
+        ))
+        detector = AMDROCmDetector(runner=mock_run)
 
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout="Temperature (Sensor edge) (C): 55.0"
-            )
-            result = detector.get_thermal_state()
-            assert result == "nominal"
+        result = detector.get_thermal_state()
+        assert result == "nominal"
 
     def test_amd_rocm_thermal_fair(self):
         """rocm-smi output with 70-84C should return fair."""
-        detector = AMDROCmDetector()
+        mock_run = MagicMock(return_value=MagicMock(
+            returncode=0,
+            stdout="Temperature (Sensor junction) (C): 75.0"
+        ))
+        detector = AMDROCmDetector(runner=mock_run)
 
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout="Temperature (Sensor junction) (C): 75.0"
-            )
-            result = detector.get_thermal_state()
-            assert result == "fair"
+        result = detector.get_thermal_state()
+        assert result == "fair"
 
     def test_amd_rocm_thermal_serious(self):
         """rocm-smi output with 85-94C should return serious."""
-        detector = AMDROCmDetector()
+        mock_run = MagicMock(return_value=MagicMock(
+            returncode=0,
+            stdout="Temperature (Sensor edge) (C): 90.0"
+        ))
+        detector = AMDROCmDetector(runner=mock_run)
 
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout="Temperature (Sensor edge) (C): 90.0"
-            )
-            result = detector.get_thermal_state()
-            assert result == "serious"
+        result = detector.get_thermal_state()
+        assert result == "serious"
 
     def test_amd_rocm_thermal_critical(self):
         """rocm-smi output with >=95C should return critical."""
-        detector = AMDROCmDetector()
+        mock_run = MagicMock(return_value=MagicMock(
+            returncode=0,
+            stdout="Temperature (Sensor edge) (C): 98.0"
+        ))
+        detector = AMDROCmDetector(runner=mock_run)
 
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout="Temperature (Sensor edge) (C): 98.0"
-            )
-            result = detector.get_thermal_state()
-            assert result == "critical"
+        result = detector.get_thermal_state()
+        assert result == "critical"
 
     def test_amd_temp_to_state_boundaries(self):
         """Test temperature to state conversion boundaries."""
@@ -868,16 +1132,51 @@ class TestThermalDetection:
 
     def test_amd_rocm_thermal_failure(self):
         """Should return None when rocm-smi fails and no fallback works."""
-        detector = AMDROCmDetector()
+        # No rocm-smi or amd-smi on PATH
+        detector = AMDROCmDetector(runner=MagicMock(side_effect=FileNotFoundError))
 
-        with patch('shutil.which', return_value=None):  # No rocm-smi or amd-smi
-            result = detector.get_thermal_state()
-            assert result is None
+        result = detector.get_thermal_state()
+        assert result is None
+
+    def test_thermal_state_reused_within_ttl(self):
+        """Polling inside the TTL should not spawn the tool again."""
+        mock_run = MagicMock(return_value=MagicMock(
+            returncode=0,
+            stdout="CPU_Speed_Limit = 100"
+        ))
+        detector = AppleSiliconDetector(runner=mock_run)
+
+        assert detector.get_thermal_state() == "nominal"
+        mock_run.return_value.stdout = "CPU_Speed_Limit = 40"
+        assert detector.get_thermal_state() == "nominal"
+        assert mock_run.call_count == 1
+
+    def test_thermal_state_refreshed_after_ttl(self, monkeypatch):
+        """An expired reading should be re-read from the platform."""
+        mock_run = MagicMock(return_value=MagicMock(
+            returncode=0,
+            stdout="Temperature (Sensor edge) (C): 55.0"
+        ))
+        detector = AMDROCmDetector(runner=mock_run)
+        monkeypatch.setattr(detector, "THERMAL_STATE_TTL", 0.0)
+
+        assert detector.get_thermal_state() == "nominal"
+        mock_run.return_value.stdout = "Temperature (Sensor edge) (C): 98.0"
+        assert detector.get_thermal_state() == "critical"
+        assert mock_run.call_count == 2
 
 
 class TestPowerStateDetection:
     """Tests for power state detection (Phase 1 Week 2a+)."""
 
+    @pytest.fixture(autouse=True)
+    def clear_pmset_cache(self):
+        """Start each test without a cached pmset reading."""
+        from src.services.system_service import SystemService
+        SystemService.clear_caches()
+        yield
+        SystemService.clear_caches()
+
     def test_windows_power_on_battery(self):
         """Windows should detect battery power."""
         from src.services.system_service import SystemService
@@ -893,6 +1192,40 @@ class TestPowerStateDetection:
                 # This is a simplified test - full ctypes mocking is complex
                 # The implementation is tested manually on Windows
 
+    def test_windows_power_state_cached_within_ttl(self):
+        """GetSystemPowerStatus and powercfg should run once per TTL window."""
+        from types import SimpleNamespace
+        from src.services.system_service import SystemService
+
+        status = SimpleNamespace(ACLineStatus=1)
+        get_status = MagicMock(return_value=True)
+
+        with patch('src.services.system_service._power_status_api',
+                   return_value=(get_status, lambda: status)), \
+                patch('src.utils.subprocess_utils.run_powershell',
+                      return_value="Power Scheme GUID: ... (High performance)") as mock_ps:
+            assert SystemService._detect_power_state_windows() == ("high_performance", False)
+            assert SystemService._detect_power_state_windows() == ("high_performance", False)
+
+        get_status.assert_called_once_with(status)
+        mock_ps.assert_called_once()
+
+    def test_windows_power_status_struct_per_call(self):
+        """Each poll should pass its own SYSTEM_POWER_STATUS buffer."""
+        from types import SimpleNamespace
+        from src.services.system_service import SystemService
+
+        get_status = MagicMock(return_value=True)
+
+        with patch('src.services.system_service._power_status_api',
+                   return_value=(get_status, lambda: SimpleNamespace(ACLineStatus=0))), \
+                patch('src.utils.subprocess_utils.run_powershell', return_value=None):
+            assert SystemService._read_power_state_windows() == ("balanced", True)
+            assert SystemService._read_power_state_windows() == ("balanced", True)
+
+        first, second = (c.args[0] for c in get_status.call_args_list)
+        assert first is not second
+
     def test_macos_power_on_battery(self):
         """macOS should detect battery power from pmset."""
         from src.services.system_service import SystemService
@@ -918,19 +1251,116 @@ class TestPowerStateDetection:
             profile, on_battery = SystemService._detect_power_state_macos()
             assert on_battery is False
 
-    def test_linux_power_on_ac(self):
+    def test_macos_power_state_cached_within_ttl(self):
+        """Repeated polls inside the TTL should not spawn pmset again."""
+        from src.services.system_service import SystemService
+
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = MagicMock(
+                returncode=0,
+                stdout="Now drawing from 'AC Power'"
+            )
+            first = SystemService._detect_power_state_macos()
+            calls = mock_run.call_count
+            assert SystemService._detect_power_state_macos() == first
+            assert mock_run.call_count == calls
+
+    def test_linux_power_on_ac(self, tmp_path, monkeypatch):
         """Linux should detect AC power from /sys/class/power_supply."""
+        from src.services import system_service
         from src.services.system_service import SystemService
-        import os
 
-        with patch('os.path.exists', return_value=True):
-            with patch('os.listdir', return_value=['AC0']):
-                with patch('builtins.open', create=True) as mock_open:
-                    mock_open.return_value.__enter__.return_value.read.side_effect = [
-                        'Mains\n',  # type
-                        '1\n',      # online
-                    ]
-                    # Note: Simplified test - actual implementation reads multiple files
+        for name, files in {
+            'BAT0': {'type': 'Battery\n', 'online': '0\n'},
+            'AC0': {'type': 'Mains\n', 'online': '1\n'},
+        }.items():
+            (tmp_path / name).mkdir()
+            for fname, content in files.items():
+                (tmp_path / name / fname).write_text(content)
+
+        monkeypatch.setattr(system_service, '_POWER_SUPPLY_PATH', str(tmp_path))
+        with patch('subprocess.run', side_effect=FileNotFoundError):
+            profile, on_battery = SystemService._detect_power_state_linux()
+
+        assert on_battery is False
+        assert profile == 'balanced'
+
+        SystemService.clear_caches()
+        assert system_service._sysfs_fds == {}
+
+    def test_linux_power_polls_reuse_sysfs_fds(self, tmp_path, monkeypatch):
+        """Repeated polls should pread held fds and see updated content."""
+        from src.services import system_service
+        from src.services.system_service import SystemService
+
+        (tmp_path / 'AC0').mkdir()
+        (tmp_path / 'AC0' / 'type').write_text('Mains\n')
+        (tmp_path / 'AC0' / 'online').write_text('1\n')
+        monkeypatch.setattr(system_service, '_POWER_SUPPLY_PATH', str(tmp_path))
+
+        with patch('subprocess.run', side_effect=FileNotFoundError), \
+                patch('os.open', wraps=os.open) as mock_open:
+            assert SystemService._detect_power_state_linux()[1] is False
+            opened = mock_open.call_count
+
+            (tmp_path / 'AC0' / 'online').write_text('0\n')
+            assert SystemService._detect_power_state_linux()[1] is True
+            assert mock_open.call_count == opened
+
+        SystemService.clear_caches()
+        assert system_service._sysfs_fds == {}
+
+    def test_linux_power_evicts_removed_supply(self, tmp_path, monkeypatch):
+        """Fds of a supply that disappears should be closed, not leaked."""
+        import shutil
+        from src.services import system_service
+        from src.services.system_service import SystemService
+
+        for name in ('AC0', 'ucsi-source-psy-1'):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / 'type').write_text('USB\n')
+            (tmp_path / name / 'online').write_text('0\n')
+        monkeypatch.setattr(system_service, '_POWER_SUPPLY_PATH', str(tmp_path))
+
+        with patch('subprocess.run', side_effect=FileNotFoundError):
+            SystemService._detect_power_state_linux()
+            shutil.rmtree(tmp_path / 'ucsi-source-psy-1')
+            SystemService._detect_power_state_linux()
+
+        held_dirs = {os.path.dirname(path) for path in system_service._sysfs_fds}
+        assert held_dirs == {str(tmp_path / 'AC0')}
+
+    def test_read_sysfs_reopens_stale_fd(self, tmp_path, monkeypatch):
+        """A held fd that fails should be reopened and read, not reported empty."""
+        from src.services import system_service
+
+        attr = tmp_path / 'online'
+        attr.write_text('1\n')
+        assert system_service._read_sysfs(str(attr)) == b'1'
+
+        real_pread = os.pread
+        failures = [OSError(19, "No such device")]  # ENODEV from the stale fd
+
+        def pread(fd, n, offset):
+            if failures:
+                raise failures.pop()
+            return real_pread(fd, n, offset)
+
+        monkeypatch.setattr(system_service.os, 'pread', pread)
+        with patch('os.open', wraps=os.open) as mock_open:
+            assert system_service._read_sysfs(str(attr)) == b'1'
+        assert mock_open.call_count == 1
+
+    def test_linux_power_missing_sysfs(self, tmp_path, monkeypatch):
+        """A missing power_supply directory should default to battery."""
+        from src.services import system_service
+        from src.services.system_service import SystemService
+
+        monkeypatch.setattr(system_service, '_POWER_SUPPLY_PATH', str(tmp_path / 'missing'))
+        with patch('subprocess.run', side_effect=FileNotFoundError):
+            _, on_battery = SystemService._detect_power_state_linux()
+
+        assert on_battery is True
 
 
 class TestLegacyCodeFixes:
@@ -945,6 +1375,24 @@ class TestLegacyCodeFixes:
                 # Test that we handle missing psutil gracefully
                 pass  # Implementation returns None on ImportError
 
+    def test_get_system_ram_memoized_until_cleared(self):
+        """RAM size is detected once and re-detected after clear_caches()."""
+        from src.services.system_service import SystemService
+
+        psutil = MagicMock()
+        psutil.virtual_memory.return_value.total = 32 * 1024**3
+
+        SystemService.clear_caches()
+        with patch.dict('sys.modules', {'psutil': psutil}):
+            assert SystemService.get_system_ram_gb() == 32.0
+            assert SystemService.get_system_ram_gb() == 32.0
+            assert psutil.virtual_memory.call_count == 1
+
+            SystemService.clear_caches()
+            assert SystemService.get_system_ram_gb() == 32.0
+            assert psutil.virtual_memory.call_count == 2
+        SystemService.clear_caches()
+
     def test_get_disk_free_returns_none_on_invalid_path(self):
         """get_disk_free_gb should return None, not 0, on invalid path."""
         from src.services.system_service import SystemService
@@ -956,12 +1404,46 @@ class TestLegacyCodeFixes:
         """detect_form_factor should use -NoProfile flag."""
         from src.services.system_service import SystemService
 
-        with patch('platform.system', return_value='Windows'):
+        SystemService.detect_form_factor.cache_clear()
+        with patch('platform.system', return_value='Windows'), \
+                patch.dict('sys.modules', {'pythoncom': None, 'win32com': None, 'win32com.client': None}):
             with patch('src.utils.subprocess_utils.run_powershell') as mock_ps:
                 mock_ps.return_value = "3"  # Desktop chassis
                 result = SystemService.detect_form_factor()
                 # Verify run_powershell was called (which uses -NoProfile internally)
                 assert mock_ps.called or result == "desktop"
+        SystemService.detect_form_factor.cache_clear()
+
+    def test_detect_form_factor_prefers_wmi(self):
+        """With pywin32 present, chassis type is read in-process, not via PowerShell."""
+        from src.services.system_service import SystemService
+
+        enclosure = MagicMock(ChassisTypes=(10,))
+        win32com_client = MagicMock()
+        win32com_client.GetObject.return_value.InstancesOf.return_value = [enclosure]
+        win32com = MagicMock(client=win32com_client)
+
+        SystemService.detect_form_factor.cache_clear()
+        with patch('platform.system', return_value='Windows'), \
+                patch.dict('sys.modules', {
+                    'pythoncom': MagicMock(),
+                    'win32com': win32com,
+                    'win32com.client': win32com_client,
+                }):
+            with patch('src.utils.subprocess_utils.run_powershell') as mock_ps:
+                assert SystemService.detect_form_factor() == "laptop"
+                assert SystemService.detect_form_factor() == "laptop"
+
+        mock_ps.assert_not_called()
+        assert win32com_client.GetObject.call_count == 1
+        SystemService.detect_form_factor.cache_clear()
+
+    def test_chassis_types_parsed_as_numbers(self):
+        """PowerShell output '19' should not match laptop chassis type 9."""
+        from src.services.system_service import SystemService
+
+        with patch('src.utils.subprocess_utils.run_powershell', return_value="19\r\n3"):
+            assert SystemService._read_chassis_types_powershell() == frozenset({19, 3})
 
 
 if __name__ == "__main__":
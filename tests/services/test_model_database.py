@@ -4,6 +4,9 @@ Unit tests for ModelDatabase service.
 Tests cover loading, parsing, and querying the models_database.yaml file.
 """
 
+import subprocess
+import sys
+
 import pytest
 from pathlib import Path
 from unittest.mock import patch, mock_open
@@ -19,6 +22,7 @@ from src.services.model_database import (
     normalize_platform,
     get_model_database,
     reload_model_database,
+    _get_yaml_loader,
 )
 
 
@@ -131,6 +135,9 @@ cloud_apis:
       estimated_cost_per_generation: 0.10
 """
 
+# Parsed once; fixtures build databases from it without file I/O
+SAMPLE_DATA = yaml.safe_load(SAMPLE_YAML)
+
 
 # =============================================================================
 # Test Fixtures
@@ -145,11 +152,9 @@ def sample_yaml_path(tmp_path):
 
 
 @pytest.fixture
-def model_db(sample_yaml_path):
+def model_db():
     """Create a ModelDatabase loaded with sample data."""
-    db = ModelDatabase(sample_yaml_path)
-    db.load()
-    return db
+    return ModelDatabase.from_dict(SAMPLE_DATA)
 
 
 # =============================================================================
@@ -168,6 +173,44 @@ class TestModelDatabaseLoading:
         assert db.is_loaded is True
         assert len(db) == 3  # test_model, test_video_model, test_cloud
 
+    def test_load_releases_parsed_yaml(self, sample_yaml_path):
+        """The raw YAML tree should not be retained once models are built."""
+        db = ModelDatabase(sample_yaml_path)
+        db.load()
+
+        assert db._raw_data == {}
+        assert db.get_model("test_model") is not None
+
+    def test_from_dict_matches_load(self, sample_yaml_path):
+        """from_dict should build the same models as loading the file."""
+        loaded = ModelDatabase(sample_yaml_path)
+        loaded.load()
+
+        db = ModelDatabase.from_dict(SAMPLE_DATA)
+
+        assert db.is_loaded is True
+        assert [m.id for m in db.iter_models()] == [m.id for m in loaded.iter_models()]
+        assert db.get_model("test_model") == loaded.get_model("test_model")
+
+    @pytest.mark.skipif(not yaml.__with_libyaml__, reason="PyYAML built without libyaml")
+    def test_uses_c_loader_when_available(self):
+        """load() should parse with libyaml's safe loader when present."""
+        assert _get_yaml_loader() is yaml.CSafeLoader
+
+    def test_import_does_not_load_yaml(self):
+        """Importing the module should not pull in PyYAML."""
+        code = (
+            "import sys, src.services.model_database; "
+            "print('yaml' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, timeout=60,
+            cwd=Path(__file__).resolve().parents[2],
+        )
+
+        assert result.stdout.strip() == "False", result.stderr
+
     def test_load_file_not_found(self, tmp_path):
         """Should return False when file not found."""
         db = ModelDatabase(tmp_path / "nonexistent.yaml")
@@ -321,6 +364,15 @@ class TestModelDatabaseQueries:
         t2v_models = model_db.get_models_by_capability("text_to_video")
         assert len(t2v_models) == 2  # test_video_model and test_cloud
 
+    def test_indexed_queries_return_copies(self, model_db):
+        """Callers mutating a result should not affect later queries."""
+        model_db.get_models_by_category("image_generation").clear()
+        model_db.get_models_by_capability("text_to_video").clear()
+
+        assert len(model_db.get_models_by_category("image_generation")) == 1
+        assert len(model_db.get_models_by_capability("text_to_video")) == 2
+        assert model_db.get_models_by_family("unknown") == []
+
     def test_get_local_models(self, model_db):
         """Should return only local models (with variants)."""
         local = model_db.get_local_models()
@@ -427,6 +479,16 @@ class TestCompatibilityFiltering:
 
         assert len(results) == 0
 
+    def test_get_compatible_models_skips_models_below_min_vram(self, model_db):
+        """Models whose smallest variant cannot fit should not be inspected."""
+        with patch.object(
+            model_db, "get_compatible_variants", wraps=model_db.get_compatible_variants
+        ) as spy:
+            results = model_db.get_compatible_models(platform="windows_nvidia", vram_mb=1)
+
+        assert results == []
+        spy.assert_not_called()
+
     def test_get_compatible_models_commercial_only(self, model_db):
         """Should filter by commercial license."""
         results = model_db.get_compatible_models(
@@ -460,6 +522,19 @@ class TestHelperMethods:
         nodes = model_db.get_required_nodes(model, gguf)
         assert "ComfyUI-GGUF" in nodes
 
+    def test_get_required_nodes_precomputed(self, model_db):
+        """Loaded models should be served from the load-time table as fresh lists."""
+        model = model_db.get_model("test_model")
+        gguf = model.variants[2]
+        expected = model_db._collect_required_nodes(model, gguf)
+
+        with patch.object(ModelDatabase, "_collect_required_nodes") as collect:
+            nodes = model_db.get_required_nodes(model, gguf)
+            nodes.append("mutated")
+            assert model_db.get_required_nodes(model, gguf) == list(expected)
+
+        collect.assert_not_called()
+
     def test_get_paired_models(self, model_db):
         """Should return paired model IDs."""
         model = model_db.get_model("test_model")
@@ -498,6 +573,34 @@ class TestPlatformNormalization:
         assert normalize_platform("unknown", "Windows") == "windows_nvidia"
         assert normalize_platform("none", "Windows") == "windows_nvidia"
 
+    def test_normalize_windows_amd(self):
+        """Windows + AMD should use ROCm support."""
+        assert normalize_platform("AMD", "Windows") == "linux_rocm"
+
+    def test_normalize_platform_type_enum(self):
+        """PlatformType values should map onto the YAML platform keys."""
+        from src.schemas.hardware import PlatformType
+
+        expected = {
+            PlatformType.APPLE_SILICON: "mac_mps",
+            PlatformType.LINUX_ROCM: "linux_rocm",
+            PlatformType.WINDOWS_NVIDIA: "windows_nvidia",
+            PlatformType.LINUX_NVIDIA: "windows_nvidia",
+            PlatformType.WSL2_NVIDIA: "windows_nvidia",
+            PlatformType.CPU_ONLY: "windows_nvidia",
+            PlatformType.UNKNOWN: "unknown",
+        }
+        for platform_type, key in expected.items():
+            assert normalize_platform("nvidia", platform_type) == key
+
+    def test_normalize_platform_cached(self):
+        """Repeated lookups should be served from the cache."""
+        normalize_platform.cache_clear()
+        normalize_platform("nvidia", "Windows")
+        normalize_platform("nvidia", "Windows")
+
+        assert normalize_platform.cache_info().hits == 1
+
 
 # =============================================================================
 # Test: Singleton
@@ -629,24 +732,16 @@ image_generation:
           mac_mps: {supported: false}
           linux_rocm: {supported: true}
 """
+HARDWARE_TEST_DATA = yaml.safe_load(HARDWARE_TEST_YAML)
 
 
 class TestHardwareInfoParsing:
     """Tests for hardware info parsing and computed defaults."""
 
     @pytest.fixture
-    def hw_yaml_path(self, tmp_path):
-        """Create temp YAML with hardware test data."""
-        yaml_file = tmp_path / "hardware_test.yaml"
-        yaml_file.write_text(HARDWARE_TEST_YAML)
-        return yaml_file
-
-    @pytest.fixture
-    def hw_db(self, hw_yaml_path):
+    def hw_db(self):
         """Load hardware test database."""
-        db = ModelDatabase(hw_yaml_path)
-        db.load()
-        return db
+        return ModelDatabase.from_dict(HARDWARE_TEST_DATA)
 
     def test_explicit_hardware_values(self, hw_db):
         """Should use explicit hardware values from YAML."""
@@ -802,24 +897,16 @@ image_generation:
         platform_support:
           windows_nvidia: {supported: true}
 """
+SHA256_TEST_DATA = yaml.safe_load(SHA256_TEST_YAML)
 
 
 class TestSHA256Checksums:
     """Tests for SHA256 checksum parsing."""
 
     @pytest.fixture
-    def sha256_yaml_path(self, tmp_path):
-        """Create temp YAML with checksum test data."""
-        yaml_file = tmp_path / "sha256_test.yaml"
-        yaml_file.write_text(SHA256_TEST_YAML)
-        return yaml_file
-
-    @pytest.fixture
-    def sha256_db(self, sha256_yaml_path):
+    def sha256_db(self):
         """Load checksum test database."""
-        db = ModelDatabase(sha256_yaml_path)
-        db.load()
-        return db
+        return ModelDatabase.from_dict(SHA256_TEST_DATA)
 
     def test_parses_sha256_when_present(self, sha256_db):
         """Should parse sha256 checksum when provided."""
@@ -865,6 +952,28 @@ class TestSHA256Checksums:
         )
         assert variant.sha256 is None
 
+    def test_repeated_strings_interned(self, model_db):
+        """Precision, family and category strings should be interned on parse."""
+        model = model_db.get_model("test_model")
+
+        assert model.family is sys.intern(model.family)
+        assert model.category is sys.intern(model.category)
+        for variant in model.variants:
+            assert variant.precision is sys.intern(variant.precision)
+            assert all(key is sys.intern(key) for key in variant.platform_support)
+
+    def test_parsed_entries_are_slotted_and_variants_frozen(self, model_db):
+        """Parsed records carry no per-instance __dict__; variants are read-only."""
+        import dataclasses
+
+        model = model_db.get_model("test_model")
+        variant = model.variants[0]
+
+        assert not hasattr(model, "__dict__")
+        assert not hasattr(variant, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            variant.precision = "fp8"
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
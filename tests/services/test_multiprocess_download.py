@@ -59,3 +59,24 @@ def test_process_pool_termination(temp_file):
     # Repeated calls should not hang or exhaust resources
     for _ in range(5):
         assert DownloadService.verify_hash(str(file_path), expected_hash) is True
+
+def test_worker_large_file_mmap(temp_file, monkeypatch):
+    """Files above the mmap threshold should hash identically via mmap."""
+    import mmap
+    from src.services import download_service
+
+    file_path, expected_hash = temp_file
+    monkeypatch.setattr(download_service, "MMAP_HASH_THRESHOLD", 1024)
+
+    mapped = []
+    real_mmap = mmap.mmap
+
+    def spy_mmap(*args, **kwargs):
+        m = real_mmap(*args, **kwargs)
+        mapped.append(m)
+        return m
+
+    monkeypatch.setattr(download_service.mmap, "mmap", spy_mmap)
+
+    assert _verify_hash_worker(str(file_path), expected_hash) is True
+    assert len(mapped) == 1
@@ -76,17 +76,18 @@ def test_status_update_integration(persist_service, monkeypatch):
     
     persist_service.queue_persistent_task(url, dest)
     
-    # Mock download_file to just return True and create a dummy file
-    def mock_download(url, dest_path, **kwargs):
+    # Mock fetch_file to create a dummy file and report its size
+    def mock_fetch(url, dest_path, **kwargs):
         Path(dest_path).write_bytes(b"dummy data")
-        return True
+        return len(b"dummy data")
         
-    monkeypatch.setattr(DownloadService, "download_file", staticmethod(mock_download))
+    monkeypatch.setattr(DownloadService, "fetch_file", staticmethod(mock_fetch))
     
     task = DownloadTask(url=url, dest_path=dest)
     result = persist_service._download_task(task, None)
     
     assert result.success is True
+    assert result.bytes_downloaded == len(b"dummy data")
     
     # Check status in DB
     from src.services.download_service import db_manager
@@ -106,8 +107,8 @@ def test_failure_persistence(persist_service, monkeypatch):
     
     persist_service.queue_persistent_task(url, dest)
     
-    # Mock download_file to fail
-    monkeypatch.setattr(DownloadService, "download_file", staticmethod(lambda *args, **kwargs: False))
+    # Mock fetch_file to fail
+    monkeypatch.setattr(DownloadService, "fetch_file", staticmethod(lambda *args, **kwargs: None))
     
     task = DownloadTask(url=url, dest_path=dest)
     persist_service._download_task(task, None)
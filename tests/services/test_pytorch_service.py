@@ -8,7 +8,6 @@ Per CUDA_PYTORCH_INSTALLATION.md spec:
 """
 
 import json
-import tempfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 from typing import Generator
@@ -24,6 +23,21 @@ from src.services.pytorch_service import (
 )
 
 
+@pytest.fixture(scope="module")
+def fake_venv(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Venv skeleton with pip and python in both Windows and POSIX layouts.
+
+    Built once per module; tests only read it.
+    """
+    venv_path = tmp_path_factory.mktemp("venv")
+    for scripts, names in (("Scripts", ("pip.exe", "python.exe")), ("bin", ("pip", "python"))):
+        (venv_path / scripts).mkdir()
+        for name in names:
+            (venv_path / scripts / name).touch()
+    return venv_path
+
+
 class TestPyTorchConfig:
     """Tests for PyTorchConfig dataclass."""
 
@@ -34,7 +48,7 @@ class TestPyTorchConfig:
             pytorch_version="2.9.0",
             index_url="https://download.pytorch.org/whl/cu130",
             is_stable=True,
-            notes=["Blackwell GPU"]
+            notes=("Blackwell GPU",)
         )
         assert config.cuda_version == "cu130"
         assert config.pytorch_version == "2.9.0"
@@ -49,7 +63,15 @@ class TestPyTorchConfig:
             index_url="https://download.pytorch.org/whl/cpu"
         )
         assert config.is_stable is True
-        assert config.notes == []
+        assert config.notes == ()
+
+    def test_pytorch_config_is_frozen(self) -> None:
+        """PyTorchConfig should be immutable so cached instances can be shared."""
+        import dataclasses
+
+        config = PyTorchService.get_pytorch_config(8.9)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.cuda_version = "cpu"
 
 
 class TestVerificationResult:
@@ -92,55 +114,33 @@ class TestVerificationResult:
 class TestGetPyTorchConfig:
     """Tests for get_pytorch_config() version selection logic."""
 
-    def test_blackwell_uses_cuda130(self) -> None:
-        """Blackwell GPUs (CC 12.0+) should use CUDA 13.0."""
-        config = PyTorchService.get_pytorch_config(12.0)
-
-        assert config.cuda_version == "cu130"
-        assert "13.0" in config.index_url or "cu130" in config.index_url
-        assert any("Blackwell" in note for note in config.notes)
-
-    def test_ada_lovelace_uses_cuda130(self) -> None:
-        """Ada Lovelace GPUs (CC 8.9) should use CUDA 13.0."""
-        config = PyTorchService.get_pytorch_config(8.9)
-
-        assert config.cuda_version == "cu130"
-        assert any("Ada" in note for note in config.notes)
-
-    def test_ampere_uses_cuda130(self) -> None:
-        """Ampere GPUs (CC 8.0-8.6) should use CUDA 13.0."""
-        for cc in [8.0, 8.6]:
-            config = PyTorchService.get_pytorch_config(cc)
-            assert config.cuda_version == "cu130"
-            assert any("Ampere" in note for note in config.notes)
-
-    def test_turing_uses_cuda130(self) -> None:
-        """Turing GPUs (CC 7.5) should use CUDA 13.0 (minimum supported)."""
-        config = PyTorchService.get_pytorch_config(7.5)
-
-        assert config.cuda_version == "cu130"
-        assert any("Turing" in note for note in config.notes)
-
-    def test_volta_uses_cuda121(self) -> None:
-        """Volta GPUs (CC 7.0) should use CUDA 12.1 (13.0 dropped support)."""
-        config = PyTorchService.get_pytorch_config(7.0)
-
-        assert config.cuda_version == "cu121"
-        assert any("Volta" in note or "12.1" in note for note in config.notes)
-
-    def test_pascal_uses_cuda118(self) -> None:
-        """Pascal GPUs (CC 6.x) should use CUDA 11.8."""
-        for cc in [6.0, 6.1, 6.2]:
-            config = PyTorchService.get_pytorch_config(cc)
-            assert config.cuda_version == "cu118"
-
-    def test_none_uses_cpu(self) -> None:
-        """None compute capability should result in CPU-only installation."""
-        config = PyTorchService.get_pytorch_config(None)
-
-        assert config.cuda_version == "cpu"
-        assert "cpu" in config.index_url
-        assert any("CPU" in note for note in config.notes)
+    def test_config_cached_per_compute_capability(self) -> None:
+        """Repeated lookups should return the same cached instance."""
+        assert PyTorchService.get_pytorch_config(8.9) is PyTorchService.get_pytorch_config(8.9)
+        assert PyTorchService.get_pytorch_config(None) is PyTorchService.get_pytorch_config(None)
+
+    @pytest.mark.parametrize("cc,expected_cuda,note_keywords", [
+        (12.0, "cu130", ("Blackwell",)),  # Blackwell (CC 12.0+)
+        (8.9, "cu130", ("Ada",)),         # Ada Lovelace
+        (8.0, "cu130", ("Ampere",)),      # Ampere (CC 8.0-8.6)
+        (8.6, "cu130", ("Ampere",)),
+        (7.5, "cu130", ("Turing",)),      # Turing: minimum for CUDA 13.0
+        (7.0, "cu121", ("Volta", "12.1")),  # Volta: CUDA 13.0 dropped support
+        (6.0, "cu118", None),             # Pascal (CC 6.x)
+        (6.1, "cu118", None),
+        (6.2, "cu118", None),
+        (None, "cpu", ("CPU",)),          # No GPU: CPU-only installation
+    ])
+    def test_cuda_version_by_architecture(self, cc, expected_cuda, note_keywords) -> None:
+        """Compute capability should select the matching CUDA build and notes."""
+        config = PyTorchService.get_pytorch_config(cc)
+
+        assert config.cuda_version == expected_cuda
+        assert expected_cuda in config.index_url
+        if note_keywords:
+            assert any(
+                keyword in note for note in config.notes for keyword in note_keywords
+            )
 
 
 class TestGetExecutables:
@@ -182,465 +182,394 @@ class TestGetExecutables:
 class TestInstallPyTorch:
     """Tests for install_pytorch() function."""
 
-    def test_install_builds_correct_command(self) -> None:
+    def test_install_builds_correct_command(self, fake_venv: Path) -> None:
         """install_pytorch should build correct pip command."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            venv_path = Path(temp_dir)
-
-            # Create mock pip
-            scripts = venv_path / "Scripts"
-            scripts.mkdir()
-            pip_path = scripts / "pip.exe"
-            pip_path.touch()
-
-            config = PyTorchConfig(
-                cuda_version="cu130",
-                pytorch_version="2.9.0",
-                index_url="https://download.pytorch.org/whl/cu130"
-            )
+        venv_path = fake_venv
 
-            with patch('subprocess.run') as mock_run:
-                mock_run.return_value = MagicMock(returncode=0)
+        config = PyTorchConfig(
+            cuda_version="cu130",
+            pytorch_version="2.9.0",
+            index_url="https://download.pytorch.org/whl/cu130"
+        )
 
-                with patch('sys.platform', 'win32'):
-                    result = PyTorchService.install_pytorch(venv_path, config)
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
 
-                assert result is True
+            with patch('sys.platform', 'win32'):
+                result = PyTorchService.install_pytorch(venv_path, config)
 
-                # Verify command structure
-                call_args = mock_run.call_args
-                cmd = call_args[0][0]
-                assert "pip" in cmd[0].lower()
-                assert "install" in cmd
-                assert "torch==2.9.0" in cmd
-                assert "torchvision" in cmd
-                assert "--index-url" in cmd
-                assert "cu130" in str(cmd)
+            assert result is True
 
-    def test_install_nightly_adds_pre_flag(self) -> None:
+            # Verify command structure
+            call_args = mock_run.call_args
+            cmd = call_args[0][0]
+            assert "pip" in cmd[0].lower()
+            assert "install" in cmd
+            assert "torch==2.9.0" in cmd
+            assert "torchvision" in cmd
+            assert "--index-url" in cmd
+            assert "cu130" in str(cmd)
+
+    def test_install_nightly_adds_pre_flag(self, fake_venv: Path) -> None:
         """Nightly builds should include --pre flag."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            venv_path = Path(temp_dir)
-            scripts = venv_path / "Scripts"
-            scripts.mkdir()
-            (scripts / "pip.exe").touch()
-
-            config = PyTorchConfig(
-                cuda_version="cu130",
-                pytorch_version="2.10.0.dev",
-                index_url="https://download.pytorch.org/whl/nightly/cu130",
-                is_stable=False
-            )
+        venv_path = fake_venv
+
+        config = PyTorchConfig(
+            cuda_version="cu130",
+            pytorch_version="2.10.0.dev",
+            index_url="https://download.pytorch.org/whl/nightly/cu130",
+            is_stable=False
+        )
 
-            with patch('subprocess.run') as mock_run:
-                mock_run.return_value = MagicMock(returncode=0)
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
 
-                with patch('sys.platform', 'win32'):
-                    PyTorchService.install_pytorch(venv_path, config)
+            with patch('sys.platform', 'win32'):
+                PyTorchService.install_pytorch(venv_path, config)
 
-                cmd = mock_run.call_args[0][0]
-                assert "--pre" in cmd
+            cmd = mock_run.call_args[0][0]
+            assert "--pre" in cmd
 
-    def test_install_without_vision(self) -> None:
+    def test_install_without_vision(self, fake_venv: Path) -> None:
         """Should exclude torchvision if not requested."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            venv_path = Path(temp_dir)
-            scripts = venv_path / "Scripts"
-            scripts.mkdir()
-            (scripts / "pip.exe").touch()
-
-            config = PyTorchConfig(
-                cuda_version="cpu",
-                pytorch_version="2.5.1",
-                index_url="https://download.pytorch.org/whl/cpu"
-            )
+        venv_path = fake_venv
 
-            with patch('subprocess.run') as mock_run:
-                mock_run.return_value = MagicMock(returncode=0)
+        config = PyTorchConfig(
+            cuda_version="cpu",
+            pytorch_version="2.5.1",
+            index_url="https://download.pytorch.org/whl/cpu"
+        )
 
-                with patch('sys.platform', 'win32'):
-                    PyTorchService.install_pytorch(
-                        venv_path, config, include_vision=False
-                    )
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
+
+            with patch('sys.platform', 'win32'):
+                PyTorchService.install_pytorch(
+                    venv_path, config, include_vision=False
+                )
 
-                cmd = mock_run.call_args[0][0]
-                assert "torchvision" not in cmd
+            cmd = mock_run.call_args[0][0]
+            assert "torchvision" not in cmd
 
-    def test_install_failure_returns_false(self) -> None:
+    def test_install_failure_returns_false(self, fake_venv: Path) -> None:
         """Failed installation should return False."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            venv_path = Path(temp_dir)
-            scripts = venv_path / "Scripts"
-            scripts.mkdir()
-            (scripts / "pip.exe").touch()
-
-            config = PyTorchConfig(
-                cuda_version="cu130",
-                pytorch_version="2.9.0",
-                index_url="https://download.pytorch.org/whl/cu130"
-            )
+        venv_path = fake_venv
 
-            with patch('subprocess.run') as mock_run:
-                mock_run.return_value = MagicMock(returncode=1, stderr="Error")
+        config = PyTorchConfig(
+            cuda_version="cu130",
+            pytorch_version="2.9.0",
+            index_url="https://download.pytorch.org/whl/cu130"
+        )
+
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = MagicMock(returncode=1, stderr="Error")
 
-                with patch('sys.platform', 'win32'):
-                    result = PyTorchService.install_pytorch(venv_path, config)
+            with patch('sys.platform', 'win32'):
+                result = PyTorchService.install_pytorch(venv_path, config)
 
-                assert result is False
+            assert result is False
 
-    def test_install_pip_not_found_raises(self) -> None:
+    def test_install_pip_not_found_raises(self, tmp_path: Path) -> None:
         """Missing pip should raise PyTorchInstallError."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            venv_path = Path(temp_dir)
-            # Don't create pip
-
-            config = PyTorchConfig(
-                cuda_version="cpu",
-                pytorch_version="2.5.1",
-                index_url="https://download.pytorch.org/whl/cpu"
-            )
+        venv_path = tmp_path
+        # Don't create pip
 
-            with patch('sys.platform', 'win32'):
-                with pytest.raises(PyTorchInstallError):
-                    PyTorchService.install_pytorch(venv_path, config)
+        config = PyTorchConfig(
+            cuda_version="cpu",
+            pytorch_version="2.5.1",
+            index_url="https://download.pytorch.org/whl/cpu"
+        )
+
+        with patch('sys.platform', 'win32'):
+            with pytest.raises(PyTorchInstallError):
+                PyTorchService.install_pytorch(venv_path, config)
 
 
 class TestVerifyPyTorchCuda:
     """Tests for verify_pytorch_cuda() function."""
 
-    def test_verify_success_with_cuda(self) -> None:
+    def test_verify_success_with_cuda(self, fake_venv: Path) -> None:
         """Verification should return success with CUDA info."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            venv_path = Path(temp_dir)
-            scripts = venv_path / "Scripts"
-            scripts.mkdir()
-            (scripts / "python.exe").touch()
-
-            mock_output = json.dumps({
-                "success": True,
-                "cuda_available": True,
-                "pytorch_version": "2.9.0+cu130",
-                "cuda_version": "13.0",
-                "gpu_name": "NVIDIA GeForce RTX 4090",
-                "compute_capability": "8.9"
-            })
-
-            with patch('subprocess.run') as mock_run:
-                mock_run.return_value = MagicMock(
-                    returncode=0,
-                    stdout=mock_output,
-                    stderr=""
-                )
+        venv_path = fake_venv
+
+        mock_output = json.dumps({
+            "success": True,
+            "cuda_available": True,
+            "pytorch_version": "2.9.0+cu130",
+            "cuda_version": "13.0",
+            "gpu_name": "NVIDIA GeForce RTX 4090",
+            "compute_capability": "8.9"
+        })
+
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = MagicMock(
+                returncode=0,
+                stdout=mock_output,
+                stderr=""
+            )
 
-                with patch('sys.platform', 'win32'):
-                    result = PyTorchService.verify_pytorch_cuda(venv_path)
+            with patch('sys.platform', 'win32'):
+                result = PyTorchService.verify_pytorch_cuda(venv_path)
 
-            assert result.success is True
-            assert result.cuda_available is True
-            assert result.pytorch_version == "2.9.0+cu130"
-            assert result.gpu_name == "NVIDIA GeForce RTX 4090"
+        assert result.success is True
+        assert result.cuda_available is True
+        assert result.pytorch_version == "2.9.0+cu130"
+        assert result.gpu_name == "NVIDIA GeForce RTX 4090"
 
-    def test_verify_cpu_only(self) -> None:
+    def test_verify_cpu_only(self, fake_venv: Path) -> None:
         """CPU-only installation should still verify successfully."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            venv_path = Path(temp_dir)
-            scripts = venv_path / "Scripts"
-            scripts.mkdir()
-            (scripts / "python.exe").touch()
-
-            mock_output = json.dumps({
-                "success": True,
-                "cuda_available": False,
-                "pytorch_version": "2.5.1",
-                "cuda_version": None,
-                "gpu_name": None,
-                "compute_capability": None
-            })
-
-            with patch('subprocess.run') as mock_run:
-                mock_run.return_value = MagicMock(
-                    returncode=0,
-                    stdout=mock_output,
-                    stderr=""
-                )
+        venv_path = fake_venv
+
+        mock_output = json.dumps({
+            "success": True,
+            "cuda_available": False,
+            "pytorch_version": "2.5.1",
+            "cuda_version": None,
+            "gpu_name": None,
+            "compute_capability": None
+        })
+
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = MagicMock(
+                returncode=0,
+                stdout=mock_output,
+                stderr=""
+            )
 
-                with patch('sys.platform', 'win32'):
-                    result = PyTorchService.verify_pytorch_cuda(venv_path)
+            with patch('sys.platform', 'win32'):
+                result = PyTorchService.verify_pytorch_cuda(venv_path)
 
-            assert result.success is True
-            assert result.cuda_available is False
+        assert result.success is True
+        assert result.cuda_available is False
 
-    def test_verify_kernel_mismatch_error(self) -> None:
+    def test_verify_kernel_mismatch_error(self, fake_venv: Path) -> None:
         """Should detect CUDA kernel mismatch errors."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            venv_path = Path(temp_dir)
-            scripts = venv_path / "Scripts"
-            scripts.mkdir()
-            (scripts / "python.exe").touch()
-
-            with patch('subprocess.run') as mock_run:
-                mock_run.return_value = MagicMock(
-                    returncode=1,
-                    stdout="",
-                    stderr="RuntimeError: no kernel image is available"
-                )
+        venv_path = fake_venv
 
-                with patch('sys.platform', 'win32'):
-                    result = PyTorchService.verify_pytorch_cuda(venv_path)
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = MagicMock(
+                returncode=1,
+                stdout="",
+                stderr="RuntimeError: no kernel image is available"
+            )
 
-            assert result.success is False
-            assert "kernel" in result.error.lower()
+            with patch('sys.platform', 'win32'):
+                result = PyTorchService.verify_pytorch_cuda(venv_path)
 
-    def test_verify_driver_version_error(self) -> None:
+        assert result.success is False
+        assert "kernel" in result.error.lower()
+
+    def test_verify_driver_version_error(self, fake_venv: Path) -> None:
         """Should detect CUDA driver version errors."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            venv_path = Path(temp_dir)
-            scripts = venv_path / "Scripts"
-            scripts.mkdir()
-            (scripts / "python.exe").touch()
-
-            with patch('subprocess.run') as mock_run:
-                mock_run.return_value = MagicMock(
-                    returncode=1,
-                    stdout="",
-                    stderr="CUDA driver version is insufficient for CUDA runtime"
-                )
+        venv_path = fake_venv
 
-                with patch('sys.platform', 'win32'):
-                    result = PyTorchService.verify_pytorch_cuda(venv_path)
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = MagicMock(
+                returncode=1,
+                stdout="",
+                stderr="CUDA driver version is insufficient for CUDA runtime"
+            )
 
-            assert result.success is False
-            assert "driver" in result.error.lower()
+            with patch('sys.platform', 'win32'):
+                result = PyTorchService.verify_pytorch_cuda(venv_path)
+
+        assert result.success is False
+        assert "driver" in result.error.lower()
 
 
 class TestInstallWithFallback:
     """Tests for install_with_fallback() function."""
 
-    def test_optimal_install_succeeds(self) -> None:
+    @staticmethod
+    def _stub(monkeypatch: pytest.MonkeyPatch, install_ok: bool, verify=None) -> None:
+        """Replace install/verify with plain functions (cheaper than patch.object mocks)."""
+        monkeypatch.setattr(
+            PyTorchService, 'install_pytorch',
+            staticmethod(lambda venv_path, config, **kwargs: install_ok),
+        )
+        if verify is not None:
+            monkeypatch.setattr(PyTorchService, 'verify_pytorch_cuda', staticmethod(verify))
+
+    def test_optimal_install_succeeds(self, fake_venv: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         """Should succeed on first try with optimal config."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            venv_path = Path(temp_dir)
-            scripts = venv_path / "Scripts"
-            scripts.mkdir()
-            (scripts / "pip.exe").touch()
-            (scripts / "python.exe").touch()
-
-            with patch.object(PyTorchService, 'install_pytorch', return_value=True):
-                with patch.object(PyTorchService, 'verify_pytorch_cuda') as mock_verify:
-                    mock_verify.return_value = VerificationResult(
-                        success=True,
-                        cuda_available=True,
-                        pytorch_version="2.9.0+cu130"
-                    )
-
-                    result = PyTorchService.install_with_fallback(venv_path, 8.9)
-
-            assert result.success is True
-            assert result.fallback_used is False
-            assert result.config.cuda_version == "cu130"
-
-    def test_fallback_on_verification_failure(self) -> None:
+        self._stub(monkeypatch, True, lambda venv: VerificationResult(
+            success=True,
+            cuda_available=True,
+            pytorch_version="2.9.0+cu130"
+        ))
+
+        result = PyTorchService.install_with_fallback(fake_venv, 8.9)
+
+        assert result.success is True
+        assert result.fallback_used is False
+        assert result.config.cuda_version == "cu130"
+
+    def test_fallback_on_verification_failure(self, fake_venv: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         """Should try fallback if verification fails."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            venv_path = Path(temp_dir)
-            scripts = venv_path / "Scripts"
-            scripts.mkdir()
-            (scripts / "pip.exe").touch()
-            (scripts / "python.exe").touch()
+        call_count = [0]
 
-            call_count = [0]
+        def mock_verify(venv):
+            call_count[0] += 1
+            if call_count[0] < 3:  # Fail first 2 attempts
+                return VerificationResult(success=False, error="Failed")
+            return VerificationResult(success=True, cuda_available=True)
 
-            def mock_verify(venv):
-                call_count[0] += 1
-                if call_count[0] < 3:  # Fail first 2 attempts
-                    return VerificationResult(success=False, error="Failed")
-                return VerificationResult(success=True, cuda_available=True)
+        self._stub(monkeypatch, True, mock_verify)
 
-            with patch.object(PyTorchService, 'install_pytorch', return_value=True):
-                with patch.object(PyTorchService, 'verify_pytorch_cuda', side_effect=mock_verify):
-                    result = PyTorchService.install_with_fallback(venv_path, 8.0)
+        result = PyTorchService.install_with_fallback(fake_venv, 8.0)
 
-            assert result.success is True
-            assert result.fallback_used is True
+        assert result.success is True
+        assert result.fallback_used is True
 
-    def test_cpu_fallback_when_cuda_fails(self) -> None:
+    def test_cpu_fallback_when_cuda_fails(self, fake_venv: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         """Should fall back to CPU if all CUDA attempts fail."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            venv_path = Path(temp_dir)
-            scripts = venv_path / "Scripts"
-            scripts.mkdir()
-            (scripts / "pip.exe").touch()
-            (scripts / "python.exe").touch()
-
-            def mock_verify(venv):
-                # Only succeed for CPU
-                return VerificationResult(success=True, cuda_available=False)
+        # Only succeed for CPU
+        self._stub(monkeypatch, True, lambda venv: VerificationResult(
+            success=True, cuda_available=False
+        ))
 
-            with patch.object(PyTorchService, 'install_pytorch', return_value=True):
-                with patch.object(PyTorchService, 'verify_pytorch_cuda', side_effect=mock_verify):
-                    result = PyTorchService.install_with_fallback(venv_path, 8.0)
+        result = PyTorchService.install_with_fallback(fake_venv, 8.0)
 
-            assert result.success is True
-            assert result.config.cuda_version == "cpu"
+        assert result.success is True
+        assert result.config.cuda_version == "cpu"
 
-    def test_fail_when_requiring_cuda(self) -> None:
+    def test_fail_when_requiring_cuda(self, fake_venv: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         """Should fail if requiring CUDA but only CPU works."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            venv_path = Path(temp_dir)
-            scripts = venv_path / "Scripts"
-            scripts.mkdir()
-            (scripts / "pip.exe").touch()
-            (scripts / "python.exe").touch()
-
-            with patch.object(PyTorchService, 'install_pytorch', return_value=False):
-                result = PyTorchService.install_with_fallback(
-                    venv_path, 8.0, require_cuda=True
-                )
+        self._stub(monkeypatch, False)
 
-            assert result.success is False
+        result = PyTorchService.install_with_fallback(
+            fake_venv, 8.0, require_cuda=True
+        )
+
+        assert result.success is False
 
 
 class TestInstallOnnxRuntime:
     """Tests for install_onnxruntime() function."""
 
-    def test_install_gpu_version(self) -> None:
+    def test_install_gpu_version(self, fake_venv: Path) -> None:
         """Should install onnxruntime-gpu when has_cuda=True."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            venv_path = Path(temp_dir)
-            scripts = venv_path / "Scripts"
-            scripts.mkdir()
-            (scripts / "pip.exe").touch()
+        venv_path = fake_venv
 
-            with patch('subprocess.run') as mock_run:
-                mock_run.return_value = MagicMock(returncode=0)
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
 
-                with patch('sys.platform', 'win32'):
-                    result = PyTorchService.install_onnxruntime(venv_path, has_cuda=True)
+            with patch('sys.platform', 'win32'):
+                result = PyTorchService.install_onnxruntime(venv_path, has_cuda=True)
 
-                cmd = mock_run.call_args[0][0]
-                assert "onnxruntime-gpu" in cmd
+            cmd = mock_run.call_args[0][0]
+            assert "onnxruntime-gpu" in cmd
 
-            assert result is True
+        assert result is True
 
-    def test_install_cpu_version(self) -> None:
+    def test_install_cpu_version(self, fake_venv: Path) -> None:
         """Should install onnxruntime when has_cuda=False."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            venv_path = Path(temp_dir)
-            scripts = venv_path / "Scripts"
-            scripts.mkdir()
-            (scripts / "pip.exe").touch()
+        venv_path = fake_venv
 
-            with patch('subprocess.run') as mock_run:
-                mock_run.return_value = MagicMock(returncode=0)
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
 
-                with patch('sys.platform', 'win32'):
-                    result = PyTorchService.install_onnxruntime(venv_path, has_cuda=False)
+            with patch('sys.platform', 'win32'):
+                result = PyTorchService.install_onnxruntime(venv_path, has_cuda=False)
 
-                cmd = mock_run.call_args[0][0]
-                assert "onnxruntime" in cmd
-                assert "onnxruntime-gpu" not in cmd
+            cmd = mock_run.call_args[0][0]
+            assert "onnxruntime" in cmd
+            assert "onnxruntime-gpu" not in cmd
 
-            assert result is True
+        assert result is True
 
 
 class TestUninstallPyTorch:
     """Tests for uninstall_pytorch() function."""
 
-    def test_uninstall_all_packages(self) -> None:
+    def test_uninstall_all_packages(self, fake_venv: Path) -> None:
         """Should uninstall torch, torchvision, and torchaudio."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            venv_path = Path(temp_dir)
-            scripts = venv_path / "Scripts"
-            scripts.mkdir()
-            (scripts / "pip.exe").touch()
+        venv_path = fake_venv
 
-            with patch('subprocess.run') as mock_run:
-                mock_run.return_value = MagicMock(returncode=0)
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
 
-                with patch('sys.platform', 'win32'):
-                    result = PyTorchService.uninstall_pytorch(venv_path)
+            with patch('sys.platform', 'win32'):
+                result = PyTorchService.uninstall_pytorch(venv_path)
 
-                cmd = mock_run.call_args[0][0]
-                assert "uninstall" in cmd
-                assert "-y" in cmd
-                assert "torch" in cmd
-                assert "torchvision" in cmd
-                assert "torchaudio" in cmd
+            cmd = mock_run.call_args[0][0]
+            assert "uninstall" in cmd
+            assert "-y" in cmd
+            assert "torch" in cmd
+            assert "torchvision" in cmd
+            assert "torchaudio" in cmd
 
-            assert result is True
+        assert result is True
+
+    def test_posix_spawn_friendly_on_unix(self, fake_venv: Path) -> None:
+        """pip should be launched with close_fds=False off Windows (posix_spawn path)."""
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
+
+            with patch('sys.platform', 'linux'):
+                PyTorchService.uninstall_pytorch(fake_venv)
+            assert mock_run.call_args.kwargs["close_fds"] is False
+
+            with patch('sys.platform', 'win32'):
+                PyTorchService.uninstall_pytorch(fake_venv)
+            assert mock_run.call_args.kwargs["close_fds"] is True
 
 
 class TestGetInstalledPyTorchInfo:
     """Tests for get_installed_pytorch_info() function."""
 
-    def test_get_info_when_installed(self) -> None:
+    def test_get_info_when_installed(self, fake_venv: Path) -> None:
         """Should return info when PyTorch is installed."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            venv_path = Path(temp_dir)
-            scripts = venv_path / "Scripts"
-            scripts.mkdir()
-            (scripts / "python.exe").touch()
-
-            mock_output = json.dumps({
-                "installed": True,
-                "version": "2.9.0+cu130",
-                "cuda_available": True,
-                "cuda_version": "13.0"
-            })
-
-            with patch('subprocess.run') as mock_run:
-                mock_run.return_value = MagicMock(
-                    returncode=0,
-                    stdout=mock_output
-                )
+        venv_path = fake_venv
+
+        mock_output = json.dumps({
+            "installed": True,
+            "version": "2.9.0+cu130",
+            "cuda_available": True,
+            "cuda_version": "13.0"
+        })
+
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = MagicMock(
+                returncode=0,
+                stdout=mock_output
+            )
 
-                with patch('sys.platform', 'win32'):
-                    info = PyTorchService.get_installed_pytorch_info(venv_path)
+            with patch('sys.platform', 'win32'):
+                info = PyTorchService.get_installed_pytorch_info(venv_path)
 
-            assert info is not None
-            assert info["installed"] is True
-            assert info["version"] == "2.9.0+cu130"
+        assert info is not None
+        assert info["installed"] is True
+        assert info["version"] == "2.9.0+cu130"
 
-    def test_get_info_when_not_installed(self) -> None:
+    def test_get_info_when_not_installed(self, fake_venv: Path) -> None:
         """Should return not installed when PyTorch is missing."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            venv_path = Path(temp_dir)
-            scripts = venv_path / "Scripts"
-            scripts.mkdir()
-            (scripts / "python.exe").touch()
-
-            mock_output = json.dumps({"installed": False})
-
-            with patch('subprocess.run') as mock_run:
-                mock_run.return_value = MagicMock(
-                    returncode=0,
-                    stdout=mock_output
-                )
+        venv_path = fake_venv
+
+        mock_output = json.dumps({"installed": False})
 
-                with patch('sys.platform', 'win32'):
-                    info = PyTorchService.get_installed_pytorch_info(venv_path)
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = MagicMock(
+                returncode=0,
+                stdout=mock_output
+            )
 
-            assert info is not None
-            assert info["installed"] is False
+            with patch('sys.platform', 'win32'):
+                info = PyTorchService.get_installed_pytorch_info(venv_path)
+
+        assert info is not None
+        assert info["installed"] is False
 
 
 class TestArchitectureNotes:
     """Tests that architecture-specific notes are correct."""
 
-    def test_blackwell_notes_mention_fp4_fp6(self) -> None:
-        """Blackwell config should mention FP4/FP6 Tensor Cores."""
-        config = PyTorchService.get_pytorch_config(12.0)
-        notes_str = " ".join(config.notes)
-        assert "FP4" in notes_str or "FP6" in notes_str
-
-    def test_ada_notes_mention_fp8(self) -> None:
-        """Ada Lovelace config should mention FP8."""
-        config = PyTorchService.get_pytorch_config(8.9)
-        notes_str = " ".join(config.notes)
-        assert "FP8" in notes_str
-
-    def test_ampere_notes_mention_bf16(self) -> None:
-        """Ampere config should mention BF16."""
-        config = PyTorchService.get_pytorch_config(8.0)
-        notes_str = " ".join(config.notes)
-        assert "BF16" in notes_str
+    @pytest.mark.parametrize("cc,feature_keywords", [
+        (12.0, ("FP4", "FP6")),  # Blackwell FP4/FP6 Tensor Cores
+        (8.9, ("FP8",)),         # Ada Lovelace
+        (8.0, ("BF16",)),        # Ampere
+    ])
+    def test_notes_mention_precision_features(self, cc, feature_keywords) -> None:
+        """Architecture notes should mention the precisions the GPU accelerates."""
+        notes_str = " ".join(PyTorchService.get_pytorch_config(cc).notes)
+        assert any(keyword in notes_str for keyword in feature_keywords)